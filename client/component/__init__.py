@@ -1,26 +1,37 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
 import errno
 import logging
 import time
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.components.websocket_api import websocket_command, async_response, async_register_command
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
 from typing import Set, Dict, TypedDict, List, Any, Optional
 
-from .const import DOMAIN, MIN_RANGE, MAX_RANGE, WEBSOCKET_SERVERS
+from .audio_stream import AUDIO_CODECS
+from .connection_manager import ConnectionManager, DispatchResult
+from .const import DOMAIN, MIN_RANGE, MAX_RANGE, WEBSOCKET_SERVERS, WEBSOCKET_GROUPS, USERS_PREFS_STORAGE_KEY, USERS_PREFS_STORAGE_VERSION, USERS_PREFS_SAVE_DELAY
+from .error_aggregator import ErrorAggregator
 from .errors import ErrorSource, ErrorCode
 from .event_types import EventType
 from .exceptions import HaZeroHidException
-from .resources_manager import ResourcesVersions, synchronize_resources, synchronize_resources_heuristically
+from .log_ingest import LogIngest
+from .resources_manager import ResourcesVersions, get_resources_static_key, refresh_resources_manifest, synchronize_resources, synchronize_resources_heuristically
+from .static_assets import ResourcesStaticView
+from .validators import FastSchema, create_fast_move_validator, create_fast_lists_validator
 from .websocket_handler import WebSocketClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +41,10 @@ class WSServerInfo(TypedDict):
     authorized_users: Set[str]
     services: Set[str]
 
+class WSGroupInfo(TypedDict):
+    name: str
+    servers: List[str]
+
 class UserPrefs(TypedDict):
     user_id: str
     servers: List[Any]
@@ -40,6 +55,13 @@ class UserPrefs(TypedDict):
 WS_SUBSCRIPTIONS: dict[ActiveConnection, int] = {}
 WS_SUBSCRIPTIONS_LOCK = asyncio.Lock()
 
+# Copy-on-write snapshots of WS_SUBSCRIPTIONS, rebuilt under WS_SUBSCRIPTIONS_LOCK and read without lock:
+# - every subscription (events not bound to a server)
+# - subscriptions of users authorized on each server, by server ID (server events)
+WSSubscriptions = tuple[tuple[ActiveConnection, int], ...]
+WS_SUBSCRIPTIONS_ALL: WSSubscriptions = ()
+WS_SUBSCRIPTIONS_BY_SERVER: dict[str, WSSubscriptions] = {}
+
 # Use empty_config_schema because the component does not have any config options
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
@@ -76,26 +98,75 @@ def ensure_list_or_empty(val):
         return val
     return [val]
 
+def ensure_base64_bytes(val):
+    try:
+        return base64.b64decode(val, validate=True)
+    except (binascii.Error, ValueError) as ex:
+        raise vol.Invalid(f"Invalid base64 data: {ex}") from ex
+
+# Server-side auto-repeat of pressed keys (ms, 0: server defaults)
+REPEAT_SCHEMA = vol.Schema({
+    vol.Optional("delay", default=0): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+    vol.Optional("interval", default=0): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+})
+
 KEYPRESS_SERVICE_SCHEMA = vol.Schema({
     vol.Required("si"): cv.string,
     vol.Optional("sendModifiers", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
     vol.Optional("sendKeys", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+    vol.Optional("repeat"): REPEAT_SCHEMA,
 })
 
 CONPRESS_SERVICE_SCHEMA = vol.Schema({
     vol.Required("si"): cv.string,
     vol.Optional("sendCons", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+    vol.Optional("repeat"): REPEAT_SCHEMA,
+})
+
+# High-frequency services: precompiled fast validators for well-typed input, voluptuous schemas otherwise
+# (repeated presses are sent once per hold: validated by full schemas)
+MOVE_SERVICE_FAST_SCHEMA = FastSchema(create_fast_move_validator(MIN_RANGE, MAX_RANGE), MOVE_SERVICE_SCHEMA)
+KEYPRESS_SERVICE_FAST_SCHEMA = FastSchema(create_fast_lists_validator("sendModifiers", "sendKeys"), KEYPRESS_SERVICE_SCHEMA)
+CONPRESS_SERVICE_FAST_SCHEMA = FastSchema(create_fast_lists_validator("sendCons"), CONPRESS_SERVICE_SCHEMA)
+
+# Air-mouse samples: flat list of [alpha, beta, gamma, interval] (rotation rates in deg/s, interval in ms)
+AIRMOUSE_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("si"): cv.string,
+    vol.Required("samples"): vol.All(ensure_list_or_empty, [vol.Coerce(float)]),
+    vol.Optional("speed", default=5): vol.All(vol.Coerce(float), vol.Clamp(min=1, max=10)),
+    vol.Optional("dead_zone", default=0.5): vol.All(vol.Coerce(float), vol.Clamp(min=0, max=25.5)),
 })
 
 AUDIO_SERVICE_SCHEMA = vol.Schema({
     vol.Required("si"): cv.string,
     vol.Optional("buf", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+    vol.Optional("b64"): vol.All(cv.string, ensure_base64_bytes),  # compact alternative to "buf" (encoded audio bytes)
+})
+
+AUDIO_START_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("si"): cv.string,
+    vol.Optional("codec", default="pcm"): vol.In(AUDIO_CODECS),
 })
 
 AUDIO_COMMAND_SERVICE_SCHEMA = vol.Schema({
     vol.Required("si"): cv.string,
 })
 
+GROUP_KEYPRESS_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("gi"): cv.string,
+    vol.Optional("sendModifiers", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+    vol.Optional("sendKeys", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+})
+
+GROUP_CONPRESS_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("gi"): cv.string,
+    vol.Optional("sendCons", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+})
+
+RELEASE_ALL_SERVICE_SCHEMA = vol.Schema({
+    vol.Optional("servers"): vol.All(ensure_list_or_empty, [cv.string]),
+})
+
 LOG_SERVICE_SCHEMA = vol.Schema({
     vol.Required("level"): vol.All(lambda v: v or "", ensure_string_or_empty),
     vol.Required("origin"): vol.All(lambda v: v or "", ensure_string_or_empty),
@@ -104,6 +175,12 @@ LOG_SERVICE_SCHEMA = vol.Schema({
     vol.Required("logs"): vol.All(lambda v: v or [], ensure_list_or_empty),
 })
 
+LOG_RECORD_SCHEMA = vol.Schema({
+    vol.Required("level"): vol.All(lambda v: v or "", ensure_string_or_empty),
+    vol.Optional("highlight", default=""): vol.All(lambda v: v or "", ensure_string_or_empty),
+    vol.Required("logs"): vol.All(lambda v: v or [], ensure_list_or_empty),
+})
+
 SET_PREFS_SCHEMA = vol.Schema({
     vol.Required("user_id"): vol.All(lambda v: v or "", ensure_string_or_empty),
     vol.Required("servers"): vol.All(lambda v: v or [], ensure_list_or_empty),
@@ -121,6 +198,35 @@ def get_user_prefs(hass: HomeAssistant, user_id: str) -> UserPrefs:
         "airmouse_mode": "",
     })
 
+def get_stored_users_prefs(hass: HomeAssistant) -> dict[str, Any]:
+    # Authorized servers are not persisted: always computed from current config
+    return {
+        user_id: {key: value for key, value in user_prefs.items() if key != "servers"}
+        for user_id, user_prefs in hass.data[DOMAIN]["users_prefs"].items()
+    }
+
+def schedule_save_users_prefs(hass: HomeAssistant) -> None:
+    # Debounced: many set_prefs calls within delay are coalesced into a single write
+    store: Store = hass.data[DOMAIN]["users_prefs_store"]
+    store.async_delay_save(lambda: get_stored_users_prefs(hass), USERS_PREFS_SAVE_DELAY)
+
+async def load_users_prefs(hass: HomeAssistant, store: Store) -> dict[str, UserPrefs]:
+    stored_users_prefs = await store.async_load() or {}
+    users_prefs = {}
+    for user_id, stored_user_prefs in stored_users_prefs.items():
+        users_prefs[user_id] = {
+            "user_id": user_id,
+            "servers": [],
+            "server_id": stored_user_prefs.get("server_id", ""),
+            "remote_mode": stored_user_prefs.get("remote_mode", ""),
+            "airmouse_mode": stored_user_prefs.get("airmouse_mode", ""),
+        }
+    _LOGGER.debug("Loaded %s users preferences", len(users_prefs))
+    return users_prefs
+
+def get_connection_manager(hass: HomeAssistant) -> ConnectionManager:
+    return hass.data[DOMAIN]["connection_manager"]
+
 def get_ws_server_infos(hass: HomeAssistant) -> dict[str, WSServerInfo]:
     return hass.data[DOMAIN]["ws_servers"]
 
@@ -131,6 +237,9 @@ def get_ws_server_info(hass: HomeAssistant, call: ServiceCall) -> WSServerInfo:
     server_id = call.data.get("si")
     return get_ws_server_info_by_id(hass, server_id)
 
+def get_ws_group_info_by_id(hass: HomeAssistant, group_id: str) -> WSGroupInfo:
+    return hass.data[DOMAIN]["ws_groups"].get(group_id)
+
 def get_ws_client(info: WSServerInfo) -> WebSocketClient:
     return info.get("ws_client")
 
@@ -165,73 +274,97 @@ def get_user_id_from_command(connection: ActiveConnection) -> Optional[str]:
         return None
     return user.id
 
-def is_user_authorized_from_service(info: WSServerInfo, call: ServiceCall) -> bool:
-    user_id = get_user_id_from_service(call)
+def get_user_authorized_server_set(hass: HomeAssistant, user_id: str) -> frozenset[str]:
+    """Get (and cache) IDs of servers the user is authorized to use."""
+    authorizations: dict[str, frozenset[str]] = hass.data[DOMAIN]["authorizations"]
+    server_ids = authorizations.get(user_id)
+    if server_ids is None:
+        server_ids = frozenset(server_id for server_id, info in get_ws_server_infos(hass).items() if is_user_authorized(info, user_id))
+        authorizations[user_id] = server_ids
+    return server_ids
+
+def is_server_authorized(hass: HomeAssistant, server_id: str, user_id: str | None) -> bool:
+    # Fast path: single set lookup (called on every input)
+    if user_id and server_id in get_user_authorized_server_set(hass, user_id):
+        return True
+
+    # Slow path: rejected, explain why
     if not user_id:
         _LOGGER.debug("Unauthenticated: no context found")
-        return False
-    return is_user_authorized(info, user_id)
+    elif _LOGGER.getEffectiveLevel() == logging.DEBUG:
+        _LOGGER.debug(f"Unauthenticated: user ID ({user_id}) is not authorized on server {server_id}")
+    return False
 
-def is_user_authorized_from_command(info: WSServerInfo, connection: ActiveConnection) -> bool:
-    user_id = get_user_id_from_command(connection)
-    if not user_id:
-        _LOGGER.debug("Unauthenticated: no context found")
-        return False
-    return is_user_authorized(info, user_id)
+def is_user_authorized_from_service(hass: HomeAssistant, call: ServiceCall) -> bool:
+    return is_server_authorized(hass, call.data.get("si"), get_user_id_from_service(call))
 
-def get_user_authorized_servers(hass: HomeAssistant, user_id: str) -> List[Any]:
+def is_user_authorized_from_command(hass: HomeAssistant, server_id: str, connection: ActiveConnection) -> bool:
+    return is_server_authorized(hass, server_id, get_user_id_from_command(connection))
+
+def get_user_authorized_server_ids(hass: HomeAssistant, user_id: str) -> List[str]:
     if not user_id:
         return []
+    authorized_server_ids = get_user_authorized_server_set(hass, user_id)
+    return [server_id for server_id in get_ws_server_infos(hass) if server_id in authorized_server_ids]
 
+def get_user_authorized_servers(hass: HomeAssistant, user_id: str) -> List[Any]:
     # Retrieve authorized servers for user (only those will be advertised)
-    servers = []
-    for server_id, info in get_ws_server_infos(hass).items():
-        if is_user_authorized(info, user_id):
-            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug(f"Server {server_id} authorized for user ({user_id})")
-            servers.append({
-                "id": server_id,
-                "name": info.get("name"),
-            })
-        else:
-            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug(f"Server {server_id} is not authorized for user ({user_id})")
-    return servers
+    ws_server_infos = get_ws_server_infos(hass)
+    return [{
+        "id": server_id,
+        "name": ws_server_infos[server_id].get("name"),
+    } for server_id in get_user_authorized_server_ids(hass, user_id)]
+
+async def invalidate_authorizations(hass: HomeAssistant, user_id: str | None = None) -> None:
+    """Drop cached authorizations (of every user or a single one), then refresh what depends on them."""
+    authorizations: dict[str, frozenset[str]] = hass.data[DOMAIN]["authorizations"]
+    users_prefs: dict[str, UserPrefs] = hass.data[DOMAIN]["users_prefs"]
+    if user_id is None:
+        authorizations.clear()
+        for user_prefs in users_prefs.values():
+            user_prefs["servers"] = get_user_authorized_servers(hass, user_prefs["user_id"])
+    else:
+        authorizations.pop(user_id, None)
+        if user_id in users_prefs:
+            users_prefs[user_id]["servers"] = get_user_authorized_servers(hass, user_id)
 
-async def send_ws_event(hass: HomeAssistant, type: int, code: int, extra: int | None, server_id: str | None) -> None:
+    async with WS_SUBSCRIPTIONS_LOCK:
+        rebuild_ws_subscriptions_index(hass)
+    _LOGGER.debug("Authorizations invalidated (user_id=%s)", user_id)
+
+def rebuild_ws_subscriptions_index(hass: HomeAssistant) -> None:
+    """Rebuild subscriptions snapshots (call with WS_SUBSCRIPTIONS_LOCK held, on subscriptions or authorizations changes)."""
+    global WS_SUBSCRIPTIONS_ALL, WS_SUBSCRIPTIONS_BY_SERVER
+    subscriptions: WSSubscriptions = tuple(WS_SUBSCRIPTIONS.items())
+    subscriptions_by_server: dict[str, WSSubscriptions] = {}
+    for server_id in get_ws_server_infos(hass):
+        subscriptions_by_server[server_id] = tuple(
+            (connection, request_id) for connection, request_id in subscriptions if is_user_authorized_from_command(hass, server_id, connection)
+        )
+
+    # Swap references: concurrent readers keep iterating over previous snapshots
+    WS_SUBSCRIPTIONS_ALL = subscriptions
+    WS_SUBSCRIPTIONS_BY_SERVER = subscriptions_by_server
+    _LOGGER.debug("Subscriptions index rebuilt (subscriptions=%s)", len(subscriptions))
+
+async def send_ws_event(hass: HomeAssistant, type: int, code: int, extra: int | None, server_id: str | None, count: int = 1) -> None:
     payload = {
         "evt_type": type,
         "evt_code": code,
         "evt_extra": extra,
         "evt_si": server_id,
+        "evt_count": count,
     }
     _LOGGER.debug("send_ws_event(hass: HomeAssistant, type: int = %s, code: int = %s, extra: int | None = %s, server_id: str | None = %s)", type, code, extra, server_id)
 
-    subscriptions = {}
-    async with WS_SUBSCRIPTIONS_LOCK:
-        for connection, request_id in WS_SUBSCRIPTIONS.items():
-            _LOGGER.debug("Cloning (connection=%s, request_id=%s)", connection, request_id)
-            subscriptions[connection] = request_id
-
-    for connection, request_id in subscriptions.items():
-        _LOGGER.debug("Checking authorization... (connection=%s, request_id=%s)", connection, request_id)
-        authorized = False
-
-        # Message is not from a specific server: 
-        # subscribed user always authorized to receive this braodcast message
-        if server_id is None:
-            authorized = True
-        else:
-            # Message is from a specific server: 
-            # autorize subscribed user only when server permits him
-            info: WSServerInfo = get_ws_server_info_by_id(hass, server_id)
-            authorized = is_user_authorized_from_command(info, connection)
-
-        # Reject unauthorized user
-        _LOGGER.debug("Authorized=%s (connection=%s, request_id=%s)", authorized, connection, request_id)
-        if not authorized:
-            continue
+    # Message is not from a specific server: every subscribed user receives this broadcast message
+    # Message is from a specific server: only subscribed users authorized on this server receive it
+    if server_id is None:
+        subscriptions = WS_SUBSCRIPTIONS_ALL
+    else:
+        subscriptions = WS_SUBSCRIPTIONS_BY_SERVER.get(server_id, ())
 
+    for connection, request_id in subscriptions:
         # Dispatch message for authorized user
         try:
             message = websocket_api.event_message(request_id, payload)
@@ -241,7 +374,8 @@ async def send_ws_event(hass: HomeAssistant, type: int, code: int, extra: int |
 
 
 async def send_ws_error_from_code(hass: HomeAssistant, code: int, extra: int | None, server_id: str | None) -> None:
-    await send_ws_event(hass, EventType.ERROR, code, extra, server_id)
+    # Deduplicated per (server, code): see ErrorAggregator
+    await hass.data[DOMAIN]["error_aggregator"].report(server_id, code, extra)
 
 async def send_ws_error_from_exception(hass: HomeAssistant, hzhEx: HaZeroHidException) -> None:
     await send_ws_error_from_code(hass, hzhEx.code, hzhEx.err, hzhEx.server_id)
@@ -291,8 +425,6 @@ async def handle_exception(hass: HomeAssistant, info: WSServerInfo, hint: str, e
 async def websocket_subscribe_events(hass: HomeAssistant, connection: ActiveConnection, msg):
     request_id = msg["id"]
     async with WS_SUBSCRIPTIONS_LOCK:
-        WS_SUBSCRIPTIONS[connection] = request_id
-
         # remove previous HA subscription if it exists
         old_request_id = WS_SUBSCRIPTIONS.get(connection)
         if old_request_id and old_request_id in connection.subscriptions:
@@ -302,12 +434,14 @@ async def websocket_subscribe_events(hass: HomeAssistant, connection: ActiveConn
 
         # register new request_id
         WS_SUBSCRIPTIONS[connection] = request_id
+        rebuild_ws_subscriptions_index(hass)
 
         def unsubscribe():
             async def async_unsubscribe():
                 async with WS_SUBSCRIPTIONS_LOCK:
                     if WS_SUBSCRIPTIONS.get(connection) == request_id:
                         WS_SUBSCRIPTIONS.pop(connection, None)
+                        rebuild_ws_subscriptions_index(hass)
             hass.async_create_task(async_unsubscribe())
 
         connection.subscriptions[request_id] = unsubscribe
@@ -325,7 +459,7 @@ async def websocket_get_prefs(hass: HomeAssistant, connection: ActiveConnection,
 @async_response
 async def websocket_sync_keyboard(hass: HomeAssistant, connection: ActiveConnection, msg):
     info: WSServerInfo = get_ws_server_info_by_id(hass, msg["si"])
-    authorized = is_user_authorized_from_command(info, connection)
+    authorized = is_user_authorized_from_command(hass, msg["si"], connection)
     if not authorized:
         return
 
@@ -356,6 +490,25 @@ async def websocket_sync_resources(hass: HomeAssistant, connection: ActiveConnec
         await handle_exception(hass, None, "Error in resources_version", ex)
         connection.send_error(msg["id"], "resources_version_failed", str(ex))
 
+@websocket_command({vol.Required("type"): DOMAIN + "/get_health"})
+@async_response
+async def websocket_get_health(hass: HomeAssistant, connection: ActiveConnection, msg):
+    # Only report health of servers the user is authorized to use
+    user_id = get_user_id_from_command(connection)
+    server_ids = get_user_authorized_server_ids(hass, user_id)
+    connection.send_result(msg["id"], {"health": get_connection_manager(hass).get_health(server_ids)})
+
+@websocket_command({
+    vol.Required("type"): DOMAIN + "/log_batch",
+    vol.Required("origin"): vol.All(lambda v: v or "", ensure_string_or_empty),
+    vol.Required("logger_id"): vol.All(lambda v: v or "", ensure_string_or_empty),
+    vol.Required("records"): [LOG_RECORD_SCHEMA],
+})
+@callback
+def websocket_log_batch(hass: HomeAssistant, connection: ActiveConnection, msg):
+    hass.data[DOMAIN]["log_ingest"].ingest(msg["origin"], msg["logger_id"], msg["records"])
+    connection.send_result(msg["id"])
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the websockets servers configs and clients."""
 
@@ -375,11 +528,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         else:
             _LOGGER.warn("Received unhandled message type %s from HID server", message_type)
 
+    async def error_aggregator_emit(type: int, code: int, extra: int | None, server_id: str | None, count: int) -> None:
+        await send_ws_event(hass, type, code, extra, server_id, count)
+
+    error_aggregator = ErrorAggregator(hass, error_aggregator_emit)
+    log_ingest = LogIngest(_LOGGER)
+    connection_manager = ConnectionManager(ws_client_on_receive, error_aggregator.notify_success)
     ws_servers = {}
     for server in WEBSOCKET_SERVERS:
         server_id = server["id"]
         server_url = f"{server['protocol']}://{server['host']}:{server['port']}"
-        ws_client = WebSocketClient(server_id, server_url, server["secret"], ws_client_on_receive)
+        ws_client = connection_manager.add_client(server_id, server_url, server["secret"])
         ws_servers[server_id] = {
             "name": server["name"],
             "ws_client": ws_client,
@@ -387,11 +546,52 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         }
         _LOGGER.debug("Discovered server %s", server_url)
 
+    ws_groups = {}
+    for group in WEBSOCKET_GROUPS:
+        group_server_ids = [server_id.strip() for server_id in group["servers"].split(",") if server_id.strip()]
+        unknown_server_ids = [server_id for server_id in group_server_ids if server_id not in ws_servers]
+        if unknown_server_ids:
+            _LOGGER.warning("Group %s references unknown servers %s: ignoring them", group["id"], unknown_server_ids)
+        ws_groups[group["id"]] = {
+            "name": group["name"],
+            "servers": [server_id for server_id in group_server_ids if server_id not in unknown_server_ids],
+        }
+        _LOGGER.debug("Discovered group %s", group["id"])
+
     hass.data[DOMAIN] = {
         "ws_servers": ws_servers,
+        "ws_groups": ws_groups,
         "users_prefs": {},
+        "users_prefs_store": Store(hass, USERS_PREFS_STORAGE_VERSION, USERS_PREFS_STORAGE_KEY),
+        "authorizations": {},
+        "connection_manager": connection_manager,
+        "error_aggregator": error_aggregator,
+        "log_ingest": log_ingest,
     }
 
+    # Load persisted users preferences once (then served from memory), with up-to-date authorized servers
+    hass.data[DOMAIN]["users_prefs"] = await load_users_prefs(hass, hass.data[DOMAIN]["users_prefs_store"])
+    for user_id, user_prefs in hass.data[DOMAIN]["users_prefs"].items():
+        user_prefs["servers"] = get_user_authorized_servers(hass, user_id)
+
+    # Supervise all servers connections (periodic parallel health checks), close them on shutdown
+    connection_manager.start()
+    log_ingest.start()
+
+    async def stop_connection_manager(event: Event) -> None:
+        await connection_manager.stop()
+        error_aggregator.clear()
+        await hass.async_add_executor_job(log_ingest.stop)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_connection_manager)
+
+    # Authorizations are cached by user: drop them when user changes
+    async def on_user_changed(event: Event) -> None:
+        await invalidate_authorizations(hass, event.data.get("user_id"))
+
+    hass.bus.async_listen(EVENT_USER_UPDATED, on_user_changed)
+    hass.bus.async_listen(EVENT_USER_REMOVED, on_user_changed)
+
     """Handle saving user prefs for the session."""
     @callback
     async def handle_set_prefs(call: ServiceCall) -> None:
@@ -401,7 +601,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             user_prefs["server_id"] = call.data.get("server_id")
             user_prefs["remote_mode"] = call.data.get("remote_mode")
             user_prefs["airmouse_mode"] = call.data.get("airmouse_mode")
-            
+            schedule_save_users_prefs(hass)
+
             if _LOGGER.getEffectiveLevel() == logging.DEBUG:
                 user_prefs_check = hass.data[DOMAIN]["users_prefs"][user_id]
                 _LOGGER.debug(f"Received preferences for user {user_id}: server_id={call.data.get('server_id')},remote_mode={call.data.get('remote_mode')},airmouse_mode={call.data.get('airmouse_mode')}")
@@ -413,7 +614,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_scroll(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -435,7 +636,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_move(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -453,11 +654,31 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         except Exception as ex:
             await handle_exception(hass, info, "Unhandled error in handle_move", ex, True)
 
+    """Handle air-mouse samples (fused into mouse moves by server)."""
+    @callback
+    async def handle_airmouse(call: ServiceCall) -> None:
+        info: WSServerInfo = get_ws_server_info(hass, call)
+        authorized = is_user_authorized_from_service(hass, call)
+        if not authorized:
+            return
+
+        samples = call.data.get("samples")
+        speed = call.data.get("speed")
+        dead_zone = call.data.get("dead_zone")
+        if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+            _LOGGER.debug(f"handle_airmouse.call.data: {len(samples) // 4} samples, speed={speed}, dead_zone={dead_zone}")
+
+        ws_client = get_ws_client(info)
+        try:
+            await ws_client.send_airmouse(speed, dead_zone, samples)
+        except Exception as ex:
+            await handle_exception(hass, info, "Unhandled error in handle_airmouse", ex)
+
     """Handle pressing left mouse button."""
     @callback
     async def handle_clickleft(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -472,7 +693,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_clickmiddle(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -487,7 +708,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_clickright(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -502,7 +723,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_clickrelease(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -517,7 +738,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_chartap(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
@@ -537,19 +758,24 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_keypress(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
         modifiers = call.data.get("sendModifiers")
         keys = call.data.get("sendKeys")
+        repeat = call.data.get("repeat")
         if _LOGGER.getEffectiveLevel() == logging.DEBUG:
             _LOGGER.debug(f"handle_keypress.call.data.sendModifiers: {modifiers}")
             _LOGGER.debug(f"handle_keypress.call.data.sendKeys: {keys}")
+            _LOGGER.debug(f"handle_keypress.call.data.repeat: {repeat}")
 
         ws_client = get_ws_client(info)
         try:
-            await ws_client.send_keypress(modifiers, keys)
+            if repeat is not None:
+                await ws_client.send_keypress_repeat(modifiers, keys, repeat["delay"], repeat["interval"])
+            else:
+                await ws_client.send_keypress(modifiers, keys)
             if _LOGGER.getEffectiveLevel() == logging.DEBUG:
                 _LOGGER.debug(f"ws_client.send_keypress(modifiers, keys): {modifiers},{keys}")
         except Exception as ex:
@@ -560,17 +786,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_conpress(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
         cons = call.data.get("sendCons")
+        repeat = call.data.get("repeat")
         if _LOGGER.getEffectiveLevel() == logging.DEBUG:
             _LOGGER.debug(f"handle_conpress.call.data.sendCons: {cons}")
+            _LOGGER.debug(f"handle_conpress.call.data.repeat: {repeat}")
 
         ws_client = get_ws_client(info)
         try:
-            await ws_client.send_conpress(cons)
+            if repeat is not None:
+                await ws_client.send_conpress_repeat(cons, repeat["delay"], repeat["interval"])
+            else:
+                await ws_client.send_conpress(cons)
             if _LOGGER.getEffectiveLevel() == logging.DEBUG:
                 _LOGGER.debug(f"ws_client.send_conpress(cons): {cons}")
         except Exception as ex:
@@ -581,15 +812,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_audio_start(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
+        codec = call.data.get("codec")
         ws_client = get_ws_client(info)
+
+        async def on_audio_stream_error(ex: Exception) -> None:
+            await handle_exception(hass, info, "Unhandled error in audio stream", ex)
+
         try:
-            await ws_client.send_audiostart()
+            await ws_client.start_audio_stream(codec, on_audio_stream_error)
             if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug("ws_client.send_audiostart()")
+                _LOGGER.debug(f"ws_client.start_audio_stream(codec): {codec}")
         except Exception as ex:
             await handle_exception(hass, info, "Unhandled error in handle_audio_start", ex, True)
 
@@ -597,81 +833,143 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     @callback
     async def handle_audio(call: ServiceCall) -> None:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
             return
 
-        buf = call.data.get("buf")
+        buf = call.data.get("b64")
+        if buf is None:
+            buf = call.data.get("buf")
         if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-            _LOGGER.debug(f"handle_audio.call.data.buf: {buf}")
+            _LOGGER.debug(f"handle_audio.call.data.buf: {len(buf)} bytes")
 
         ws_client = get_ws_client(info)
         try:
-            await ws_client.send_audio(buf)
+            ws_client.push_audio(buf)
             if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug(f"ws_client.handle_audio(buf): {buf}")
+                _LOGGER.debug(f"ws_client.push_audio(buf): {len(buf)} bytes")
         except Exception as ex:
             await handle_exception(hass, info, "Unhandled error in handle_audio", ex)
 
     """Handle stop streaming audio."""
     @callback
-    async def handle_audio_stop(call: ServiceCall) -> None:
+    async def handle_audio_stop(call: ServiceCall) -> ServiceResponse:
         info: WSServerInfo = get_ws_server_info(hass, call)
-        authorized = is_user_authorized_from_service(info, call)
+        authorized = is_user_authorized_from_service(hass, call)
         if not authorized:
-            return
+            return None
 
         ws_client = get_ws_client(info)
         try:
-            await ws_client.send_audiostop()
+            # Audio stream metrics (chosen chunk size, dropped frames...) as service response
+            metrics = await ws_client.stop_audio_stream()
             if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug("ws_client.send_audiostop()")
+                _LOGGER.debug(f"ws_client.stop_audio_stream(): {metrics}")
+            return {"metrics": metrics}
         except Exception as ex:
             await handle_exception(hass, info, "Unhandled error in handle_audio_stop", ex, True)
+        return None
+
+    async def dispatch_to_group(call: ServiceCall, hint: str, action) -> ServiceResponse:
+        group_id = call.data.get("gi")
+        group_info: WSGroupInfo = get_ws_group_info_by_id(hass, group_id)
+        if not group_info:
+            _LOGGER.warning(f"Unknown group {group_id}")
+            return {"results": {}}
+
+        user_id = get_user_id_from_service(call)
+        if not user_id:
+            _LOGGER.debug("Unauthenticated: no context found")
+            return {"results": {}}
+
+        # Only dispatch to group servers the user is authorized to use
+        authorized_server_ids = get_user_authorized_server_set(hass, user_id)
+        server_ids = [server_id for server_id in group_info["servers"] if server_id in authorized_server_ids]
+        async def notify_failure(result: DispatchResult) -> None:
+            if result["ok"]:
+                return
+            info: WSServerInfo = get_ws_server_info_by_id(hass, result["si"])
+            hzhEx = HaZeroHidException(ErrorSource.HID_NETWORK, message = f"{hint}: {result['error']}", server_id = result["si"])
+            await handle_exception(hass, info, hint, hzhEx, True)
+
+        # Late servers (still sending when budget elapsed) are notified once their send completes
+        results = await connection_manager.dispatch(action, server_ids, on_late=notify_failure)
+        for result in results.values():
+            if not result["late"]:
+                await notify_failure(result)
+        return {"results": results}
+
+    """Handle pressing/releasing keyboard keys on every servers of a group."""
+    @callback
+    async def handle_group_keypress(call: ServiceCall) -> ServiceResponse:
+        modifiers = call.data.get("sendModifiers")
+        keys = call.data.get("sendKeys")
+        if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+            _LOGGER.debug(f"handle_group_keypress.call.data: gi={call.data.get('gi')},sendModifiers={modifiers},sendKeys={keys}")
+
+        async def keypress(ws_client: WebSocketClient) -> None:
+            await ws_client.send_keypress(modifiers, keys)
+        return await dispatch_to_group(call, "Unhandled error in handle_group_keypress", keypress)
+
+    """Handle pressing/releasing consumer keyboard keys on every servers of a group."""
+    @callback
+    async def handle_group_conpress(call: ServiceCall) -> ServiceResponse:
+        cons = call.data.get("sendCons")
+        if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+            _LOGGER.debug(f"handle_group_conpress.call.data: gi={call.data.get('gi')},sendCons={cons}")
+
+        async def conpress(ws_client: WebSocketClient) -> None:
+            await ws_client.send_conpress(cons)
+        return await dispatch_to_group(call, "Unhandled error in handle_group_conpress", conpress)
+
+    """Handle releasing all keys and buttons on every authorized servers."""
+    @callback
+    async def handle_release_all(call: ServiceCall) -> None:
+        user_id = get_user_id_from_service(call)
+        if not user_id:
+            _LOGGER.debug("Unauthenticated: no context found")
+            return
+
+        # Restrict to authorized servers (and to requested ones, when specified)
+        server_ids = get_user_authorized_server_ids(hass, user_id)
+        requested_server_ids = call.data.get("servers")
+        if requested_server_ids:
+            server_ids = [server_id for server_id in server_ids if server_id in requested_server_ids]
+
+        results = await connection_manager.release_all(server_ids)
+        for server_id, result in results.items():
+            if isinstance(result, Exception):
+                info: WSServerInfo = get_ws_server_info_by_id(hass, server_id)
+                await handle_exception(hass, info, "Unhandled error in handle_release_all", result, True)
 
     """Handle logging to home assistant backend."""
     @callback
     async def handle_log(call: ServiceCall) -> None:
-        level = call.data.get("level")
-        origin = call.data.get("origin")
-        logger_id = call.data.get("logger_id")
-        highlight = call.data.get("highlight")
-        logs = call.data.get("logs")
-        fmt = "[CLIENT][%s][%s][%s]%s" + (" %s" * len(logs))
-        if level == "TRA":
-            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug(fmt, level, origin, logger_id, highlight, *logs)
-        elif level == "DBG":
-            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
-                _LOGGER.debug(fmt, level, origin, logger_id, highlight, *logs)
-        elif level == "INF":
-            if _LOGGER.getEffectiveLevel() == logging.INFO:
-                _LOGGER.info(fmt, level, origin, logger_id, highlight, *logs)
-        elif level == "WRN":
-            if _LOGGER.getEffectiveLevel() == logging.WARNING:
-                _LOGGER.warning(fmt, level, origin, logger_id, highlight, *logs)
-        elif level == "ERR":
-            if _LOGGER.getEffectiveLevel() == logging.ERROR:
-                _LOGGER.error(fmt, level, origin, logger_id, highlight, *logs)
-        else:
-            _LOGGER.warning("Unknown log level '%s'. Logging as CRITICAL.", level)
-            if _LOGGER.getEffectiveLevel() == logging.CRITICAL:
-                _LOGGER.critical(fmt, level, origin, logger_id, highlight, *logs)
+        # Single record: same pipeline as log_batch command (written off event loop)
+        log_ingest.ingest(call.data.get("origin"), call.data.get("logger_id"), [{
+            "level": call.data.get("level"),
+            "highlight": call.data.get("highlight"),
+            "logs": call.data.get("logs"),
+        }])
 
     # Register our services with Home Assistant.
     hass.services.async_register(DOMAIN, "set_prefs", handle_set_prefs, schema=SET_PREFS_SCHEMA)
-    hass.services.async_register(DOMAIN, "scroll", handle_scroll, schema=MOVE_SERVICE_SCHEMA)
-    hass.services.async_register(DOMAIN, "move", handle_move, schema=MOVE_SERVICE_SCHEMA)
+    hass.services.async_register(DOMAIN, "scroll", handle_scroll, schema=MOVE_SERVICE_FAST_SCHEMA)
+    hass.services.async_register(DOMAIN, "move", handle_move, schema=MOVE_SERVICE_FAST_SCHEMA)
+    hass.services.async_register(DOMAIN, "airmouse", handle_airmouse, schema=AIRMOUSE_SERVICE_SCHEMA)
     hass.services.async_register(DOMAIN, "clickleft", handle_clickleft)
     hass.services.async_register(DOMAIN, "clickmiddle", handle_clickmiddle)
     hass.services.async_register(DOMAIN, "clickright", handle_clickright)
     hass.services.async_register(DOMAIN, "clickrelease", handle_clickrelease)
     hass.services.async_register(DOMAIN, "chartap", handle_chartap, schema=CHARTAP_SERVICE_SCHEMA)
-    hass.services.async_register(DOMAIN, "keypress", handle_keypress, schema=KEYPRESS_SERVICE_SCHEMA)
-    hass.services.async_register(DOMAIN, "conpress", handle_conpress, schema=CONPRESS_SERVICE_SCHEMA)
-    hass.services.async_register(DOMAIN, "auxstart", handle_audio_start, schema=AUDIO_COMMAND_SERVICE_SCHEMA)
+    hass.services.async_register(DOMAIN, "keypress", handle_keypress, schema=KEYPRESS_SERVICE_FAST_SCHEMA)
+    hass.services.async_register(DOMAIN, "conpress", handle_conpress, schema=CONPRESS_SERVICE_FAST_SCHEMA)
+    hass.services.async_register(DOMAIN, "auxstart", handle_audio_start, schema=AUDIO_START_SERVICE_SCHEMA)
     hass.services.async_register(DOMAIN, "aux", handle_audio, schema=AUDIO_SERVICE_SCHEMA)
-    hass.services.async_register(DOMAIN, "auxstop", handle_audio_stop, schema=AUDIO_COMMAND_SERVICE_SCHEMA)
+    hass.services.async_register(DOMAIN, "auxstop", handle_audio_stop, schema=AUDIO_COMMAND_SERVICE_SCHEMA, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "group_keypress", handle_group_keypress, schema=GROUP_KEYPRESS_SERVICE_SCHEMA, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "group_conpress", handle_group_conpress, schema=GROUP_CONPRESS_SERVICE_SCHEMA, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "release_all", handle_release_all, schema=RELEASE_ALL_SERVICE_SCHEMA)
     hass.services.async_register(DOMAIN, "log", handle_log, schema=LOG_SERVICE_SCHEMA)
 
     # Register WebSocket command
@@ -679,8 +977,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     async_register_command(hass, websocket_get_prefs)
     async_register_command(hass, websocket_sync_keyboard)
     async_register_command(hass, websocket_sync_resources)
+    async_register_command(hass, websocket_get_health)
+    async_register_command(hass, websocket_log_batch)
 
-    # Register frontend resources
+    # Register frontend resources (and compute their content manifest once), served under their content key
+    await refresh_resources_manifest(hass)
+    hass.http.register_view(ResourcesStaticView(hass, get_resources_static_key))
     await synchronize_resources(hass, use_version_file=True, force_sync=True)
 
     # Return boolean to indicate that initialization was successfully.
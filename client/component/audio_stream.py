@@ -0,0 +1,194 @@
+import asyncio
+import collections
+import logging
+import time
+
+from collections.abc import Awaitable, Callable
+from typing import TypedDict
+
+_LOGGER = logging.getLogger(__name__)
+
+# Audio stream codecs (see audio:start): audio buffers are decoded into 16 kHz mono 16-bit PCM by the server
+AUDIO_CODECS = {
+    "pcm": 0x00,   # 16-bit PCM as is
+    "ulaw": 0x01,  # G.711 mu-law: 8 bits per sample
+}
+
+# 16 kHz mono audio: samples per millisecond, and sample size (in bytes) by codec
+AUDIO_SAMPLES_PER_MS = 16
+AUDIO_SAMPLE_SIZES = {
+    "pcm": 2,
+    "ulaw": 1,
+}
+
+# Chunk duration range: shorter chunks waste per-message overhead, longer ones add latency.
+# Healthy link: minimum duration (lowest latency). Lagging link (audio waiting to reach the network): chunks grow by lag,
+# so that fewer, larger messages are sent while the link catches up.
+AUDIO_CHUNK_MIN_DURATION = 20   # ms
+AUDIO_CHUNK_MAX_DURATION = 200  # ms
+
+# Audio waiting (local queue + transport write buffer) beyond this duration is dropped (oldest frames first): link cannot keep up
+AUDIO_MAX_BACKLOG = 500  # ms
+
+# Weight of last measured link lag into smoothed one
+AUDIO_LINK_LAG_SMOOTHING = 0.3
+
+# Max wait for queued audio to be sent when stream stops
+AUDIO_STOP_TIMEOUT = 2.0  # seconds
+
+class AudioStreamMetrics(TypedDict):
+    codec: str
+    chunk_size: int         # bytes
+    chunk_duration: float   # ms
+    link_lag: float         # smoothed audio waiting for the network (local queue + transport write buffer), ms
+    backlog: float          # queued audio, ms
+    chunks_sent: int
+    frames_received: int
+    frames_sent: int
+    frames_dropped: int
+    bytes_sent: int
+
+class AudioStream:
+    """Aggregates received audio frames into chunks sized from measured link lag: small chunks on a healthy link, larger ones while it lags."""
+
+    def __init__(self, codec: str, send: Callable[[bytes], Awaitable[None]], on_error: Callable[[Exception], Awaitable[None]] | None = None,
+                 get_write_buffer_size: Callable[[], int] | None = None) -> None:
+        self.codec = codec
+        self.send = send
+        self.on_error = on_error
+        self.get_write_buffer_size = get_write_buffer_size  # bytes written but not yet sent on the network
+        self.sample_size = AUDIO_SAMPLE_SIZES.get(codec, AUDIO_SAMPLE_SIZES["pcm"])
+        self.bytes_per_ms = AUDIO_SAMPLES_PER_MS * self.sample_size
+
+        self._frames: collections.deque[tuple[float, bytes]] = collections.deque()  # (monotonic arrival time, frame)
+        self._queued = 0  # bytes
+        self._link_lag: float | None = None  # smoothed (ms)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+        self.chunk_duration = float(AUDIO_CHUNK_MIN_DURATION)
+        self.chunk_size = self.to_chunk_size(self.chunk_duration)
+        self.chunks_sent = 0
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.bytes_sent = 0
+
+    def to_chunk_size(self, duration: float) -> int:
+        # Whole samples only
+        return max(self.sample_size, int(duration * self.bytes_per_ms) // self.sample_size * self.sample_size)
+
+    def get_metrics(self) -> AudioStreamMetrics:
+        return {
+            "codec": self.codec,
+            "chunk_size": self.chunk_size,
+            "chunk_duration": round(self.chunk_duration, 1),
+            "link_lag": round(self._link_lag or 0.0, 1),
+            "backlog": round(self._queued / self.bytes_per_ms, 1),
+            "chunks_sent": self.chunks_sent,
+            "frames_received": self.frames_received,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "bytes_sent": self.bytes_sent,
+        }
+
+    def get_buffered(self) -> int:
+        # Transport write buffer (0 when unknown)
+        return self.get_write_buffer_size() if self.get_write_buffer_size else 0
+
+    def push(self, buffer: bytes | list[int]) -> None:
+        if not buffer or self._stopping:
+            return
+
+        frame = bytes(buffer)
+        self._frames.append((time.monotonic(), frame))
+        self._queued += len(frame)
+        self.frames_received += 1
+
+        # Link cannot keep up: drop oldest frames, so that latency never accumulates
+        max_backlog = AUDIO_MAX_BACKLOG * self.bytes_per_ms - self.get_buffered()
+        while self._queued > max_backlog and len(self._frames) > 1:
+            self._queued -= len(self._frames.popleft()[1])
+            self.frames_dropped += 1
+            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+                _LOGGER.debug(f"Audio frame dropped (backlog beyond {AUDIO_MAX_BACKLOG}ms, {self.frames_dropped} dropped)")
+
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def pop_chunk(self) -> tuple[bytes, int]:
+        # At least chunk size (when queued), more when lagging behind: aggregates backlog into fewer messages
+        max_size = max(self.chunk_size, self.to_chunk_size(AUDIO_CHUNK_MAX_DURATION))
+        frames: list[bytes] = []
+        size = 0
+        while self._frames and (not frames or size + len(self._frames[0][1]) <= max_size):
+            frames.append(self._frames.popleft()[1])
+            size += len(frames[-1])
+        self._queued -= size
+        return b"".join(frames), len(frames)
+
+    def on_sent(self, size: int, frames: int, buffered: int) -> None:
+        self.chunks_sent += 1
+        self.frames_sent += frames
+        self.bytes_sent += size
+
+        # Link lag: audio still waiting for the network when chunk was handed to transport (previous chunks
+        # not written yet by transport), plus audio queued locally meanwhile (ie. waiting for the connection)
+        link_lag = (buffered + self._queued) / self.bytes_per_ms
+        self._link_lag = link_lag if self._link_lag is None else (self._link_lag + AUDIO_LINK_LAG_SMOOTHING * (link_lag - self._link_lag))
+
+        # Healthy link: smallest chunks, lagging link: chunks grow by lag (fewer messages while catching up)
+        self.chunk_duration = float(max(AUDIO_CHUNK_MIN_DURATION, min(AUDIO_CHUNK_MAX_DURATION, AUDIO_CHUNK_MIN_DURATION + self._link_lag)))
+        chunk_size = self.to_chunk_size(self.chunk_duration)
+        if chunk_size != self.chunk_size:
+            self.chunk_size = chunk_size
+            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+                _LOGGER.debug(f"Audio chunk resized: {chunk_size} bytes ({self.chunk_duration:.1f}ms, link lag {self._link_lag:.1f}ms)")
+
+    async def _run(self) -> None:
+        while True:
+            if not self._frames:
+                if self._stopping:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # Wait for a full chunk, but no longer than chunk duration since oldest queued frame
+            if self._queued < self.chunk_size and not self._stopping:
+                delay = self.chunk_duration - (time.monotonic() - self._frames[0][0]) * 1000
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay / 1000)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+            chunk, frames = self.pop_chunk()
+            buffered = self.get_buffered()
+            try:
+                await self.send(chunk)
+            except Exception as ex:
+                self.frames_dropped += frames
+                if self.on_error:
+                    await self.on_error(ex)
+                continue
+            self.on_sent(len(chunk), frames, buffered)
+
+    async def stop(self) -> AudioStreamMetrics:
+        """Send queued audio (within stop timeout), then return stream metrics."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._task and not self._task.done():
+            try:
+                await asyncio.wait_for(self._task, AUDIO_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOGGER.warning(f"Audio stream stopped before queued audio was sent ({len(self._frames)} frames dropped)")
+        self.frames_dropped += len(self._frames)
+        self._frames.clear()
+        self._queued = 0
+        self._task = None
+        return self.get_metrics()
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import time
+
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypedDict
+
+from .websocket_handler import WebSocketClient, ReceiveCallback, SuccessCallback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Interval between two background health checks (in seconds)
+HEALTH_CHECK_INTERVAL = 30
+
+# Max time given to a server to answer a health check ping (in seconds)
+HEALTH_CHECK_TIMEOUT = 1.0
+
+# Time a group dispatch waits for every server before answering (in seconds): slower servers are flagged late, never cancelled
+GROUP_DISPATCH_BUDGET = 0.25
+
+ClientAction = Callable[[WebSocketClient], Awaitable[Any]]
+
+class ServerHealth(TypedDict):
+    si: str
+    healthy: bool
+    latency_ms: float | None
+    error: str | None
+    checked_at: float
+
+class DispatchResult(TypedDict):
+    si: str
+    ok: bool
+    late: bool  # still running when budget elapsed (outcome given to dispatch on_late callback)
+    latency_ms: float
+    error: str | None
+
+LateCallback = Callable[[DispatchResult], Awaitable[None]]
+
+class ConnectionManager:
+    def __init__(self, on_receive: ReceiveCallback, on_success: SuccessCallback | None = None) -> None:
+        self.on_receive = on_receive
+        self.on_success = on_success
+        self._clients: dict[str, WebSocketClient] = {}
+        self._health: dict[str, ServerHealth] = {}
+        self._health_task: asyncio.Task | None = None
+        self._late_tasks: set[asyncio.Task] = set()  # dispatched actions still running after budget (referenced until done)
+
+    def add_client(self, server_id: str, url: str, secret: str) -> WebSocketClient:
+        ws_client = WebSocketClient(server_id, url, secret, self.on_receive, self.on_success)
+        self._clients[server_id] = ws_client
+        return ws_client
+
+    def get_client(self, server_id: str) -> WebSocketClient | None:
+        return self._clients.get(server_id)
+
+    def get_server_ids(self) -> list[str]:
+        return list(self._clients)
+
+    def get_clients(self, server_ids: Iterable[str] | None = None) -> list[WebSocketClient]:
+        if server_ids is None:
+            return list(self._clients.values())
+        return [self._clients[server_id] for server_id in server_ids if server_id in self._clients]
+
+    # =========================================================
+    # Broadcast
+    # =========================================================
+
+    async def broadcast(self, action: ClientAction, server_ids: Iterable[str] | None = None) -> dict[str, Any]:
+        """ Runs action concurrently against every (or specified) servers, returns result or exception by server ID"""
+        ws_clients = self.get_clients(server_ids)
+        results = await asyncio.gather(*(action(ws_client) for ws_client in ws_clients), return_exceptions=True)
+
+        results_by_server: dict[str, Any] = {}
+        for ws_client, result in zip(ws_clients, results):
+            if isinstance(result, Exception) and _LOGGER.getEffectiveLevel() == logging.DEBUG:
+                _LOGGER.debug(f"Broadcast failed on server {ws_client.server_id}: {result}")
+            results_by_server[ws_client.server_id] = result
+        return results_by_server
+
+    async def dispatch(self, action: ClientAction, server_ids: Iterable[str], budget: float = GROUP_DISPATCH_BUDGET, on_late: LateCallback | None = None) -> dict[str, DispatchResult]:
+        """ Runs action concurrently against specified servers, returns outcome by server ID once all completed or budget (in seconds) elapsed.
+        Servers missing budget (ie. reconnecting) are flagged late but never cancelled: a cancelled send could be a release, leaving a key stuck.
+        Their outcome is given to on_late once completed"""
+        async def timed_action(ws_client: WebSocketClient) -> float:
+            await action(ws_client)
+            return (time.monotonic_ns() - start_ns) / 1_000_000
+
+        start_ns = time.monotonic_ns()
+        tasks = {asyncio.create_task(timed_action(ws_client)): ws_client.server_id for ws_client in self.get_clients(server_ids)}
+        if not tasks:
+            return {}
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+        elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+
+        dispatch_results: dict[str, DispatchResult] = {}
+        for task in done:
+            dispatch_results[tasks[task]] = self.get_dispatch_result(tasks[task], task, elapsed_ms)
+        for task in pending:
+            server_id = tasks[task]
+            dispatch_results[server_id] = {"si": server_id, "ok": False, "late": True, "latency_ms": elapsed_ms, "error": None}
+            self._late_tasks.add(task)
+            task.add_done_callback(lambda task, server_id=server_id: self._on_late_done(task, server_id, start_ns, on_late))
+        if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+            _LOGGER.debug(f"Dispatched to {len(dispatch_results)} servers in {elapsed_ms:.1f}ms ({len(pending)} late): {dispatch_results}")
+        return dispatch_results
+
+    def get_dispatch_result(self, server_id: str, task: asyncio.Task, latency_ms: float) -> DispatchResult:
+        """ Outcome of completed dispatch task (latency_ms only used on failure)"""
+        ex = task.exception() if not task.cancelled() else asyncio.CancelledError()
+        if ex is not None:
+            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+                _LOGGER.debug(f"Dispatch failed on server {server_id}: {ex}")
+            return {"si": server_id, "ok": False, "late": False, "latency_ms": latency_ms, "error": str(ex) or type(ex).__name__}
+        return {"si": server_id, "ok": True, "late": False, "latency_ms": task.result(), "error": None}
+
+    def _on_late_done(self, task: asyncio.Task, server_id: str, start_ns: int, on_late: LateCallback | None) -> None:
+        self._late_tasks.discard(task)
+        result = self.get_dispatch_result(server_id, task, (time.monotonic_ns() - start_ns) / 1_000_000)
+        result["late"] = True
+        if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+            _LOGGER.debug(f"Late dispatch completed: {result}")
+        if on_late:
+            late_task = asyncio.create_task(on_late(result))
+            self._late_tasks.add(late_task)
+            late_task.add_done_callback(self._late_tasks.discard)
+
+    async def release_all(self, server_ids: Iterable[str] | None = None) -> dict[str, Any]:
+        """ Releases every keyboard key, consumer key and mouse button on every (or specified) servers"""
+        async def release(ws_client: WebSocketClient) -> None:
+            await ws_client.send_keypress([], [])
+            await ws_client.send_conpress([])
+            await ws_client.send_clickrelease()
+        return await self.broadcast(release, server_ids)
+
+    # =========================================================
+    # Health
+    # =========================================================
+
+    async def check_health(self, server_ids: Iterable[str] | None = None) -> dict[str, ServerHealth]:
+        """ Pings every (or specified) servers concurrently and records their health"""
+        async def ping(ws_client: WebSocketClient) -> float:
+            return await ws_client.ping(HEALTH_CHECK_TIMEOUT)
+
+        results = await self.broadcast(ping, server_ids)
+
+        checked_at = time.time()
+        for server_id, result in results.items():
+            healthy = not isinstance(result, Exception)
+            self._health[server_id] = {
+                "si": server_id,
+                "healthy": healthy,
+                "latency_ms": result if healthy else None,
+                "error": None if healthy else (str(result) or type(result).__name__),
+                "checked_at": checked_at,
+            }
+            if not healthy:
+                _LOGGER.warning(f"Server {server_id} health check failed: {self._health[server_id]['error']}")
+        return {server_id: self._health[server_id] for server_id in results}
+
+    def get_health(self, server_ids: Iterable[str] | None = None) -> dict[str, Any]:
+        """ Aggregates last known health of every (or specified) servers"""
+        if server_ids is None:
+            server_ids = self._clients
+        servers = [self._health[server_id] for server_id in server_ids if server_id in self._health]
+        latencies = [server["latency_ms"] for server in servers if server["healthy"]]
+        return {
+            "total": len(servers),
+            "healthy": len(latencies),
+            "max_latency_ms": max(latencies) if latencies else None,
+            "servers": servers,
+        }
+
+    async def _health_loop(self, interval: float) -> None:
+        try:
+            while True:
+                try:
+                    await self.check_health()
+                except Exception as ex:
+                    _LOGGER.exception("Servers health check crashed: %s", ex)
+                await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            _LOGGER.debug("Health check task cancelled")
+            raise
+
+    # =========================================================
+    # Lifecycle
+    # =========================================================
+
+    def start(self, interval: float = HEALTH_CHECK_INTERVAL) -> None:
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop(interval))
+        _LOGGER.info("Connection manager health checks activated")
+
+    async def stop(self) -> None:
+        if self._health_task and not self._health_task.done():
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+        self._health_task = None
+
+        async def close(ws_client: WebSocketClient) -> None:
+            await ws_client.disconnect()
+            await ws_client.stop_receive()
+        await self.broadcast(close)
+        _LOGGER.info("Connection manager stopped")
@@ -1,14 +1,22 @@
 # Frontend Lovelace resources management
 RESOURCES_LAST_SYNC_TIME = 0
 RESOURCES_SYNC_INTERVAL = 5
+RESOURCES_DIR = "/config/www"
 RESOURCES_DOMAIN = "<ha_resources_domain>"
 RESOURCES_URL_BASE = f"/local/{RESOURCES_DOMAIN}"
+RESOURCES_STATIC_URL_BASE = f"/{RESOURCES_DOMAIN}-static"
+RESOURCES_STATIC_KEY_LENGTH = 16
 RESOURCES_VERSION = "<ha_resources_version>"
 RESOURCES = <ha_resources>
 
 # This component name
 DOMAIN = "<ha_component_name>"
 
+# This component persisted users preferences (HA storage helper)
+USERS_PREFS_STORAGE_KEY = f"{DOMAIN}.users_prefs"
+USERS_PREFS_STORAGE_VERSION = 1
+USERS_PREFS_SAVE_DELAY = 10
+
 # This component file structure
 COMPONENT_DIR = f"/config/custom_components/{DOMAIN}"
 COMPONENT_VERSION_FILE = f"{COMPONENT_DIR}/version"
@@ -40,3 +48,14 @@ MAX_RANGE = 127
 #   },
 # ]
 WEBSOCKET_SERVERS = <servers>
+
+
+# List of servers groups (one service call targets every server of a group)
+# [
+#   {
+#       "id": "tvs",
+#       "name": "All TVs",
+#       "servers": "1,2",
+#   },
+# ]
+WEBSOCKET_GROUPS = <groups>
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .event_types import EventType
+
+_LOGGER = logging.getLogger(__name__)
+
+# Identical errors (same server, same code) are reported at most once per window (in seconds)
+ERROR_AGGREGATION_WINDOW = 2.0
+
+# Emits (type, code, extra, server_id, count)
+EventEmitter = Callable[[int, int, int | None, str | None, int], Awaitable[None]]
+
+class AggregatedError:
+    def __init__(self, extra: int | None, now: float) -> None:
+        self.flush_handle: asyncio.TimerHandle | None = None
+        self.restart(extra, now)
+
+    def restart(self, extra: int | None, now: float) -> None:
+        self.extra = extra
+        self.total = 1
+        self.pending = 0
+        self.last_error_time = now
+        self.quiet = False  # quiet window elapsed without recovery: next error starts a new burst
+
+class ErrorAggregator:
+    def __init__(self, hass: HomeAssistant, emit: EventEmitter, window: float = ERROR_AGGREGATION_WINDOW) -> None:
+        self.hass = hass
+        self.emit = emit
+        self.window = window
+        self._errors: dict[tuple[str | None, int], AggregatedError] = {}
+        self._failing_servers: dict[str | None, set[int]] = {}
+        self._last_success_times: dict[str, float] = {}
+
+    async def report(self, server_id: str | None, code: int, extra: int | None) -> None:
+        key = (server_id, code)
+        now = time.monotonic()
+        error = self._errors.get(key)
+
+        # First error (or first after a quiet window): notify immediately, then aggregate followers until window ends
+        if error is None or error.quiet:
+            if error is None:
+                self._errors[key] = error = AggregatedError(extra, now)
+                self._failing_servers.setdefault(server_id, set()).add(code)
+            else:
+                error.restart(extra, now)
+            self._schedule_flush(key, error)
+            await self.emit(EventType.ERROR, code, extra, server_id, 1)
+            return
+
+        # Follower error: counted, notified once at window end
+        error.extra = extra
+        error.total += 1
+        error.pending += 1
+        error.last_error_time = now
+        self._schedule_flush(key, error)
+
+    def notify_success(self, server_id: str) -> None:
+        # Fast path: server is healthy (called on every successful send)
+        codes = self._failing_servers.get(server_id)
+        if not codes:
+            return
+
+        # Recovery is confirmed once a full window elapses without new error
+        self._last_success_times[server_id] = time.monotonic()
+        for code in codes:
+            key = (server_id, code)
+            self._schedule_flush(key, self._errors[key])
+
+    def _schedule_flush(self, key: tuple[str | None, int], error: AggregatedError) -> None:
+        if error.flush_handle is None:
+            error.flush_handle = self.hass.loop.call_later(self.window, self._on_flush, key)
+
+    def _on_flush(self, key: tuple[str | None, int]) -> None:
+        self.hass.async_create_task(self._flush(key))
+
+    async def _flush(self, key: tuple[str | None, int]) -> None:
+        error = self._errors.get(key)
+        if error is None:
+            return
+        error.flush_handle = None
+        server_id, code = key
+
+        # Errors still happening: one aggregated notification for the whole window
+        if error.pending:
+            count = error.pending
+            error.pending = 0
+            if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+                _LOGGER.debug(f"Aggregated {count} errors (server_id={server_id}, code={code})")
+            await self.emit(EventType.ERROR, code, error.extra, server_id, count)
+            self._schedule_flush(key, error)
+            return
+
+        # Quiet window after a successful send: link healed
+        last_success_time = self._last_success_times.get(server_id, 0)
+        if last_success_time > error.last_error_time:
+            self._forget(key)
+            _LOGGER.info(f"Recovered from {error.total} errors (server_id={server_id}, code={code})")
+            await self.emit(EventType.INFO, code, None, server_id, error.total)
+            return
+
+        # Errors not bound to a server cannot recover: only debounced
+        if server_id is None:
+            self._forget(key)
+            return
+
+        # Quiet window without successful send: burst is over, still waiting for recovery
+        error.quiet = True
+
+    def _forget(self, key: tuple[str | None, int]) -> None:
+        error = self._errors.pop(key, None)
+        if error and error.flush_handle:
+            error.flush_handle.cancel()
+
+        server_id, code = key
+        codes = self._failing_servers.get(server_id)
+        if codes:
+            codes.discard(code)
+            if not codes:
+                self._failing_servers.pop(server_id, None)
+                self._last_success_times.pop(server_id, None)
+
+    def clear(self) -> None:
+        for error in self._errors.values():
+            if error.flush_handle:
+                error.flush_handle.cancel()
+        self._errors.clear()
+        self._failing_servers.clear()
+        self._last_success_times.clear()
@@ -0,0 +1,114 @@
+import logging
+import queue
+import threading
+import time
+
+from typing import Any, TypedDict
+
+_LOGGER = logging.getLogger(__name__)
+
+# Client log levels (as sent by logger.js) to python log levels
+CLIENT_LOG_LEVELS = {
+    "TRA": logging.DEBUG,
+    "DBG": logging.DEBUG,
+    "INF": logging.INFO,
+    "WRN": logging.WARNING,
+    "ERR": logging.ERROR,
+}
+
+# Rate limiting per logger_id (token bucket): sustained records per second and burst size.
+# Warnings and errors are never dropped.
+LOG_RATE_PER_SECOND = 50
+LOG_RATE_BURST = 200
+
+# Max tracked logger_id (a new one per card instance): rate limiters are reset beyond
+LOG_RATE_LIMITERS_SIZE = 1000
+
+# Max pending batches before new ones are dropped (worker thread lagging behind)
+LOG_QUEUE_SIZE = 1000
+
+class ClientLogRecord(TypedDict):
+    level: str
+    highlight: str
+    logs: list[Any]
+
+class LogRateLimiter:
+    def __init__(self, now: float) -> None:
+        self.tokens = float(LOG_RATE_BURST)
+        self.last_refill = now
+        self.dropped = 0
+
+    def acquire(self, now: float) -> bool:
+        self.tokens = min(LOG_RATE_BURST, self.tokens + (now - self.last_refill) * LOG_RATE_PER_SECOND)
+        self.last_refill = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.dropped += 1
+        return False
+
+class LogIngest:
+    """Writes client logs from a worker thread, sampled per logger_id, so that debug sessions do not compete with inputs on the event loop."""
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self._queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._rate_limiters: dict[str, LogRateLimiter] = {}
+        self._thread: threading.Thread | None = None
+
+    def ingest(self, origin: str, logger_id: str, records: list[ClientLogRecord]) -> None:
+        # Event loop side: a single non-blocking put per batch
+        try:
+            self._queue.put_nowait((origin, logger_id, records))
+        except queue.Full:
+            _LOGGER.warning(f"Client logs queue full: dropped {len(records)} records from {origin} ({logger_id})")
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="ha_zero_hid_log_ingest", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            try:
+                self._write(*batch)
+            except Exception as ex:
+                _LOGGER.exception("Client logs write failed: %s", ex)
+
+    def _write(self, origin: str, logger_id: str, records: list[ClientLogRecord]) -> None:
+        now = time.monotonic()
+        rate_limiter = self._rate_limiters.get(logger_id)
+        if rate_limiter is None:
+            if len(self._rate_limiters) >= LOG_RATE_LIMITERS_SIZE:
+                self._rate_limiters.clear()
+            self._rate_limiters[logger_id] = rate_limiter = LogRateLimiter(now)
+
+        for record in records:
+            level = record.get("level")
+            python_level = CLIENT_LOG_LEVELS.get(level, logging.CRITICAL)
+            if python_level == logging.CRITICAL:
+                self.logger.warning("Unknown log level '%s'. Logging as CRITICAL.", level)
+            if not self.logger.isEnabledFor(python_level):
+                continue
+
+            # Sample out verbose records beyond rate
+            if python_level < logging.WARNING and not rate_limiter.acquire(now):
+                continue
+
+            # Report records dropped since last written one
+            if rate_limiter.dropped:
+                self.logger.warning("[CLIENT][%s][%s] %s records dropped (rate limited)", origin, logger_id, rate_limiter.dropped)
+                rate_limiter.dropped = 0
+
+            logs = record.get("logs") or []
+            fmt = "[CLIENT][%s][%s][%s]%s" + (" %s" * len(logs))
+            self.logger.log(python_level, fmt, level, origin, logger_id, record.get("highlight") or "", *logs)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
 import time
 
-from .const import RESOURCES_VERSION, COMPONENT_VERSION_FILE, DOMAIN, RESOURCES_DOMAIN, RESOURCES, RESOURCES_LAST_SYNC_TIME, RESOURCES_SYNC_INTERVAL
+from .const import RESOURCES_VERSION, COMPONENT_VERSION_FILE, DOMAIN, RESOURCES_DIR, RESOURCES_DOMAIN, RESOURCES, RESOURCES_LAST_SYNC_TIME, RESOURCES_SYNC_INTERVAL, RESOURCES_URL_BASE, RESOURCES_STATIC_URL_BASE, RESOURCES_STATIC_KEY_LENGTH
+from .static_assets import get_resources_static_dir, is_compressed_variant, precompress_resources
 from homeassistant.core import HomeAssistant
 from homeassistant.components.lovelace import LovelaceData
 from typing import Dict, List
@@ -13,6 +15,12 @@ from typing import Dict, List
 _LOGGER = logging.getLogger(__name__)
 _LOCK = asyncio.Lock()  # Prevent race conditions
 
+# Resources content manifest (built at startup, refreshed incrementally)
+RESOURCES_MANIFEST: ResourcesManifest | None = None
+
+# Last synchronization answer (served from memory while manifest is unchanged)
+RESOURCES_VERSIONS_CACHE: ResourcesVersions | None = None
+
 class ResourcesVersions:
     def __init__(self):
         self.are_equal: bool | None = None
@@ -21,14 +29,97 @@ class ResourcesVersions:
         self.reference_source: str | None = None
         self.reference_value: str | None = None
 
+class ResourcesManifest:
+    def __init__(self, hashes: Dict[str, str], mtimes: Dict[str, float], version_file_mtime: float | None):
+        self.hashes = hashes
+        self.mtimes = mtimes
+        self.version_file_mtime = version_file_mtime
+        self.digest = hashlib.sha256(
+            "\n".join(f"{path}:{hashes[path]}" for path in sorted(hashes)).encode("utf-8")
+        ).hexdigest()
+
+    def is_same(self, other: ResourcesManifest | None) -> bool:
+        return other is not None and self.digest == other.digest and self.version_file_mtime == other.version_file_mtime
+
+def getResourcePath(resource: Dict[str]) -> str:
+    return f"{RESOURCES_DIR}/{resource.get('domain', RESOURCES_DOMAIN)}/{resource['file']}"
+
+def get_file_mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+def get_file_hash(path: str) -> str:
+    file_hash = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                file_hash.update(chunk)
+    except OSError:
+        return ""
+    return file_hash.hexdigest()
+
+def list_resources_paths() -> List[str]:
+    # Every file of this component resources (cards import their siblings relatively), plus declared dependencies resources
+    paths = {getResourcePath(resource) for resource in RESOURCES}
+    for dir_path, _, file_names in os.walk(get_resources_static_dir()):
+        paths.update(os.path.join(dir_path, file_name) for file_name in file_names if not is_compressed_variant(file_name))
+    return sorted(paths)
+
+def build_resources_manifest(previous: ResourcesManifest | None = None) -> ResourcesManifest:
+    """Build resources content manifest (blocking I/O: run into executor), only rehashing files modified since previous manifest."""
+    hashes: Dict[str, str] = {}
+    mtimes: Dict[str, float] = {}
+    for path in list_resources_paths():
+        mtime = get_file_mtime(path)
+        if previous is not None and mtime is not None and previous.mtimes.get(path) == mtime:
+            hashes[path] = previous.hashes[path]
+        else:
+            hashes[path] = get_file_hash(path)
+        if mtime is not None:
+            mtimes[path] = mtime
+    return ResourcesManifest(hashes, mtimes, get_file_mtime(COMPONENT_VERSION_FILE))
+
+def refresh_resources_manifest_if_needed(previous: ResourcesManifest | None) -> ResourcesManifest:
+    # Installs (re)write version file along with resources: unchanged version file means unchanged manifest (single stat)
+    if previous is not None and get_file_mtime(COMPONENT_VERSION_FILE) == previous.version_file_mtime:
+        return previous
+    manifest = build_resources_manifest(previous)
+    precompress_resources(get_resources_static_dir())
+    return manifest
+
+async def refresh_resources_manifest(hass: HomeAssistant) -> bool:
+    """Refresh resources manifest, returns True when resources (or version file) changed."""
+    global RESOURCES_MANIFEST
+    previous = RESOURCES_MANIFEST
+    RESOURCES_MANIFEST = await hass.async_add_executor_job(refresh_resources_manifest_if_needed, previous)
+    changed = not RESOURCES_MANIFEST.is_same(previous)
+    if changed and previous is not None:
+        changed_paths = [path for path, file_hash in RESOURCES_MANIFEST.hashes.items() if previous.hashes.get(path) != file_hash]
+        _LOGGER.info(f"Resources manifest changed (digest={RESOURCES_MANIFEST.digest}, changed resources={changed_paths})")
+    return changed
+
+def get_resources_static_key() -> str | None:
+    # Resources content key: changes whenever any resource changes
+    if RESOURCES_MANIFEST is None:
+        return None
+    return RESOURCES_MANIFEST.digest[:RESOURCES_STATIC_KEY_LENGTH]
+
 def getResourceUrlBase(resource: Dict[str]) -> str:
-    return f"/local/{resource.get("domain", RESOURCES_DOMAIN)}"
+    # This component resources: served by the integration (immutable caching, precompressed variants)
+    domain = resource.get("domain", RESOURCES_DOMAIN)
+    resources_static_key = get_resources_static_key()
+    if domain == RESOURCES_DOMAIN and resources_static_key:
+        return f"{RESOURCES_STATIC_URL_BASE}/{resources_static_key}"
+    return f"/local/{domain}"
 
 def getResourcesUrlBases() -> List[str]:
+    # Include legacy "/local" base and any previous content key, so that outdated resources are found and replaced
     return sorted({
         getResourceUrlBase(resource)
         for resource in RESOURCES
-    })
+    } | {RESOURCES_URL_BASE, RESOURCES_STATIC_URL_BASE})
 
 async def set_resources_versions(hass: HomeAssistant, write_to_file: bool, resources_versions: ResourcesVersions | None) -> None:
     global RESOURCES_VERSION
@@ -111,6 +202,7 @@ def get_lovelace_mode(lovelace: LovelaceData) -> str:
     raise RuntimeError("Unsupported HA change: cannot determine Lovelace mode")
 
 async def synchronize_resources(hass: HomeAssistant, use_version_file: bool, force_sync: bool) -> ResourcesVersions | None:
+    global RESOURCES_VERSIONS_CACHE
     _LOGGER.debug(f"Synchronizing resources (use_version_file={use_version_file})...")
 
     resources_versions: ResourcesVersions | None = None
@@ -168,6 +260,13 @@ async def synchronize_resources(hass: HomeAssistant, use_version_file: bool, for
                     for resource in RESOURCES
                 }
 
+                # Registered resources are exactly the up-to-date ones: nothing to diff
+                if not force_sync and uptodate_resources_urls == set(existing_resources):
+                    _LOGGER.debug(f"Lovelace resources for {DOMAIN} component already registered")
+                    await set_resources_versions(hass, use_version_file, resources_versions)
+                    RESOURCES_VERSIONS_CACHE = resources_versions
+                    return resources_versions
+
                 # Remove existing outdated Lovelace resources
                 for url, id in existing_resources.items():
                     if url not in uptodate_resources_urls:
@@ -193,6 +292,8 @@ async def synchronize_resources(hass: HomeAssistant, use_version_file: bool, for
         else:
             _LOGGER.warning(f"Lovelace mode is not \"storage\": manually declare those resources {RESOURCES} using base URL(s) {resources_url_bases}")
 
+        RESOURCES_VERSIONS_CACHE = resources_versions
+
     return resources_versions
 
 async def synchronize_resources_heuristically(hass: HomeAssistant) -> ResourcesVersions | None:
@@ -203,10 +304,15 @@ async def synchronize_resources_heuristically(hass: HomeAssistant) -> ResourcesV
     delta = current_time - RESOURCES_LAST_SYNC_TIME
     _LOGGER.debug(f"delta:{delta}, current_time={current_time}, RESOURCES_LAST_SYNC_TIME={RESOURCES_LAST_SYNC_TIME}, RESOURCES_SYNC_INTERVAL={RESOURCES_SYNC_INTERVAL}")
 
-    resources_versions: ResourcesVersions | None = None
-    if delta > RESOURCES_SYNC_INTERVAL:
-        RESOURCES_LAST_SYNC_TIME = current_time
-        resources_versions = await synchronize_resources(hass, use_version_file=True, force_sync=False)
-    else:
-        resources_versions = await synchronize_resources(hass, use_version_file=False, force_sync=False)
-    return resources_versions
+    # Within interval: in-memory answer
+    if delta <= RESOURCES_SYNC_INTERVAL:
+        if RESOURCES_VERSIONS_CACHE is not None:
+            return RESOURCES_VERSIONS_CACHE
+        return await synchronize_resources(hass, use_version_file=False, force_sync=False)
+
+    # Interval elapsed: in-memory answer unless resources manifest changed
+    RESOURCES_LAST_SYNC_TIME = current_time
+    manifest_changed = await refresh_resources_manifest(hass)
+    if not manifest_changed and RESOURCES_VERSIONS_CACHE is not None:
+        return RESOURCES_VERSIONS_CACHE
+    return await synchronize_resources(hass, use_version_file=True, force_sync=False)
@@ -0,0 +1,100 @@
+import gzip
+import logging
+import os
+
+from collections.abc import Callable
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import RESOURCES_DIR, RESOURCES_DOMAIN, RESOURCES_STATIC_URL_BASE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Resources served with compressed variants (when large enough for compression to pay off)
+PRECOMPRESSED_EXTENSIONS = (".js", ".json", ".svg", ".css", ".html")
+PRECOMPRESSED_MIN_SIZE = 1024
+
+# Compressed variants suffixes (picked by aiohttp FileResponse from request Accept-Encoding)
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# URL keyed by resources content: never changes, cached for a year
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Outdated key (page loaded before an update): served, but never cached
+CACHE_CONTROL_OUTDATED = "no-cache"
+
+def get_resources_static_dir() -> str:
+    return f"{RESOURCES_DIR}/{RESOURCES_DOMAIN}"
+
+def is_compressed_variant(path: str) -> bool:
+    return path.endswith(COMPRESSED_SUFFIXES)
+
+def write_compressed_variant(path: str, variant_path: str, source_mtime: float, compress: Callable[[bytes], bytes]) -> bool:
+    try:
+        if os.stat(variant_path).st_mtime >= source_mtime:
+            return False
+    except OSError:
+        pass
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(variant_path, "wb") as f:
+        f.write(compress(data))
+    return True
+
+def precompress_resources(directory: str) -> int:
+    """Write gzip (and brotli, when available) variants next to resources (blocking I/O: run into executor), returns written variants count."""
+    compressors: list[tuple[str, Callable[[bytes], bytes]]] = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compressors.append((".br", lambda data: brotli.compress(data, quality=11)))
+
+    written = 0
+    for dir_path, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            if not file_name.endswith(PRECOMPRESSED_EXTENSIONS):
+                continue
+            path = os.path.join(dir_path, file_name)
+            try:
+                stat = os.stat(path)
+                if stat.st_size < PRECOMPRESSED_MIN_SIZE:
+                    continue
+                for suffix, compress in compressors:
+                    if write_compressed_variant(path, path + suffix, stat.st_mtime, compress):
+                        written += 1
+            except OSError as ex:
+                _LOGGER.warning(f"Cannot precompress resource {path}: {ex}")
+
+    if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+        _LOGGER.debug(f"Precompressed {written} resources variants into {directory} (brotli={'enabled' if brotli is not None else 'unavailable'})")
+    return written
+
+class ResourcesStaticView(HomeAssistantView):
+    """Serves component resources under a content keyed URL, with immutable caching and precompressed variants."""
+
+    url = RESOURCES_STATIC_URL_BASE + "/{key}/{path:.+}"
+    name = f"{RESOURCES_DOMAIN}:static"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant, get_key: Callable[[], str | None]) -> None:
+        self.hass = hass
+        self.get_key = get_key
+        self.directory = get_resources_static_dir()
+
+    async def get(self, request: web.Request, key: str, path: str) -> web.StreamResponse:
+        # Only relative paths inside resources directory (compressed variants are never requested directly)
+        relative_path = os.path.normpath(path)
+        if os.path.isabs(relative_path) or relative_path.startswith("..") or is_compressed_variant(relative_path):
+            raise web.HTTPNotFound()
+
+        file_path = os.path.join(self.directory, relative_path)
+        if not await self.hass.async_add_executor_job(os.path.isfile, file_path):
+            raise web.HTTPNotFound()
+
+        cache_control = CACHE_CONTROL_IMMUTABLE if key == self.get_key() else CACHE_CONTROL_OUTDATED
+        return web.FileResponse(file_path, headers={"Cache-Control": cache_control, "Vary": "Accept-Encoding"})
@@ -0,0 +1,55 @@
+from collections.abc import Callable, Mapping
+from typing import Any
+
+# Fast validator: returns validated data for well-typed input, None to delegate to the full schema
+FastValidator = Callable[[Mapping[str, Any]], dict[str, Any] | None]
+
+class FastSchema:
+    """Service schema trying a precompiled fast validator first, falling back to the full (voluptuous) schema for odd input."""
+
+    def __init__(self, fast_validator: FastValidator, schema: Callable[[Any], Any]) -> None:
+        self.fast_validator = fast_validator
+        self.schema = schema
+
+    def __call__(self, data: Any) -> Any:
+        validated = self.fast_validator(data)
+        if validated is None:
+            return self.schema(data)
+        return validated
+
+def create_fast_move_validator(min_val: int, max_val: int) -> FastValidator:
+    # Well-typed: {"si": str, "x": int, "y": int} with x,y already within range (no clamping needed)
+    def validate(data: Mapping[str, Any]) -> dict[str, Any] | None:
+        if len(data) != 3:
+            return None
+        si = data.get("si")
+        x = data.get("x")
+        y = data.get("y")
+        if type(si) is not str or type(x) is not int or type(y) is not int:
+            return None
+        if not (min_val <= x <= max_val and min_val <= y <= max_val):
+            return None
+        return {"si": si, "x": x, "y": y}
+    return validate
+
+def create_fast_lists_validator(*list_keys: str) -> FastValidator:
+    # Well-typed: {"si": str, <list_key>: list, ...} with every list key optional (defaults to empty list)
+    allowed_keys = frozenset(("si",) + list_keys)
+
+    def validate(data: Mapping[str, Any]) -> dict[str, Any] | None:
+        si = data.get("si")
+        if type(si) is not str:
+            return None
+        validated = {"si": si}
+        for key in list_keys:
+            value = data.get(key)
+            if value is None:
+                value = []
+            elif type(value) is not list:
+                return None
+            validated[key] = value
+        # Unknown keys: let full schema reject them
+        if len(data) > len(allowed_keys) or not allowed_keys.issuperset(data):
+            return None
+        return validated
+    return validate
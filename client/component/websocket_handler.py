@@ -8,27 +8,37 @@ import time
 import websockets
 
 from collections.abc import Awaitable, Callable
-from homeassistant.util.ssl import client_context
 from typing import Any
 from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
 
+from .audio_stream import AUDIO_CODECS, AudioStream, AudioStreamMetrics
 from .errors import ErrorSource
 from .exceptions import HaZeroHidException
 
 _LOGGER = logging.getLogger(__name__)
 
 ReceiveCallback = Callable[[dict[str, Any]], Awaitable[None]]
+SuccessCallback = Callable[[str], None]
 MAX_ID = sys.maxsize
 
 SEND_TIMEOUT = 2000
 
+class ResumableSSLContext(ssl.SSLContext):
+    """Client TLS context resuming last session of its server: asyncio has no session parameter, so it is given to every TLS object wrapped by this context."""
+
+    session: ssl.SSLSession | None = None
+
+    def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None, session=None):
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session or self.session)
+
 class WebSocketClient:
-    def __init__(self, server_id: str, url: str, secret: str, on_receive: ReceiveCallback) -> None:
+    def __init__(self, server_id: str, url: str, secret: str, on_receive: ReceiveCallback, on_success: SuccessCallback | None = None) -> None:
         self.server_id = server_id
         self.url = url
         self.websocket = None
         self.secret = secret
         self.on_receive = on_receive
+        self.on_success = on_success
 
         # Enforces:
         # - serialized send ordering
@@ -39,7 +49,11 @@ class WebSocketClient:
         # Enforces pending responses mutations
         self._pending_lock = asyncio.Lock()
 
+        # Built once and reused across reconnects, with last TLS session (see get_ssl_context)
+        self._ssl_context: ResumableSSLContext | None = None
+
         self._receive_task: asyncio.Task | None = None
+        self._audio_stream: AudioStream | None = None
         self._pending_responses: dict[int, asyncio.Future] = {}
         self._current_message_id = 0
 
@@ -63,7 +77,10 @@ class WebSocketClient:
                         await self.connect()
                         await self.start_receive()
 
-                    return await self.unsafe_send(message, wait_response)
+                    response = await self.unsafe_send(message, wait_response)
+                    if self.on_success:
+                        self.on_success(self.server_id)
+                    return response
                 except Exception as ex:
                     _LOGGER.debug("Send failed (%s out of %s)", retry + 1, retries)
                     await self.disconnect()
@@ -170,9 +187,7 @@ class WebSocketClient:
 
     async def connect(self, timeout=0.5) -> None:
         _LOGGER.info("WebSocket connection in progress...")
-        ssl_context = client_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE  # Accept self-signed certs (insecure but OK for testing)
+        ssl_context = self.get_ssl_context()
 
         # Authentication headers
         extra_headers = {
@@ -187,6 +202,26 @@ class WebSocketClient:
             # HA <2026 websockets < 9
             self.websocket = await asyncio.wait_for(websockets.connect(self.url, ssl=ssl_context, extra_headers=extra_headers), timeout=timeout)
         _LOGGER.info("WebSocket connection established")
+        self.save_tls_session()
+
+    def get_ssl_context(self) -> ResumableSSLContext:
+        if self._ssl_context is None:
+            # Dedicated context (one per server: TLS session belongs to it), accepting self-signed certs (insecure but OK for testing)
+            self._ssl_context = ResumableSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+        return self._ssl_context
+
+    # Keep TLS session (ticket received with handshake) for next reconnect: abbreviated handshake instead of a full one
+    def save_tls_session(self) -> None:
+        transport = getattr(self.websocket, "transport", None)
+        ssl_object = transport.get_extra_info("ssl_object") if transport else None
+        if ssl_object is None:
+            return
+        if _LOGGER.getEffectiveLevel() == logging.DEBUG:
+            _LOGGER.debug(f"TLS session {'resumed' if ssl_object.session_reused else 'created'} ({ssl_object.version()})")
+        if ssl_object.session is not None:
+            self._ssl_context.session = ssl_object.session
 
     async def start_receive(self) -> None:
         if self._receive_task is None or self._receive_task.done():
@@ -214,6 +249,35 @@ class WebSocketClient:
         self._receive_task = None
         _LOGGER.info("WebSocket receive loop deactivated")
 
+    async def ping(self, timeout: float = 1.0) -> float:
+        """ Round-trip a WebSocket ping (connecting first when needed), returns latency in ms"""
+        async with self._lock:
+            try:
+                if not self.is_connected():
+                    await self.connect()
+                    await self.start_receive()
+
+                start_ns = time.monotonic_ns()
+                pong_waiter = await self.websocket.ping()
+                await asyncio.wait_for(pong_waiter, timeout=timeout)
+                latency_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+                if self.on_success:
+                    self.on_success(self.server_id)
+                return latency_ms
+            except Exception as ex:
+                await self.disconnect()
+                await self.stop_receive()
+                await self.fail_pending_responses(ex)
+                raise
+
+    # Bytes written but not yet sent on the network (0 when disconnected): websocket sends return before
+    # bytes leave transport buffer, so this is what a congested link shows
+    def get_write_buffer_size(self) -> int:
+        transport = getattr(self.websocket, "transport", None)
+        if transport is None or transport.is_closing():
+            return 0
+        return transport.get_write_buffer_size()
+
     def is_connected(self) -> bool:
         try:
             return self.websocket is not None and not getattr(self.websocket, "closed", False)
@@ -236,6 +300,23 @@ class WebSocketClient:
         message = struct.pack("<Bbb", 0x02, x, y)
         await self.send(message)
 
+    # Send request [0x04]: Air-mouse raw gyroscope samples batch (fused into mouse moves by server)
+    # Format: [0x04][speed][dead_zone][count] + count * [alpha][beta][gamma][interval]
+    # whith speed, dead_zone = unsigned bytes (tenths), alpha, beta, gamma = signed shorts (tenths of deg/s), interval = unsigned byte (ms)
+    async def send_airmouse(self, speed: float, dead_zone: float, samples: list[float]) -> None:
+        count = min(len(samples) // 4, 255)
+        message = bytearray(struct.pack("<BBBB", 0x04, round(speed * 10), round(dead_zone * 10), count))
+        for index in range(0, count * 4, 4):
+            alpha, beta, gamma, interval = samples[index:index + 4]
+            message += struct.pack(
+                "<hhhB",
+                max(-32768, min(32767, round(alpha * 10))),
+                max(-32768, min(32767, round(beta * 10))),
+                max(-32768, min(32767, round(gamma * 10))),
+                max(0, min(255, round(interval))),
+            )
+        await self.send(bytes(message))
+
     # Send request [0x10]: Mouse left click
     async def send_clickleft(self) -> None:
         await self.send(b"\x10")
@@ -267,6 +348,14 @@ class WebSocketClient:
         message += struct.pack("<B", len(keys)) + bytes(keys)
         await self.send(message)
 
+    # Send request [0x31]: Key press with modifiers, repeated by server until next key press (0 delay/interval: server defaults)
+    # Format: [0x31][delay_lo][delay_hi][interval_lo][interval_hi][mod_count][mod1, mod2, ...][key_count][key1, key2, ...]
+    async def send_keypress_repeat(self, modifiers: list[int], keys: list[int], delay: int = 0, interval: int = 0) -> None:
+        message = struct.pack("<BHH", 0x31, delay, interval)
+        message += struct.pack("<B", len(modifiers)) + bytes(modifiers)
+        message += struct.pack("<B", len(keys)) + bytes(keys)
+        await self.send(message)
+
     # Send request [0x40]: Consumer press
     # Format: [0x40][count][con1_lo][con1_hi][con2_lo][con2_hi]...
     async def send_conpress(self, cons: list[int]) -> None:
@@ -275,6 +364,14 @@ class WebSocketClient:
         message = struct.pack("<BB", 0x40, count) + cons_bytes
         await self.send(message)
 
+    # Send request [0x41]: Consumer press, repeated by server until next consumer press (0 delay/interval: server defaults)
+    # Format: [0x41][delay_lo][delay_hi][interval_lo][interval_hi][count][con1_lo][con1_hi][con2_lo][con2_hi]...
+    async def send_conpress_repeat(self, cons: list[int], delay: int = 0, interval: int = 0) -> None:
+        count = len(cons)
+        cons_bytes = struct.pack(f"<{count}H", *cons)
+        message = struct.pack("<BHHB", 0x41, delay, interval, count) + cons_bytes
+        await self.send(message)
+
     # Send request [0x50]: Sync keyboard, json response expected
     async def sync_keyboard(self) -> dict[str, Any]:
         response = await self.send(b"\x50", wait_response=True)
@@ -289,12 +386,13 @@ class WebSocketClient:
         }
 
     # Send request [0x60]: Audio start, no response expected
-    async def send_audiostart(self) -> None:
-        await self.send(b'\x60')
+    # Format: [0x60][codec]
+    async def send_audiostart(self, codec: str = "pcm") -> None:
+        await self.send(struct.pack("<BB", 0x60, AUDIO_CODECS[codec]))
 
     # Send request [0x6x]: Audio transfert - send audio buffer optimized by size, no response expected
     # Format: [0x61|0x62|0x63][len][...bytes...]
-    async def send_audio(self, buffer: list[int]) -> None:
+    async def send_audio(self, buffer: bytes | list[int]) -> None:
         bufLen = len(buffer)
         if bufLen < 256:
             message = struct.pack("<BB", 0x61, bufLen)
@@ -309,6 +407,29 @@ class WebSocketClient:
     async def send_audiostop(self) -> None:
         await self.send(b'\x70')
 
+    # =========================================================
+    # Audio stream (adaptive chunks over send requests [0x6x])
+    # =========================================================
+
+    async def start_audio_stream(self, codec: str = "pcm", on_error: Callable[[Exception], Awaitable[None]] | None = None) -> None:
+        await self.stop_audio_stream(notify_server=False)
+        self._audio_stream = AudioStream(codec, self.send_audio, on_error, self.get_write_buffer_size)
+        await self.send_audiostart(codec)
+
+    # Queue audio frame: sent by stream task, aggregated into chunks sized from measured link lag
+    def push_audio(self, buffer: bytes | list[int]) -> None:
+        if self._audio_stream is None:
+            # No audio start received (ie. integration reloaded while streaming): server default codec
+            self._audio_stream = AudioStream("pcm", self.send_audio, get_write_buffer_size=self.get_write_buffer_size)
+        self._audio_stream.push(buffer)
+
+    async def stop_audio_stream(self, notify_server: bool = True) -> AudioStreamMetrics | None:
+        audio_stream, self._audio_stream = self._audio_stream, None
+        metrics = await audio_stream.stop() if audio_stream else None
+        if notify_server:
+            await self.send_audiostop()
+        return metrics
+
     # =========================================================
     # Request helpers
     # =========================================================
@@ -618,6 +618,13 @@ install() {
       | "[" + join(", ") + "]"
     ' "${HA_ZERO_HID_CLIENT_CONFIG_FILE}")
 
+    # Convert optional servers groups JSON to groups Python-style syntax using jq only
+    groups_py=$(jq -r '
+      (.groups // [])
+      | map("{\"id\": \"\(.id)\", \"name\": \"\(.name)\", \"servers\": \"\(.servers)\"}")
+      | "[" + join(", ") + "]"
+    ' "${HA_ZERO_HID_CLIENT_CONFIG_FILE}")
+
     # Convert resources JSON to resources Python-style syntax using jq only
     all_resources_py=$(echo "${all_resources}" | jq -r '
       map(
@@ -656,6 +663,9 @@ install() {
     echo "Templating ${HA_ZERO_HID_CLIENT_COMPONENT_NAME} component servers into component global Python constants ${HA_ZERO_HID_CLIENT_COMPONENT_CONST_FILE}..."
     sed -i "s|<servers>|${servers_py}|g" "${HA_ZERO_HID_CLIENT_COMPONENT_CONST_FILE}"
 
+    echo "Templating ${HA_ZERO_HID_CLIENT_COMPONENT_NAME} component servers groups into component global Python constants ${HA_ZERO_HID_CLIENT_COMPONENT_CONST_FILE}..."
+    sed -i "s|<groups>|${groups_py}|g" "${HA_ZERO_HID_CLIENT_COMPONENT_CONST_FILE}"
+
     # Templating client component raw files with configurations
     echo "Configuring ${HA_ZERO_HID_CLIENT_COMPONENT_NAME} client web resources..."
 
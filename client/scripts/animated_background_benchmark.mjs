@@ -0,0 +1,138 @@
+#!/usr/bin/env node
+// Compares animated background scheduling: one timer per item start with immediate restarts (previous behavior)
+// against AnimationScheduler (single frame loop, frame budget, paused while background is hidden)
+// Usage: node animated_background_benchmark.mjs [items count]
+//
+// Runs on a simulated clock (no browser): each item animation start costs a fixed main thread time, animations
+// run on compositor until their finish event. Reports main thread wake-ups (timers, frames and finish events callbacks),
+// animations starts, and busiest frame (main thread time).
+
+import { readFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+const FRAME_DURATION = 1000 / 60;   // milliseconds
+const START_COST = 0.3;             // milliseconds of main thread per animation start (keyframes generation + animate())
+const SIMULATED_DURATION = 120000;  // milliseconds
+const HIDDEN_FROM = 60000;          // milliseconds: background scrolled out of view (or page hidden)...
+const HIDDEN_TO = 90000;            // ...until
+const DELAY = [0, 5000];            // milliseconds (fall animation defaults)
+const DURATION = [10000, 20000];    // milliseconds
+
+// Simulated clock and host callbacks (timers, animation frames, animations finish events)
+let now = 0;
+let nextId = 1;
+let events = [];
+let counters;
+
+function addEvent(at, type, callback) {
+  const event = { "id": nextId++, "at": at, "type": type, "callback": callback };
+  events.push(event);
+  return event;
+}
+
+function removeEvent(id) {
+  events = events.filter((event) => event["id"] !== id);
+}
+
+Object.defineProperty(globalThis, "performance", { "value": { "now": () => now }, "configurable": true });
+globalThis.setTimeout = (callback, delay) => addEvent(now + Math.max(0, delay || 0), "timer", callback)["id"];
+globalThis.clearTimeout = (id) => { if (id) removeEvent(id); };
+globalThis.requestAnimationFrame = (callback) => addEvent((Math.floor(now / FRAME_DURATION + 1e-9) + 1) * FRAME_DURATION, "frame", callback)["id"];
+globalThis.cancelAnimationFrame = (id) => removeEvent(id);
+
+// Deterministic random values (same sequence for every implementation)
+let seed;
+function random() {
+  seed = (seed * 1103515245 + 12345) % 2147483648;
+  return seed / 2147483648;
+}
+function getBoundRandom(min, max) {
+  return Math.random() * (max - min) + min;
+}
+Math.random = random;
+
+function run(label, setup) {
+  now = 0;
+  events = [];
+  seed = 42;
+  counters = { "wakeups": 0, "starts": 0, "busiestFrame": 0 };
+  const frameBusy = new Map();
+  const simulation = setup();
+  addEvent(HIDDEN_FROM, "visibility", () => simulation.onVisibility?.(false));
+  addEvent(HIDDEN_TO, "visibility", () => simulation.onVisibility?.(true));
+
+  while (events.length > 0) {
+    events.sort((a, b) => a["at"] - b["at"] || a["id"] - b["id"]);
+    const event = events.shift();
+    if (event["at"] > SIMULATED_DURATION) break;
+    now = event["at"];
+
+    const start = now;
+    if (event["type"] !== "visibility") counters["wakeups"]++;
+    event["callback"]();
+
+    // Main thread time spent by event, per frame
+    const frame = Math.floor(start / FRAME_DURATION + 1e-9);
+    const busy = (frameBusy.get(frame) || 0) + (now - start);
+    frameBusy.set(frame, busy);
+    counters["busiestFrame"] = Math.max(counters["busiestFrame"], busy);
+    now = start;
+  }
+  console.log(`${label.padEnd(12)} wake-ups ${String(counters["wakeups"]).padStart(7)} | starts ${String(counters["starts"]).padStart(6)} | busiest frame ${counters["busiestFrame"].toFixed(1).padStart(6)} ms`);
+}
+
+// Animation start: costs main thread time, then finishes (compositor side) after its duration
+function startAnimation(item, onFinish) {
+  now += START_COST;
+  counters["starts"]++;
+  item["finish"] = addEvent(now + getBoundRandom(DURATION[0], DURATION[1]), "finish", onFinish);
+}
+
+// Previous behavior: one timer per item start, restart from finish event, animations never paused
+function setupTimers(count) {
+  return () => {
+    const items = Array.from({ length: count }, () => ({}));
+    const animate = (item) => startAnimation(item, () => animate(item));
+    for (const item of items) setTimeout(() => animate(item), getBoundRandom(DELAY[0], DELAY[1]));
+    return {};
+  };
+}
+
+// Scheduler: single frame loop within frame budget, restarts scheduled, everything paused while hidden
+function setupScheduler(count, AnimationScheduler) {
+  return () => {
+    const scheduler = new AnimationScheduler(null);
+    const items = Array.from({ length: count }, () => ({}));
+    const animate = (item) => startAnimation(item, () => scheduler.run(() => animate(item)));
+    for (const item of items) scheduler.schedule(getBoundRandom(DELAY[0], DELAY[1]), () => animate(item));
+    return {
+      "onVisibility": (visible) => {
+        if (visible) scheduler.resume(); else scheduler.pause();
+        for (const item of items) {
+          const finish = item["finish"];
+          if (!finish) continue;
+          if (visible) {
+            // Frozen animations resume where they stopped
+            if (finish["remaining"] !== undefined) item["finish"] = addEvent(now + finish["remaining"], "finish", finish["callback"]);
+          } else if (events.includes(finish)) {
+            removeEvent(finish["id"]);
+            finish["remaining"] = finish["at"] - now;
+          }
+        }
+      },
+    };
+  };
+}
+
+// Load frontend modules as is (web resources are not a node package)
+const webPath = join(dirname(fileURLToPath(import.meta.url)), "..", "web");
+const sortedLinkedMapSource = readFileSync(join(webPath, "utils", "sorted-linked-map.js"), "utf-8");
+const sortedLinkedMapUrl = "data:text/javascript;base64," + Buffer.from(sortedLinkedMapSource).toString("base64");
+const schedulerSource = readFileSync(join(webPath, "backgrounds", "animation-scheduler.js"), "utf-8").replace("../utils/sorted-linked-map.js", sortedLinkedMapUrl);
+const { AnimationScheduler } = await import("data:text/javascript;base64," + Buffer.from(schedulerSource).toString("base64"));
+
+const count = Number(process.argv[2]) || 300;
+console.log(`${count} items, ${SIMULATED_DURATION / 1000}s simulated (hidden from ${HIDDEN_FROM / 1000}s to ${HIDDEN_TO / 1000}s)`);
+run("timers", setupTimers(count));
+run("scheduler", setupScheduler(count, AnimationScheduler));
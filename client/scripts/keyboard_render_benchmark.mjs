@@ -0,0 +1,151 @@
+#!/usr/bin/env node
+// Compares keyboard layout switch rendering: full rebuild (previous behavior) against keyed diff (KeyedRenderer)
+// Usage: node keyboard_render_benchmark.mjs [switches count]
+//
+// Runs against a minimal DOM stand-in counting DOM operations: timings only reflect script side cost,
+// DOM operations counts (elements created, nodes inserted/removed, listeners added/removed) are what browsers pay for.
+
+import { readFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { performance } from 'node:perf_hooks';
+
+// Load frontend modules as is (web resources are not a node package)
+const webPath = join(dirname(fileURLToPath(import.meta.url)), "..", "web");
+async function importWebModule(...path) {
+  const source = readFileSync(join(webPath, ...path), "utf-8");
+  return import("data:text/javascript;base64," + Buffer.from(source).toString("base64"));
+}
+const { KeyedRenderer } = await importWebModule("utils", "keyed-renderer.js");
+const layouts = {
+  "windows US": (await importWebModule("layouts", "windows", "US.js")).layoutWindowsUs,
+  "windows FR": (await importWebModule("layouts", "windows", "FR.js")).layoutWindowsFr,
+  "android US": (await importWebModule("layouts", "android", "US.js")).layoutAndroidUs,
+  "android FR": (await importWebModule("layouts", "android", "FR.js")).layoutAndroidFr,
+};
+
+const counters = { "created": 0, "inserted": 0, "removed": 0, "listenersAdded": 0, "listenersRemoved": 0, "textUpdates": 0 };
+
+class FakeClassList {
+  _classes = new Set();
+  add(...names) { for (const name of names) this._classes.add(name); }
+  remove(...names) { for (const name of names) this._classes.delete(name); }
+  toggle(name, force) { if (force) this._classes.add(name); else this._classes.delete(name); return !!force; }
+}
+
+class FakeElement {
+  children = [];
+  parentNode = null;
+  classList = new FakeClassList();
+  _textContent = "";
+
+  constructor() {
+    counters["created"]++;
+  }
+
+  get textContent() { return this._textContent; }
+  set textContent(value) { this._textContent = value; counters["textUpdates"]++; }
+
+  set innerHTML(value) {
+    for (const child of this.children) child.parentNode = null;
+    counters["removed"] += this.children.length;
+    this.children = [];
+  }
+
+  appendChild(child) {
+    return this.insertBefore(child, null);
+  }
+
+  insertBefore(child, reference) {
+    if (child.parentNode) child.remove();
+    const index = reference ? this.children.indexOf(reference) : -1;
+    if (index < 0) this.children.push(child); else this.children.splice(index, 0, child);
+    child.parentNode = this;
+    counters["inserted"]++;
+    return child;
+  }
+
+  remove() {
+    if (!this.parentNode) return;
+    const siblings = this.parentNode.children;
+    siblings.splice(siblings.indexOf(this), 1);
+    this.parentNode = null;
+    counters["removed"]++;
+  }
+}
+
+// Cells as created by keyboard cards: button + label, with button listeners (5 per button, or 1 indexed entry when delegated)
+const LISTENERS_PER_CELL = 5;
+
+function createRow() {
+  const row = new FakeElement();
+  row.className = "keyboard-row";
+  return row;
+}
+
+function applyCell(cell, cellConfig, label) {
+  cell.id = cellConfig["code"];
+  cell.classList.toggle("special", !!cellConfig.special);
+  if (cell._width !== cellConfig.width) {
+    if (cell._width) cell.classList.remove(cell._width);
+    if (cellConfig.width) cell.classList.add(cellConfig.width);
+    cell._width = cellConfig.width;
+  }
+  cell._keyData = { ...cellConfig };
+  const text = cellConfig?.label?.[label] || cellConfig?.label?.["normal"] || "";
+  if (cell._label.textContent !== text) cell._label.textContent = text;
+}
+
+function createCell(rowConfig, cellConfig) {
+  const cell = new FakeElement();
+  cell.classList.add("key");
+  cell._label = new FakeElement();
+  cell.appendChild(cell._label);
+  applyCell(cell, cellConfig, "normal");
+  counters["listenersAdded"] += LISTENERS_PER_CELL;
+  return cell;
+}
+
+// Previous behavior: listeners cleared, container emptied, every row and cell created again
+function renderFull(container, layout) {
+  counters["listenersRemoved"] += LISTENERS_PER_CELL * container.children.reduce((sum, row) => sum + row.children.length, 0);
+  container.innerHTML = '';
+  for (const rowConfig of layout.rows) {
+    const row = createRow(rowConfig);
+    for (const cellConfig of rowConfig.cells) {
+      row.appendChild(createCell(rowConfig, cellConfig));
+    }
+    container.appendChild(row);
+  }
+}
+
+function createKeyedRenderer() {
+  return new KeyedRenderer(null, {
+    "createRow": createRow,
+    "createCell": createCell,
+    "updateCell": (cell, rowConfig, cellConfig) => applyCell(cell, cellConfig, "normal"),
+    "removeCell": (cell) => { counters["listenersRemoved"] += LISTENERS_PER_CELL; cell.remove(); },
+  });
+}
+
+function run(label, switches, names, render) {
+  for (const key of Object.keys(counters)) counters[key] = 0;
+  const start = performance.now();
+  for (let i = 0; i < switches; i++) {
+    render(layouts[names[i % names.length]]);
+  }
+  const elapsed = performance.now() - start;
+  const perSwitch = (value) => (value / switches).toFixed(1).padStart(7);
+  console.log(`${label.padEnd(34)} ${(elapsed / switches * 1000).toFixed(1).padStart(8)} us | created ${perSwitch(counters["created"])} | inserted ${perSwitch(counters["inserted"])} | removed ${perSwitch(counters["removed"])} | listeners +${perSwitch(counters["listenersAdded"])} -${perSwitch(counters["listenersRemoved"])} | text ${perSwitch(counters["textUpdates"])}`);
+}
+
+const switches = Number(process.argv[2]) || 2000;
+console.log(`${switches} layout switches (per switch averages)`);
+for (const names of [["windows US", "windows FR"], ["android US", "android FR"], ["windows US", "android FR"]]) {
+  const fullContainer = new FakeElement();
+  run(`${names.join(" <-> ")}: full`, switches, names, (layout) => renderFull(fullContainer, layout));
+
+  const keyedContainer = new FakeElement();
+  const renderer = createKeyedRenderer();
+  run(`${names.join(" <-> ")}: keyed`, switches, names, (layout) => renderer.render(keyedContainer, layout));
+}
@@ -0,0 +1,127 @@
+#!/usr/bin/env node
+// Compares SortedLinkedMap against previous implementation (linear insertion point scan, filtered delete)
+// Usage: node sorted_linked_map_benchmark.mjs [keys count]
+
+import { readFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { performance } from 'node:perf_hooks';
+
+// Load frontend module as is (web resources are not a node package)
+const sourcePath = join(dirname(fileURLToPath(import.meta.url)), "..", "web", "utils", "sorted-linked-map.js");
+const source = readFileSync(sourcePath, "utf-8");
+const { SortedLinkedMap } = await import("data:text/javascript;base64," + Buffer.from(source).toString("base64"));
+
+class LinearSortedLinkedMap {
+  constructor(comparator = (a, b) => a < b ? -1 : a > b ? 1 : 0) {
+    this.map = new Map();
+    this.comparator = comparator;
+    this.sortedKeys = [];
+  }
+
+  set(key, value) {
+    if (this.map.has(key)) {
+      this.map.get(key).value = value;
+      return;
+    }
+    let index = 0;
+    while (index < this.sortedKeys.length && this.comparator(this.sortedKeys[index], key) < 0) {
+      index++;
+    }
+    this.sortedKeys.splice(index, 0, key);
+    const prevKey = this.sortedKeys[index - 1] ?? null;
+    const nextKey = this.sortedKeys[index + 1] ?? null;
+    this.map.set(key, { value, prev: prevKey, next: nextKey });
+    if (prevKey !== null) this.map.get(prevKey).next = key;
+    if (nextKey !== null) this.map.get(nextKey).prev = key;
+  }
+
+  get(key) {
+    return this.map.get(key)?.value;
+  }
+
+  delete(key) {
+    if (!this.map.has(key)) return;
+    const { prev, next } = this.map.get(key);
+    if (prev !== null) this.map.get(prev).next = next;
+    if (next !== null) this.map.get(next).prev = prev;
+    this.map.delete(key);
+    this.sortedKeys = this.sortedKeys.filter(k => k !== key);
+  }
+
+  *entries() {
+    for (const key of this.sortedKeys) {
+      yield [key, this.get(key)];
+    }
+  }
+
+  [Symbol.iterator]() {
+    return this.entries();
+  }
+}
+
+// Deterministic shuffled keys (same input for every implementation)
+function createKeys(count) {
+  const keys = Array.from({ length: count }, (_, index) => index + 1);
+  let seed = 42;
+  for (let index = keys.length - 1; index > 0; index--) {
+    seed = (seed * 1103515245 + 12345) % 2147483648;
+    const other = seed % (index + 1);
+    [keys[index], keys[other]] = [keys[other], keys[index]];
+  }
+  return keys;
+}
+
+function measure(label, run, repeat = 5) {
+  let best = Infinity;
+  for (let i = 0; i < repeat; i++) {
+    const start = performance.now();
+    run();
+    best = Math.min(best, performance.now() - start);
+  }
+  console.log(`${label.padEnd(44)} ${best.toFixed(2).padStart(10)} ms`);
+  return best;
+}
+
+function checkSorted(map, count) {
+  let previous = 0;
+  let size = 0;
+  for (const [key] of map) {
+    if (key <= previous) throw new Error(`Unsorted key ${key} after ${previous}`);
+    previous = key;
+    size++;
+  }
+  if (size !== count) throw new Error(`Expected ${count} keys, got ${size}`);
+}
+
+const count = Number(process.argv[2]) || 5000;
+const keys = createKeys(count);
+const entries = keys.map((key) => [key, key]);
+console.log(`${count} shuffled keys (best of 5 runs)`);
+
+for (const [name, Implementation] of [["linear", LinearSortedLinkedMap], ["binary search", SortedLinkedMap]]) {
+  measure(`${name}: insert`, () => {
+    const map = new Implementation();
+    for (const key of keys) map.set(key, key);
+    checkSorted(map, count);
+  });
+
+  const filled = new Implementation();
+  for (const key of keys) filled.set(key, key);
+  measure(`${name}: iterate`, () => {
+    let sum = 0;
+    for (const [, value] of filled) sum += value;
+    if (sum !== count * (count + 1) / 2) throw new Error("Unexpected iteration sum");
+  });
+
+  measure(`${name}: insert then delete half`, () => {
+    const map = new Implementation();
+    for (const key of keys) map.set(key, key);
+    for (let index = 0; index < count; index += 2) map.delete(keys[index]);
+  });
+}
+
+measure("binary search: bulk load", () => {
+  const map = new SortedLinkedMap(undefined, entries);
+  checkSorted(map, count);
+});
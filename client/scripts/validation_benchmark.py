@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Compares per-call validation cost of high-frequency services: voluptuous schemas vs fast validators
+# Usage: python3 validation_benchmark.py [iterations]   (requires voluptuous: pip install voluptuous)
+
+import importlib.util
+import os
+import sys
+import timeit
+
+import voluptuous as vol
+
+MIN_RANGE = -127
+MAX_RANGE = 127
+
+# Load component validators without Home Assistant
+validators_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "component", "validators.py")
+spec = importlib.util.spec_from_file_location("validators", validators_path)
+validators = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validators)
+
+# Same schemas as component (cv.string replaced by its voluptuous equivalent)
+def clamp_to_range(value, min_val, max_val):
+    try:
+        value = int(float(value))
+    except (ValueError, TypeError):
+        value = 0
+    return max(min_val, min(max_val, value))
+
+def ensure_list_or_empty(val):
+    if val is None:
+        return []
+    if isinstance(val, list):
+        return val
+    return [val]
+
+MOVE_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("si"): vol.Coerce(str),
+    vol.Required("x"): lambda v: clamp_to_range(v, MIN_RANGE, MAX_RANGE),
+    vol.Required("y"): lambda v: clamp_to_range(v, MIN_RANGE, MAX_RANGE),
+})
+
+KEYPRESS_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("si"): vol.Coerce(str),
+    vol.Optional("sendModifiers", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+    vol.Optional("sendKeys", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+})
+
+CONPRESS_SERVICE_SCHEMA = vol.Schema({
+    vol.Required("si"): vol.Coerce(str),
+    vol.Optional("sendCons", default=[]): vol.All(lambda v: v or [], ensure_list_or_empty),
+})
+
+MOVE_SERVICE_FAST_SCHEMA = validators.FastSchema(validators.create_fast_move_validator(MIN_RANGE, MAX_RANGE), MOVE_SERVICE_SCHEMA)
+KEYPRESS_SERVICE_FAST_SCHEMA = validators.FastSchema(validators.create_fast_lists_validator("sendModifiers", "sendKeys"), KEYPRESS_SERVICE_SCHEMA)
+CONPRESS_SERVICE_FAST_SCHEMA = validators.FastSchema(validators.create_fast_lists_validator("sendCons"), CONPRESS_SERVICE_SCHEMA)
+
+CASES = [
+    ("move (well-typed)", MOVE_SERVICE_SCHEMA, MOVE_SERVICE_FAST_SCHEMA, {"si": "1", "x": 12, "y": -7}),
+    ("move (float, out of range)", MOVE_SERVICE_SCHEMA, MOVE_SERVICE_FAST_SCHEMA, {"si": "1", "x": 300.5, "y": "-7"}),
+    ("keypress (well-typed)", KEYPRESS_SERVICE_SCHEMA, KEYPRESS_SERVICE_FAST_SCHEMA, {"si": "1", "sendModifiers": [2], "sendKeys": [4, 5]}),
+    ("keypress (release)", KEYPRESS_SERVICE_SCHEMA, KEYPRESS_SERVICE_FAST_SCHEMA, {"si": "1"}),
+    ("conpress (well-typed)", CONPRESS_SERVICE_SCHEMA, CONPRESS_SERVICE_FAST_SCHEMA, {"si": "1", "sendCons": [226]}),
+]
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'case':<30} {'voluptuous (us)':>16} {'fast (us)':>10} {'speedup':>8}")
+    for name, schema, fast_schema, data in CASES:
+        # Both validations must agree
+        assert schema(data) == fast_schema(data), name
+
+        schema_us = min(timeit.repeat(lambda: schema(data), number=iterations, repeat=3)) / iterations * 1_000_000
+        fast_us = min(timeit.repeat(lambda: fast_schema(data), number=iterations, repeat=3)) / iterations * 1_000_000
+        print(f"{name:<30} {schema_us:>16.3f} {fast_us:>10.3f} {schema_us / fast_us:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
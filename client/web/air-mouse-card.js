@@ -8,6 +8,10 @@ console.info("Loading air-mouse-card");
 
 export class AirMouseCard extends HTMLElement {
 
+  // Raw samples are sent by batches, then fused into mouse moves by HID server
+  static _SAMPLES_BATCH_INTERVAL = 50; // milliseconds
+  static _SAMPLES_BATCH_MAX = 32;      // samples
+
   // private properties
   _config;
   _hass;
@@ -16,6 +20,8 @@ export class AirMouseCard extends HTMLElement {
   _eventManager;
   _layoutManager;
   _resourceManager;
+  _samples = []; // Flat [alpha, beta, gamma, interval, ...] samples pending for next batch
+  _samplesTimeout = null;
 
   constructor() {
     super();
@@ -77,6 +83,7 @@ export class AirMouseCard extends HTMLElement {
     if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("disconnectedCallback()"));
     this._eventManager.disconnectedCallback();
     this.doUnregisterGlobalEvents();
+    this.clearSamples();
   }
 
   adoptedCallback() {
@@ -166,38 +173,35 @@ export class AirMouseCard extends HTMLElement {
     // Do not compute if HASS object is unavailable or if move is disabled (to limit computationnal usage of this high-frequency event)
     if (this._hass && this.isMoveEnabled()) {
 
-      // Gyroscope rotationRate (deg/s)
-      const gx = evt.rotationRate.beta || 0;  // X-axis
-      const gy = evt.rotationRate.alpha || 0; // Y-axis
-      const gz = evt.rotationRate.gamma || 0; // Z-axis
-
-      // Process gx, gy, gz
-      const cursorSpeed = this.fromHumanToCursorSpeed(this.getCursorSpeed());
-      const vx = -gz / cursorSpeed;
-      const vy = -gy / cursorSpeed;
-
-      // Filter micromovements
-      const moveTrigger = this.getDeadZone();
-      if (Math.abs(vx) > moveTrigger || Math.abs(vy) > moveTrigger) {
-
-        // Get move deltas
-        const dx = vx.toFixed(1);
-        const dy = vy.toFixed(1);
-
-        // Send mouse move to HID server
-        if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`onDeviceMotion(evt)->sendMouseMove(dx, dy): ${dx},${dy}`));
-        this.sendMouseMove(dx, dy);
+      // Gyroscope rotationRate (deg/s) and sampling interval (ms, but seconds on some older browsers)
+      const alpha = evt.rotationRate?.alpha || 0;
+      const beta = evt.rotationRate?.beta || 0;
+      const gamma = evt.rotationRate?.gamma || 0;
+      const interval = (evt.interval && evt.interval < 1) ? evt.interval * 1000 : (evt.interval || 0);
+
+      // Queue raw sample: smoothing, dead zone and acceleration are applied by HID server
+      this._samples.push(alpha, beta, gamma, interval);
+      if (this._samples.length >= this.constructor._SAMPLES_BATCH_MAX * 4) {
+        this.sendSamples();
+      } else if (!this._samplesTimeout) {
+        this._samplesTimeout = setTimeout(() => this.sendSamples(), this.constructor._SAMPLES_BATCH_INTERVAL);
       }
     }
   }
 
-  // Scales the cursor speed from human (1 slowest, 10 fastest) to cursor (10 slowest, 2 fastest)
-  fromHumanToCursorSpeed(speed) {
-    return this.toTargetScale(10, 2, 1, 10, speed); // 10 + (2 - 10) * (humanSpeed - 1) / (10 - 1) === 10 + (humanSpeed - 1) * -8 / 9 
+  sendSamples() {
+    const samples = this._samples;
+    this.clearSamples();
+    if (samples.length === 0) return;
+
+    if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`sendSamples(): ${samples.length / 4} samples`));
+    this.sendMouse("airmouse", { "samples": samples, "speed": this.getCursorSpeed(), "dead_zone": this.getDeadZone() });
   }
 
-  toTargetScale(targetSlowest, targetFastest, humanSlowest, humanFastest, humanValue) {
-    return targetSlowest + (humanValue - humanSlowest) * (targetFastest - targetSlowest) / (humanFastest - humanSlowest);
+  clearSamples() {
+    clearTimeout(this._samplesTimeout);
+    this._samplesTimeout = null;
+    this._samples = [];
   }
 
   // configuration defaults
@@ -216,10 +220,6 @@ export class AirMouseCard extends HTMLElement {
     return 1;
   }
 
-  sendMouseMove(dx, dy) {
-    this.sendMouse("move", { "x": dx, "y": dy, });
-  }
-
   sendMouse(serviceName, serviceArgs) {
     this._eventManager.callComponentServiceWithServerId(serviceName, serviceArgs);
   }
@@ -3,9 +3,11 @@ import { Logger } from './utils/logger.js';
 import { EventManager } from './utils/event-manager.js';
 import { ResourceManager } from './utils/resource-manager.js';
 import { LayoutManager } from './utils/layout-manager.js';
+import { TimerWheel } from './utils/timer-wheel.js';
+import { KeyedRenderer } from './utils/keyed-renderer.js';
 import { KeyCodes } from './utils/keycodes.js';
 import { ConsumerCodes } from './utils/consumercodes.js';
-import * as layoutsAndroid from './layouts/android/index.js';
+import { layoutsAndroid } from './layouts/android/index.js';
 
 console.info("Loading android-keyboard-card");
 
@@ -91,10 +93,12 @@ export class AndroidKeyboardCard extends HTMLElement {
   _eventManager;
   _layoutManager;
   _resourceManager;
+  _renderer;
   _pressedModifiers = new Set();
   _pressedKeys = new Set();
   _pressedConsumers = new Set();
   _popinTimeouts = new Map();
+  _timerWheel = TimerWheel.getShared(); // Shared long-press/repeat timers
 
   constructor() {
     super();
@@ -103,6 +107,12 @@ export class AndroidKeyboardCard extends HTMLElement {
     this._eventManager = new EventManager(this);
     this._layoutManager = new LayoutManager(this, layoutsAndroid);
     this._resourceManager = new ResourceManager(this, import.meta.url);
+    this._renderer = new KeyedRenderer(this, {
+      "createRow": this.doRenderRow.bind(this),
+      "createCell": this.doRenderCell.bind(this),
+      "updateCell": this.doPatchCell.bind(this),
+      "removeCell": this.doRemoveCell.bind(this),
+    });
 
     this._currentMode = this.constructor._STATUS_MAP["init"]["mode"];
     this._currentState = this.constructor._STATUS_MAP["init"]["state"];
@@ -182,7 +192,7 @@ export class AndroidKeyboardCard extends HTMLElement {
     const statusLabel = this.getStatusCurrentLabel();
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace("doUpdateCells(statusActions, statusLabel):", statusActions, statusLabel));
 
-    for (const cell of this._elements.cells) {
+    for (const cell of (this._elements.cells ?? [])) {
 
       const cellConfig = this._layoutManager.getElementData(cell);
       if (!cellConfig) continue;
@@ -212,7 +222,8 @@ export class AndroidKeyboardCard extends HTMLElement {
   // Synchronize cell label with given mode and state
   // using configured given label selection mode
   doUpdateCellLabel(cell, cellConfig, statusLabel) {
-    cell._label.textContent = this.getLabel(cellConfig, statusLabel);
+    const label = this.getLabel(cellConfig, statusLabel);
+    if (cell._label.textContent !== label) cell._label.textContent = label;
   }
 
   // jobs
@@ -471,28 +482,17 @@ export class AndroidKeyboardCard extends HTMLElement {
 
   doUpdateLayout() {
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace("doUpdateLayout() + this._currentMode, this._currentState", this._currentMode, this._currentState));
-    this.doResetLayout();
-    this.doCreateLayout();
+    this._layoutManager.whenLayoutLoaded(() => {
+      this.doResetLayout();
+      this.doCreateLayout();
+    });
   }
 
   doResetLayout() {
     // Reset popin (if any)
     this.doResetPopin();
 
-    // Clear previous listeners
-    this._eventManager.clearListeners("layoutContainer");
-
-    // Clear existing layout content from DOM
-    this._elements.container.innerHTML = '';
-
-    // Reset cells contents elements (if any)
-    this._elements.cellContents = []
-
-    // Reset cells elements (if any)
-    this._elements.cells = []
-
-    // Reset rows elements (if any)
-    this._elements.rows = []
+    // Cells are kept: next layout rendering reuses them (see doCreateLayout)
 
     // Reset attached layout
     this._layoutManager.resetAttachedLayout();
@@ -502,30 +502,23 @@ export class AndroidKeyboardCard extends HTMLElement {
     // Mark configured layout as attached
     this._layoutManager.configuredLayoutAttached();
 
-    // Create rows
-    for (const rowConfig of this._layoutManager.getLayout().rows) {
-      const row = this.doRow(rowConfig);
-      this.doStyleRow();
-      this.doAttachRow(row);
-      this.doQueryRowElements();
-      this.doListenRow();
-    }
+    // Render rows and cells: cells of previous layout are reused by code (only changed attributes, data and labels are updated)
+    const rendered = this._renderer.render(this._elements.container, this._layoutManager.getLayout());
+    this._elements.rows = rendered["rows"];
+    this._elements.cells = rendered["cells"];
+  }
+
+  doRenderRow(rowConfig) {
+    const row = this.doRow(rowConfig);
+    this.doStyleRow();
+    this.doQueryRowElements();
+    this.doListenRow();
+    return row;
   }
 
   doRow(rowConfig) {
     const row = document.createElement("div");
-    this._elements.rows.push(row);
     row.className = "keyboard-row";
-
-    // Create cells
-    for (const cellConfig of rowConfig.cells) {
-      const cell = this.doCell(rowConfig, cellConfig);
-      this.doStyleCell();
-      this.doAttachCell(row, cell);
-      this.doQueryCellElements();
-      this.doListenCell(cell);
-    }
-
     return row;
   }
 
@@ -533,10 +526,6 @@ export class AndroidKeyboardCard extends HTMLElement {
     // Nothing to do here: already included into card style
   }
 
-  doAttachRow(row) {
-    this._elements.container.appendChild(row);
-  }
-
   doQueryRowElements() {
     // Nothing to do here: element already referenced and sub-elements already are included by them
   }
@@ -552,12 +541,8 @@ export class AndroidKeyboardCard extends HTMLElement {
 
     // Create cell
     const cell = document.createElement("button");
-    this._elements.cells.push(cell);
-    cell.id = cellConfig["code"];
     cell.classList.add("key");
-    if (cellConfig.special) cell.classList.add("special");
-    if (cellConfig.width) cell.classList.add(cellConfig["width"]);
-    if (cellConfig.code.startsWith("SPACER_")) cell.classList.add("spacer"); // Disable actions on spacers
+    this.doCellAttributes(cell, cellConfig);
     this.setCellData(cell, cellConfig, overrideCellConfig);
 
     // Create cell content
@@ -573,12 +558,42 @@ export class AndroidKeyboardCard extends HTMLElement {
     return cell;
   }
 
-  doStyleCell() {
-    // Nothing to do here: already included into card style
+  doRenderCell(rowConfig, cellConfig) {
+    const cell = this.doCell(rowConfig, cellConfig);
+    this.doStyleCell();
+    this.doQueryCellElements();
+    this.doListenCell(cell);
+    return cell;
   }
 
-  doAttachCell(row, cell) {
-    row.appendChild(cell);
+  // Cell reused from previous layout: listeners and content elements are kept, only layout dependent attributes, data and label are updated
+  doPatchCell(cell, rowConfig, cellConfig) {
+    const overrideCellConfig = { "popinConfig": this.createPopinConfig(cellConfig) };
+    this.doCellAttributes(cell, cellConfig);
+    this._layoutManager.resetElementData(cell, this._allowedCellData);
+    this.setCellData(cell, cellConfig, overrideCellConfig);
+    this.doUpdateCell(cell, cellConfig, this.getStatusCurrentActions(), this.getStatusCurrentLabel());
+  }
+
+  doRemoveCell(cell) {
+    this._eventManager.clearTargetListeners("layoutContainer", cell);
+    cell.remove();
+  }
+
+  // Cell attributes depending on cell config
+  doCellAttributes(cell, cellConfig) {
+    cell.id = cellConfig["code"];
+    cell.classList.toggle("special", !!cellConfig.special);
+    if (cell._width !== cellConfig.width) {
+      if (cell._width) cell.classList.remove(cell._width);
+      if (cellConfig.width) cell.classList.add(cellConfig.width);
+      cell._width = cellConfig.width;
+    }
+    cell.classList.toggle("spacer", cellConfig.code.startsWith("SPACER_")); // Disable actions on spacers
+  }
+
+  doStyleCell() {
+    // Nothing to do here: already included into card style
   }
 
   doQueryCellElements() {
@@ -761,7 +776,7 @@ export class AndroidKeyboardCard extends HTMLElement {
   }
 
   addPopinTimeout(evt) {
-    return setTimeout(() => {
+    return this._timerWheel.schedule(this.getTriggerLongClickDelay(), () => { // long-press duration
       const popinEntry = this._popinTimeouts.get(evt.pointerId);
       if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`popinTimeout() + popinEntry:`, popinEntry));
 
@@ -780,12 +795,12 @@ export class AndroidKeyboardCard extends HTMLElement {
         // Show popin
         this.doShowPopin(evt, cell);
       }
-    }, this.getTriggerLongClickDelay()); // long-press duration
+    });
   }
 
   clearPopinTimeout(evt) {
     const popinTimeout = this._popinTimeouts.get(evt.pointerId)?.["popin-timeout"];
-    if (popinTimeout) clearTimeout(popinTimeout);
+    this._timerWheel.cancel(popinTimeout);
   }
 
   getPopinConfig(cell) {
@@ -3,11 +3,12 @@ import { Logger } from './utils/logger.js';
 import { EventManager } from './utils/event-manager.js';
 import { ResourceManager } from './utils/resource-manager.js';
 import { LayoutManager } from './utils/layout-manager.js';
+import { TimerWheel } from './utils/timer-wheel.js';
 import { KeyCodes } from './utils/keycodes.js';
 import { ConsumerCodes } from './utils/consumercodes.js';
 import { androidRemoteCardConfig, androidRemoteCardStyles } from './configs/android-remote-card-config.js';
 import { iconsConfig } from './configs/icons-config.js';
-import * as layoutsRemote from './layouts/remote/index.js';
+import { layoutsRemote } from './layouts/remote/index.js';
 
 // <ha_resources_version> dynamically injected at install time
 import { AndroidKeyboardCard } from './android-keyboard-card.js?v=<ha_resources_version>';
@@ -71,6 +72,7 @@ class AndroidRemoteCard extends HTMLElement {
   _overrideRepeatedTimeouts = new Map();
   _overrideLongPressTimeouts = new Map();
   _moreInfoLongPressTimeouts = new Map();
+  _timerWheel = TimerWheel.getShared(); // Shared long-press/repeat timers
   _sidePanelVisible = false;
   _bottomPanelVisible = false;
   _currentServerConfig;
@@ -1063,8 +1065,13 @@ class AndroidRemoteCard extends HTMLElement {
   }
 
   doUpdateLayout() {
-    this.doResetLayout();
-    this.doCreateLayout();
+    this._layoutManager.whenLayoutLoaded((deferred) => {
+      this.doResetLayout();
+      this.doCreateLayout();
+
+      // Overridables were updated before layout was loaded: apply them to new cells
+      if (deferred) this.doUpdateCellsVisualAndState();
+    });
   }
 
   doResetLayout() {
@@ -2290,7 +2297,7 @@ class AndroidRemoteCard extends HTMLElement {
   }
 
   addMoreInfoLongPressTimeout(evt) {
-    return setTimeout(() => {
+    return this._timerWheel.schedule(this.getTriggerLongClickDelay(), () => { // long-press duration
       const moreInfoLongPressEntry = this._moreInfoLongPressTimeouts.get(evt.pointerId);
       if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`addMoreInfoLongPressTimeout(evt) + moreInfoLongPressEntry:`, evt, moreInfoLongPressEntry));
 
@@ -2310,12 +2317,12 @@ class AndroidRemoteCard extends HTMLElement {
         if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`addMoreInfoLongPressTimeout(evt) + moreInfoLongPressEntry: executing more info action...`, evt, moreInfoLongPressEntry));
         this.executeMoreInfo(addonCell);
       }
-    }, this.getTriggerLongClickDelay()); // long-press duration
+    });
   }
 
   clearMoreInfoLongPressTimeout(evt) {
     const timeout = this._moreInfoLongPressTimeouts.get(evt.pointerId)?.["timeout"];
-    if (timeout) clearTimeout(timeout);
+    this._timerWheel.cancel(timeout);
   }
   
   executeMoreInfo(addonCell) {
@@ -2660,7 +2667,7 @@ class AndroidRemoteCard extends HTMLElement {
   }
 
   addOverrideLongPressTimeout(evt) {
-    return setTimeout(() => {
+    return this._timerWheel.schedule(this.getTriggerLongClickDelay(), () => { // long-press duration
       const overrideLongPressEntry = this._overrideLongPressTimeouts.get(evt.pointerId);
       if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`addOverrideLongPressTimeout(evt) + overrideLongPressEntry:`, evt, overrideLongPressEntry));
 
@@ -2688,12 +2695,12 @@ class AndroidRemoteCard extends HTMLElement {
         }
 
       }
-    }, this.getTriggerLongClickDelay()); // long-press duration
+    });
   }
 
   clearOverrideLongPressTimeout(evt) {
     const timeout = this._overrideLongPressTimeouts.get(evt.pointerId)?.["timeout"];
-    if (timeout) clearTimeout(timeout);
+    this._timerWheel.cancel(timeout);
   }
 
   setupOverrideRepeatedTimeout(evt, btn, overridetype) {
@@ -2707,7 +2714,7 @@ class AndroidRemoteCard extends HTMLElement {
   }
 
   addOverrideRepeatedTimeout(evt, triggerDelay) {
-    return setTimeout(() => {
+    return this._timerWheel.schedule(triggerDelay, () => { // next override action duration
       const overrideRepeatedTriggerEntry = this._overrideRepeatedTimeouts.get(evt.pointerId);
       if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`addOverrideRepeatedTimeout(evt, triggerDelay)`, evt, triggerDelay));
 
@@ -2737,12 +2744,12 @@ class AndroidRemoteCard extends HTMLElement {
           "timeout": this.addOverrideRepeatedTimeout(evt, nextTriggerDelay)  // New delay before next override action
         });
       }
-    }, triggerDelay); // next override action duration
+    });
   }
 
   clearOverrideRepeatedTimeout(evt) {
     const timeout = this._overrideRepeatedTimeouts.get(evt.pointerId)?.["timeout"];
-    if (timeout) clearTimeout(timeout);
+    this._timerWheel.cancel(timeout);
   }
 
   executeButtonOverride(btn, pressType) {
@@ -374,6 +374,7 @@ class ArrowPadCard extends HTMLElement {
     return {
       layout: "common",
       haptic: true,
+      key_repeat: false,
       log_level: "warn",
       log_pushback: false,
       buttons_overrides: {}
@@ -602,17 +603,25 @@ class ArrowPadCard extends HTMLElement {
 
   // Send all current pressed modifiers and keys to HID keyboard
   sendKeyboardUpdate() {
-    this._eventManager.callComponentServiceWithServerId("keypress", {
+    const data = {
       sendModifiers: Array.from(this._pressedModifiers),
       sendKeys: Array.from(this._pressedKeys),
-    });
+    };
+    // Held keys repeated by server until next update (release)
+    const keyRepeat = this._layoutManager.getKeyRepeat();
+    if (keyRepeat && data.sendKeys.length > 0) data.repeat = keyRepeat;
+    this._eventManager.callComponentServiceWithServerId("keypress", data);
   }
 
   // Send all current pressed modifiers and keys to HID keyboard
   sendConsumerUpdate() {
-    this._eventManager.callComponentServiceWithServerId("conpress", {
+    const data = {
       sendCons: Array.from(this._pressedConsumers),
-    });
+    };
+    // Held consumer keys repeated by server until next update (release)
+    const keyRepeat = this._layoutManager.getKeyRepeat();
+    if (keyRepeat && data.sendCons.length > 0) data.repeat = keyRepeat;
+    this._eventManager.callComponentServiceWithServerId("conpress", data);
   }
 
 }
@@ -6,7 +6,8 @@ import { LayoutManager } from '../utils/layout-manager.js';
 import { SortedLinkedMap } from '../utils/sorted-linked-map.js';
 import { AnimationGroup } from './animation-group.js';
 import { AnimationEvent } from './animation-event.js';
-import * as items from './items/index.js';
+import { AnimationScheduler } from './animation-scheduler.js';
+import { itemsCreators } from './items/index.js';
 
 export class AnimatedBackground extends HTMLElement {
 
@@ -18,8 +19,12 @@ export class AnimatedBackground extends HTMLElement {
   _eventManager;
   _layoutManager;
   _resourceManager;
+  _scheduler;
 
   _resizeObserver;
+  _intersectionObserver;
+  _visibilityListener;
+  _isIntersecting = true;
   _screenWidth;
   _screenHeight;
   _startAnimateTimeout;
@@ -31,6 +36,7 @@ export class AnimatedBackground extends HTMLElement {
     this._eventManager = new EventManager(this);
     this._layoutManager = new LayoutManager(this, {});
     this._resourceManager = new ResourceManager(this, import.meta.url);
+    this._scheduler = new AnimationScheduler(this);
 
     this.doCard();
     this.doStyle();
@@ -64,6 +70,7 @@ export class AnimatedBackground extends HTMLElement {
 
   connectedCallback() {
     if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("connectedCallback()"));
+    this.doListenVisibility();
     this.doUpdateConfig();
   }
 
@@ -72,7 +79,9 @@ export class AnimatedBackground extends HTMLElement {
     if (this._resizeObserver) {
       this._resizeObserver.disconnect();
     }
+    this.doUnlistenVisibility();
     this.doResetLayout();
+    this.doClearItemsPool();
   }
 
   adoptedCallback() {
@@ -95,6 +104,10 @@ export class AnimatedBackground extends HTMLElement {
     return this._layoutManager.getFromConfigOrDefaultConfig("enable");
   }
 
+  getFrameBudget() {
+    return this._layoutManager.getFromConfigOrDefaultConfig("frame_budget");
+  }
+
   getGroups() {
     return this._elements.groups;
   }
@@ -109,6 +122,7 @@ export class AnimatedBackground extends HTMLElement {
     this._elements.svg.setAttribute('xmlns', 'http://www.w3.org/2000/svg');
     this._elements.groups = new Set();
     this._elements.zIndexedItems = new SortedLinkedMap();
+    this._elements.itemsPool = new Map(); // item signature -> released items (detached, ready for reuse)
   }
 
   doStyle() {
@@ -161,6 +175,55 @@ export class AnimatedBackground extends HTMLElement {
     this.doResizeBackground();
   }
 
+  doListenVisibility() {
+    // Pause animations while page is hidden, or while background is scrolled out of view
+    if (!this._visibilityListener) {
+      this._visibilityListener = this._eventManager.addVisibilityChangeListener(document, this.onVisibilityChange.bind(this));
+    }
+    if (!this._intersectionObserver && typeof IntersectionObserver !== "undefined") {
+      this._intersectionObserver = new IntersectionObserver(this.onIntersection.bind(this));
+    }
+    this._isIntersecting = true; // until observer tells otherwise
+    this._intersectionObserver?.observe(this);
+    this.doUpdatePlayState();
+  }
+
+  doUnlistenVisibility() {
+    this._eventManager.removeListener(this._visibilityListener);
+    this._visibilityListener = null;
+    this._intersectionObserver?.disconnect();
+  }
+
+  onVisibilityChange() {
+    this.doUpdatePlayState();
+  }
+
+  onIntersection(entries) {
+    for (const entry of entries) {
+      this._isIntersecting = entry.isIntersecting;
+    }
+    this.doUpdatePlayState();
+  }
+
+  isVisible() {
+    return document.visibilityState !== "hidden" && this._isIntersecting;
+  }
+
+  doUpdatePlayState() {
+    const visible = this.isVisible();
+    if (visible === !this._scheduler.isPaused()) return;
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug(`doUpdatePlayState(): ${visible ? "resuming" : "pausing"} animations`, this._scheduler.getStats()));
+
+    // Scheduled animations starts are held, running animations are frozen (no more frames produced)
+    if (visible) this._scheduler.resume(); else this._scheduler.pause();
+    for (const group of this.getGroups()) {
+      for (const animation of group.getAnimations()) {
+        if (visible && animation.playState === "paused") animation.play();
+        if (!visible && animation.playState === "running") animation.pause();
+      }
+    }
+  }
+
   doResizeBackground() {
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace('doResizeBackground()'));
     const width = this.offsetWidth;
@@ -186,6 +249,9 @@ export class AnimatedBackground extends HTMLElement {
 
     // Reset items
     this.doResetZIndexedItems();
+
+    // Forget scheduled animations starts
+    this._scheduler.clear();
   }
 
   doResetGroups() {
@@ -202,14 +268,14 @@ export class AnimatedBackground extends HTMLElement {
     const animations = group.getAnimations();
     const items = group.getItems();
 
-    // Finish all animations now
+    // Cancel all animations now (no finish event: items are not animated again)
     for (const animation of animations) {
-      animation.finish();
+      animation.cancel();
     }
 
-    // Remove old items from DOM
+    // Remove old items from DOM, keeping them for reuse
     for (const item of items) {
-      item.remove();
+      this.releaseItem(item);
     }
 
     // Reset items and animations arrays
@@ -260,11 +326,23 @@ export class AnimatedBackground extends HTMLElement {
       }
     }
 
-    // Wait for debounce time to expire before creating new fallings
+    // Wait for debounce time to expire (and used items to be loaded) before creating new fallings
     clearTimeout(this._startAnimateTimeout);
+    this._startAnimateTimeout = null;
     if (this.getGroups().size > 0) {
-      this._startAnimateTimeout = this.addStartAnimateTimeout();
+      const itemsLoading = this.loadItemsCreators(this.getGroups());
+      this._startAnimateTimeout = this.addStartAnimateTimeout(itemsLoading);
+    }
+  }
+
+  // Load creators of items used by groups only (other items are never loaded)
+  loadItemsCreators(groups) {
+    const names = new Set();
+    for (const group of groups) {
+      const name = this.getItemName(group.getShape());
+      if (itemsCreators.has(name)) names.add(name);
     }
+    return itemsCreators.loadAll(names);
   }
   
   createNamedGroups(groupNames) {
@@ -277,11 +355,21 @@ export class AnimatedBackground extends HTMLElement {
     }
   }
 
-  addStartAnimateTimeout() {
-    return setTimeout(() => {
-      // Wait for layout to be ready before creating new fallings
-      requestAnimationFrame(this.doCreateAnimateds.bind(this));
+  addStartAnimateTimeout(itemsLoading) {
+    const startAnimateTimeout = setTimeout(() => {
+      itemsLoading
+        .then(() => {
+          // Skip outdated loading (layout updated meanwhile)
+          if (this._startAnimateTimeout !== startAnimateTimeout) return;
+
+          // Wait for layout to be ready before creating new fallings
+          requestAnimationFrame(this.doCreateAnimateds.bind(this));
+        })
+        .catch((err) => {
+          if (this.getLogger().isErrorEnabled()) console.error(...this.getLogger().error('Cannot load animated items:', err));
+        });
     }, this.getDebounceTrigger()); // long-press duration
+    return startAnimateTimeout;
   }
 
   doCreateGroup(animationName, animationConfig) {
@@ -306,10 +394,17 @@ export class AnimatedBackground extends HTMLElement {
 
   createAnimateds() {
     this.doResetZIndexedItems();
+    this._scheduler.clear();
+    this._scheduler.setFrameBudget(this.getFrameBudget());
     for (const group of this.getGroups()) {
       this.doResetGroup(group);
+    }
+    for (const group of this.getGroups()) {
       this.doCreateAnimatedGroup(group);
     }
+
+    // Items left in pool are no longer used by any group
+    this.doClearItemsPool();
   }
 
   doCreateAnimatedGroup(group) {
@@ -341,7 +436,7 @@ export class AnimatedBackground extends HTMLElement {
       // Insert before first item with next zIndex (so new item will appear behind first item with next zIndex)
       this._elements.svg.insertBefore(item, nextZIndexItem);
       const delay = group.getAnimation().getDelay();
-      setTimeout(() => this.animateItem(group, item), this.getBoundRandom(delay[0], delay[1]));
+      this._scheduler.schedule(this.getBoundRandom(delay[0], delay[1]), this.animateItem.bind(this, group, item));
     }
   }
 
@@ -410,17 +505,23 @@ export class AnimatedBackground extends HTMLElement {
     if (animationConfig.getName() === 'translate') steps = this.getStepsTranslate(xStart, yStart, xEnd, yEnd);
     if (!steps) return; // Unknown animation type
 
-    // Set item start position
-    item.setAttribute("transform", `translate(${xStart}, ${yStart})`);
+    // Replace previous animation of item (kept until now: item stays at its end position)
+    if (item._animation) {
+      item._animation.cancel();
+      group.getAnimations().delete(item._animation);
+    }
 
     // Animate item using prepared animation steps + duration + in/out effect
-    const animation = item.animate(steps, { duration: duration, easing: "ease-in-out" });
+    // (transform only: runs on compositor, without layout nor attributes updates)
+    const animation = item.animate(steps, { duration: duration, easing: "ease-in-out", fill: "forwards" });
+    item._animation = animation;
+    if (this._scheduler.isPaused()) animation.pause();
 
     // Reference animation
     group.getAnimations().add(animation);
 
     // Add animation ready/stop listeners
-    animation.ready.then(this.onAnimationReady.bind(this, item));  
+    if (item.style.visibility === "hidden") animation.ready.then(this.onAnimationReady.bind(this, item));
     animation.addEventListener('finish', this.onAnimationFinish.bind(this, group, item));
   }
 
@@ -577,12 +678,10 @@ export class AnimatedBackground extends HTMLElement {
   }
 
   onAnimationFinish(group, item, evt) {
-    const animation = evt.target;
-    animation.cancel();
-    group.getAnimations().delete(animation);
+    if (item._animation !== evt.target) return; // Outdated animation
     if (this.getGroups().has(group) && group.getItems().has(item)) {
       if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`onAnimationFinish(group, item, evt): restarting animateItem(group, item) for group ${group.getGuid()}...`, group, item, evt));
-      this.animateItem(group, item); // loop only if config did not changed
+      this._scheduler.run(this.animateItem.bind(this, group, item)); // loop only if config did not changed (restarts beyond frame budget are deferred)
     } else {
       if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`onAnimationFinish(group, item, evt): aborting animateItem(group, item) for group ${group.getGuid()}...`, group, item, evt));
     }
@@ -603,13 +702,25 @@ export class AnimatedBackground extends HTMLElement {
     return str ? str.charAt(0).toUpperCase() + str.slice(1).toLowerCase() : null;
   }
 
+  getItemName(shape) {
+    return shape ? String(shape).toLowerCase() : null;
+  }
+
   createItem(name, colors, opacities, scales) {
-    const nameParts = name ? name.split('-') : [];
-    const functionName = `create${nameParts.map(namePart => this.capitalizeFirst(namePart)).join('')}`;
-    return items[functionName]?.(this.getRandomColor(colors), this.getBoundRandom(opacities[0], opacities[1]), this.getBoundRandom(scales[0], scales[1]));
+    const createItem = itemsCreators.get(this.getItemName(name));
+    return createItem?.(this.getRandomColor(colors), this.getBoundRandom(opacities[0], opacities[1]), this.getBoundRandom(scales[0], scales[1]));
+  }
+
+  // Items are only created from group shape, colors, opacities and scales: same signature items are interchangeable
+  getItemSignature(group) {
+    return JSON.stringify([this.getItemName(group.getShape()), group.getColors(), group.getOpacities(), group.getScales()]);
   }
 
   createAnimated(group) {
+    const signature = this.getItemSignature(group);
+    const pooledItem = this._elements.itemsPool.get(signature)?.pop();
+    if (pooledItem) return pooledItem;
+
     const item = this.createItem(
       group.getShape(),
       group.getColors(),
@@ -618,14 +729,32 @@ export class AnimatedBackground extends HTMLElement {
     if (!item) return null;
     item.classList.add("animated");
     item.style.visibility = "hidden";
+    item._signature = signature;
     return item;
   }
 
+  releaseItem(item) {
+    item.remove();
+    item.style.visibility = "hidden"; // until its next animation is ready
+    item._animation = null;
+    let pooledItems = this._elements.itemsPool.get(item._signature);
+    if (!pooledItems) {
+      pooledItems = [];
+      this._elements.itemsPool.set(item._signature, pooledItems);
+    }
+    pooledItems.push(item);
+  }
+
+  doClearItemsPool() {
+    this._elements.itemsPool.clear();
+  }
+
   // configuration defaults
   static getStubConfig() {
     return {
       debounce_trigger: 300,
       enable: true,
+      frame_budget: 4,
       events: {},
       animations: {}
     }
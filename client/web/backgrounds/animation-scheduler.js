@@ -0,0 +1,176 @@
+import { SortedLinkedMap } from '../utils/sorted-linked-map.js';
+
+// Define AnimationScheduler helper class:
+// runs delayed jobs (ie. items animations starts) from a single animation frame loop instead of one timer per job
+// (a single timer wakes the loop up when next job is not due soon, so that nothing runs while waiting),
+// within a per-frame time budget (due jobs beyond budget are deferred to next frame), and pausable (ie. hidden background)
+export class AnimationScheduler {
+
+  static _DEFAULT_FRAME_BUDGET = 4; // milliseconds
+  static _FRAME_DURATION = 16;       // milliseconds: next job due sooner than this is waited for by animation frames
+
+  _origin;
+  _jobs = new SortedLinkedMap(); // due time -> jobs callbacks (in scheduling order)
+  _frame = null;
+  _timeout = null;
+  _frameBudget = AnimationScheduler._DEFAULT_FRAME_BUDGET;
+  _pausedAt = null;
+  _budgetFrom = 0;         // current frame budget window start (aligned on last animation frame)
+  _budgetSpent = 0;        // milliseconds spent by jobs within current frame budget window
+  _stats = { "frames": 0, "jobs": 0, "deferred": 0 };
+
+  constructor(origin) {
+    this._origin = origin;
+  }
+
+  getLogger() {
+    return this._origin?.getLogger();
+  }
+
+  setFrameBudget(frameBudget) {
+    this._frameBudget = (Number.isFinite(frameBudget) && frameBudget > 0) ? frameBudget : this.constructor._DEFAULT_FRAME_BUDGET;
+  }
+
+  isPaused() {
+    return this._pausedAt !== null;
+  }
+
+  getSize() {
+    let size = 0;
+    for (const callbacks of this._jobs.values()) size += callbacks.length;
+    return size;
+  }
+
+  // Frames run, jobs run and due jobs deferred (over budget) since creation
+  getStats() {
+    return { ...this._stats };
+  }
+
+  // Run callback once delay (milliseconds) expired, on an animation frame
+  schedule(delay, callback) {
+    const dueAt = Math.round(performance.now() + Math.max(0, delay || 0));
+    let callbacks = this._jobs.get(dueAt);
+    if (!callbacks) {
+      callbacks = [];
+      this._jobs.set(dueAt, callbacks);
+    }
+    callbacks.push(callback);
+    this.requestFrame();
+  }
+
+  // Run callback now when current frame budget allows it (and no earlier job is waiting), otherwise on next frames
+  run(callback) {
+    const start = performance.now();
+    const dueAt = this._jobs.firstKey();
+    if (this.isPaused() || (dueAt !== null && dueAt <= start) || !this.hasBudget(start)) {
+      this.schedule(0, callback);
+      return;
+    }
+    this.runJob(callback);
+    this._budgetSpent += performance.now() - start;
+  }
+
+  // Forget every scheduled job
+  clear() {
+    this._jobs.clear();
+    this.cancelFrame();
+  }
+
+  // Stop running jobs: remaining delays are kept for resume
+  pause() {
+    if (this.isPaused()) return;
+    this._pausedAt = performance.now();
+    this.cancelFrame();
+    if (this.getLogger()?.isDebugEnabled()) console.debug(...this.getLogger().debug(`pause(): ${this.getSize()} job(s) on hold`));
+  }
+
+  resume() {
+    if (!this.isPaused()) return;
+    const pausedDuration = Math.round(performance.now() - this._pausedAt);
+    this._pausedAt = null;
+
+    // Shift due times by paused duration (jobs do not all fire at once on resume)
+    if (pausedDuration > 0 && this._jobs.size > 0) {
+      const shifted = [];
+      for (const [dueAt, callbacks] of this._jobs) shifted.push([dueAt + pausedDuration, callbacks]);
+      this._jobs = new SortedLinkedMap(undefined, shifted);
+    }
+    if (this.getLogger()?.isDebugEnabled()) console.debug(...this.getLogger().debug(`resume(): ${this.getSize()} job(s) resumed after ${pausedDuration}ms`));
+    this.requestFrame();
+  }
+
+  requestFrame() {
+    if (this._frame !== null || this.isPaused() || this._jobs.size === 0) return;
+
+    // Next job not due soon: wake up shortly before it (replaces any previous wake up)
+    const wait = this._jobs.firstKey() - performance.now() - this.constructor._FRAME_DURATION;
+    if (wait > 0) {
+      clearTimeout(this._timeout);
+      this._timeout = setTimeout(this.onTimeout.bind(this), wait);
+      return;
+    }
+    this._frame = requestAnimationFrame(this.onFrame.bind(this));
+  }
+
+  cancelFrame() {
+    if (this._frame !== null) cancelAnimationFrame(this._frame);
+    clearTimeout(this._timeout);
+    this._frame = null;
+    this._timeout = null;
+  }
+
+  onTimeout() {
+    this._timeout = null;
+    this.requestFrame();
+  }
+
+  // Budget window lasts one frame: time spent by jobs run outside frames (see run()) counts as well
+  hasBudget(now) {
+    const frames = Math.floor((now - this._budgetFrom) / this.constructor._FRAME_DURATION);
+    if (frames > 0) {
+      this._budgetFrom += frames * this.constructor._FRAME_DURATION;
+      this._budgetSpent = 0;
+    }
+    return this._budgetSpent < this._frameBudget;
+  }
+
+  runJob(callback) {
+    this._stats["jobs"]++;
+    try {
+      callback();
+    } catch (err) {
+      if (this.getLogger()?.isErrorEnabled()) console.error(...this.getLogger().error('runJob(callback): scheduled job failed:', err));
+    }
+  }
+
+  onFrame() {
+    this._frame = null;
+    this._stats["frames"]++;
+    const start = performance.now();
+    if (start - this._budgetFrom >= this.constructor._FRAME_DURATION) {
+      this._budgetFrom = start;
+      this._budgetSpent = 0;
+    }
+    const spent = this._budgetSpent;
+
+    // Run due jobs (earliest first) until frame budget is spent
+    let dueAt = this._jobs.firstKey();
+    while (dueAt !== null && dueAt <= start) {
+      const callbacks = this._jobs.get(dueAt);
+      while (callbacks.length > 0) {
+        this._budgetSpent = spent + performance.now() - start;
+        if (!this.hasBudget(start)) {
+          this._stats["deferred"] += callbacks.length;
+          this.requestFrame();
+          return;
+        }
+        this.runJob(callbacks.shift());
+        if (this.isPaused()) return;
+      }
+      this._jobs.delete(dueAt);
+      dueAt = this._jobs.firstKey();
+    }
+    this._budgetSpent = spent + performance.now() - start;
+    this.requestFrame();
+  }
+}
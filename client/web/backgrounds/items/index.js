@@ -1,14 +1,19 @@
-export { createChristmasTree } from './christmas-tree.js';
-export { createCircle        } from './circle.js';
-export { createFlower        } from './flower.js';
-export { createGhost         } from './ghost.js';
-export { createGift          } from './gift.js';
-export { createHeart         } from './heart.js';
-export { createLeave         } from './leave.js';
-export { createPumkin        } from './pumkin.js';
-export { createSnowFlake     } from './snow-flake.js';
-export { createSpider        } from './spider.js';
-export { createStarFive      } from './star-five.js';
-export { createStarFour      } from './star-four.js';
-export { createWeb           } from './web.js';
-export { createWitchHat      } from './witch-hat.js';
+import { LazyRegistry } from '../../utils/lazy-registry.js';
+
+// Items creators loaded on demand (by shape name)
+export const itemsCreators = new LazyRegistry({
+  "christmas-tree": () => import('./christmas-tree.js').then((module) => module.createChristmasTree),
+  "circle":         () => import('./circle.js'        ).then((module) => module.createCircle),
+  "flower":         () => import('./flower.js'        ).then((module) => module.createFlower),
+  "ghost":          () => import('./ghost.js'         ).then((module) => module.createGhost),
+  "gift":           () => import('./gift.js'          ).then((module) => module.createGift),
+  "heart":          () => import('./heart.js'         ).then((module) => module.createHeart),
+  "leave":          () => import('./leave.js'         ).then((module) => module.createLeave),
+  "pumkin":         () => import('./pumkin.js'        ).then((module) => module.createPumkin),
+  "snow-flake":     () => import('./snow-flake.js'    ).then((module) => module.createSnowFlake),
+  "spider":         () => import('./spider.js'        ).then((module) => module.createSpider),
+  "star-five":      () => import('./star-five.js'     ).then((module) => module.createStarFive),
+  "star-four":      () => import('./star-four.js'     ).then((module) => module.createStarFour),
+  "web":            () => import('./web.js'           ).then((module) => module.createWeb),
+  "witch-hat":      () => import('./witch-hat.js'     ).then((module) => module.createWitchHat),
+});
@@ -1,4 +1,9 @@
-export { layoutAndroidFr } from './FR.js';
-export { layoutAndroidUs } from './US.js';
-export { layoutAndroidFrRemote } from './FR-remote.js';
-export { layoutAndroidUsRemote } from './US-remote.js';
+import { LazyRegistry } from '../../utils/lazy-registry.js';
+
+// Layouts loaded on demand (by layout name)
+export const layoutsAndroid = new LazyRegistry({
+  "FR":        () => import('./FR.js').then((module) => module.layoutAndroidFr),
+  "FR-remote": () => import('./FR-remote.js').then((module) => module.layoutAndroidFrRemote),
+  "US":        () => import('./US.js').then((module) => module.layoutAndroidUs),
+  "US-remote": () => import('./US-remote.js').then((module) => module.layoutAndroidUsRemote),
+});
@@ -1,8 +1,13 @@
-export { layoutRemoteClassic } from './classic.js';
-export { layoutRemoteRightHandV1 } from './right-hand-v1.js';
-export { layoutRemoteRightHandV2 } from './right-hand-v2.js';
-export { layoutRemoteRightHandV3 } from './right-hand-v3.js';
-export { layoutRemoteRightHandV4 } from './right-hand-v4.js';
-export { layoutRemoteRightHandV5 } from './right-hand-v5.js';
-export { layoutRemoteRightHandV6 } from './right-hand-v6.js';
-export { layoutRemoteRightHandMicrophoneBeta } from './right-hand-microphone-beta.js';
+import { LazyRegistry } from '../../utils/lazy-registry.js';
+
+// Layouts loaded on demand (by layout name)
+// Note: right-hand-microphone-beta.js also declares "right-hand-v6" name, which resolves to right-hand-v6.js
+export const layoutsRemote = new LazyRegistry({
+  "classic":       () => import('./classic.js').then((module) => module.layoutRemoteClassic),
+  "right-hand-v1": () => import('./right-hand-v1.js').then((module) => module.layoutRemoteRightHandV1),
+  "right-hand-v2": () => import('./right-hand-v2.js').then((module) => module.layoutRemoteRightHandV2),
+  "right-hand-v3": () => import('./right-hand-v3.js').then((module) => module.layoutRemoteRightHandV3),
+  "right-hand-v4": () => import('./right-hand-v4.js').then((module) => module.layoutRemoteRightHandV4),
+  "right-hand-v5": () => import('./right-hand-v5.js').then((module) => module.layoutRemoteRightHandV5),
+  "right-hand-v6": () => import('./right-hand-v6.js').then((module) => module.layoutRemoteRightHandV6),
+});
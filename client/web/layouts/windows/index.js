@@ -1,2 +1,7 @@
-export { layoutWindowsFr } from './FR.js';
-export { layoutWindowsUs } from './US.js';
+import { LazyRegistry } from '../../utils/lazy-registry.js';
+
+// Layouts loaded on demand (by layout name)
+export const layoutsWindows = new LazyRegistry({
+  "FR": () => import('./FR.js').then((module) => module.layoutWindowsFr),
+  "US": () => import('./US.js').then((module) => module.layoutWindowsUs),
+});
@@ -3,11 +3,71 @@ import { Logger } from './utils/logger.js';
 import { EventManager } from './utils/event-manager.js';
 import { ResourceManager } from './utils/resource-manager.js';
 import { LayoutManager } from './utils/layout-manager.js';
+import { AudioEncoder } from './utils/audio-encoder.js';
 
 console.info("Loading microphone-card");
 
 export class MicrophoneCard extends HTMLElement {
 
+  // Audio format expected by HID server microphone: 16 kHz mono 16-bit PCM
+  static _AUDIO_SAMPLE_RATE = 16000;
+
+  // Audio frame duration range (milliseconds): one service call per frame
+  static _AUDIO_FRAME_DURATION_MIN = 10;
+  static _AUDIO_FRAME_DURATION_MAX = 200;
+
+  // Runs into audio rendering thread: resamples microphone input (browser native rate) to output rate,
+  // then packs Int16 samples into frames of configured size, each frame being transferred (not copied) to card
+  static _AUDIO_WORKLET_SOURCE = `
+    class MicProcessor extends AudioWorkletProcessor {
+      constructor(options) {
+        super();
+        const { outputSampleRate, frameSamples } = options.processorOptions;
+        this.ratio = sampleRate / outputSampleRate; // input samples per output sample
+        this.frameSamples = frameSamples;
+        this.frame = new Int16Array(frameSamples);
+        this.frameLength = 0;
+
+        // Area-average resampling state (low-pass while downsampling, carried over render quanta)
+        this.sum = 0;
+        this.weight = 0;
+      }
+
+      pushSample(value) {
+        const s = Math.max(-1, Math.min(1, value));
+        this.frame[this.frameLength++] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+        if (this.frameLength === this.frameSamples) {
+          this.port.postMessage(this.frame.buffer, [this.frame.buffer]);
+          this.frame = new Int16Array(this.frameSamples);
+          this.frameLength = 0;
+        }
+      }
+
+      process(inputs) {
+        const input = inputs[0];
+        if (input.length > 0) {
+          const channelData = input[0];
+          const ratio = this.ratio;
+          for (let i = 0; i < channelData.length; i++) {
+            const value = channelData[i];
+            let remaining = 1;
+            while (this.weight + remaining >= ratio) {
+              const part = ratio - this.weight;
+              this.pushSample((this.sum + value * part) / ratio);
+              remaining -= part;
+              this.sum = 0;
+              this.weight = 0;
+            }
+            this.sum += value * remaining;
+            this.weight += remaining;
+          }
+        }
+        return true;
+      }
+    }
+    registerProcessor('mic-processor', MicProcessor);
+  `;
+
   // private properties
   _config;
   _hass;
@@ -21,6 +81,7 @@ export class MicrophoneCard extends HTMLElement {
   _mediaStream;
   _sourceNode;
   _workletNode;
+  _audioEncoder;
   _recordedChunks;
 
   constructor() {
@@ -160,61 +221,35 @@ export class MicrophoneCard extends HTMLElement {
       statusLbl.textContent = "Starting...";
       
       // Start stream notification
-      this.startAudio();
+      this._audioEncoder = new AudioEncoder(this.getAudioCodec());
+      this.startAudio(this._audioEncoder.getCodec());
       
       startBtn.disabled = true;
       stopBtn.disabled = false;
 
       this._audioContext = new AudioContext(); // Let browser decide
 
-      await this._audioContext.audioWorklet.addModule(URL.createObjectURL(new Blob([`
-        class MicProcessor extends AudioWorkletProcessor {
-          constructor() {
-            super();
-            this.inputSampleRate = sampleRate; // whatever the browser gives us
-            this.outputSampleRate = 16000;
-            this.ratio = this.inputSampleRate / this.outputSampleRate;
-          }
-        
-          process(inputs) {
-            const input = inputs[0];
-            if (input.length > 0) {
-              const channelData = input[0];
-              const resampledLength = Math.floor(channelData.length / this.ratio);
-              const resampled = new Float32Array(resampledLength);
-              for (let i = 0; i < resampledLength; i++) {
-                const index = Math.floor(i * this.ratio);
-                resampled[i] = channelData[index];
-              }
-        
-              const pcm = new Int16Array(resampled.length);
-              for (let i = 0; i < resampled.length; i++) {
-                let s = Math.max(-1, Math.min(1, resampled[i]));
-                pcm[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
-              }
-        
-              this.port.postMessage(pcm.buffer, [pcm.buffer]);
-            }
-            return true;
-          }
-        }
-        registerProcessor('mic-processor', MicProcessor);
-      `], { type: 'application/javascript' })));
+      await this._audioContext.audioWorklet.addModule(URL.createObjectURL(new Blob([this.constructor._AUDIO_WORKLET_SOURCE], { type: 'application/javascript' })));
 
       this._mediaStream = await navigator.mediaDevices.getUserMedia({ audio: true });
             
       this._sourceNode = this._audioContext.createMediaStreamSource(this._mediaStream);
-      this._workletNode = new AudioWorkletNode(this._audioContext, 'mic-processor');
+      this._workletNode = new AudioWorkletNode(this._audioContext, 'mic-processor', {
+        "processorOptions": {
+          "outputSampleRate": this.constructor._AUDIO_SAMPLE_RATE,
+          "frameSamples": this.getAudioFrameSamples(),
+        }
+      });
 
       this._sourceNode.connect(this._workletNode);
       this._workletNode.connect(this._audioContext.destination);
       
       this._workletNode.port.onmessage = (event) => {
         if (event.data) {
-          // Send audio data to HA
-          const buffer = new Uint8Array(event.data);
-          this._recordedChunks.push(buffer);  // Save raw audio buffer
-          this.sendAudio(Array.from(buffer));
+          // Send audio frame to HA
+          const pcm = new Int16Array(event.data);
+          this._recordedChunks.push(new Uint8Array(event.data));  // Save raw audio buffer
+          this.sendAudio(pcm);
         }
       };
 
@@ -268,6 +303,7 @@ export class MicrophoneCard extends HTMLElement {
     }
     this._sourceNode = null;
     this._workletNode = null;
+    this._audioEncoder = null;
     
     // Create WAV record file and trigger download
     this.triggerWavDownload();
@@ -307,6 +343,8 @@ export class MicrophoneCard extends HTMLElement {
     return {
       layout: "",
       haptic: true,
+      audio_codec: "pcm",
+      audio_frame_duration: 40,
       log_level: "warn",
       log_pushback: false
     };
@@ -316,12 +354,26 @@ export class MicrophoneCard extends HTMLElement {
     return 3;
   }
 
-  startAudio() {
-    this._eventManager.callComponentServiceWithServerId("auxstart", {});
+  getAudioCodec() {
+    return this._layoutManager.getFromConfigOrDefaultConfig("audio_codec");
+  }
+
+  getAudioFrameDuration() {
+    return this._layoutManager.getFromConfigOrDefaultConfig("audio_frame_duration");
+  }
+
+  getAudioFrameSamples() {
+    const duration = Math.max(this.constructor._AUDIO_FRAME_DURATION_MIN, Math.min(this.constructor._AUDIO_FRAME_DURATION_MAX, Number(this.getAudioFrameDuration()) || 0));
+    return Math.round(this.constructor._AUDIO_SAMPLE_RATE * duration / 1000);
+  }
+
+  startAudio(codec) {
+    this._eventManager.callComponentServiceWithServerId("auxstart", { "codec": codec });
   }
 
-  sendAudio(buffer) {
-    this._eventManager.callComponentServiceWithServerId("aux", { "buf": buffer, });
+  sendAudio(pcm) {
+    if (!this._audioEncoder) return;
+    this._eventManager.callComponentServiceWithServerId("aux", { "b64": AudioEncoder.toBase64(this._audioEncoder.encode(pcm)) });
   }
 
   stopAudio() {
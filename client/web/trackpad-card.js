@@ -174,6 +174,11 @@ export class TrackpadCard extends HTMLElement {
     return this._layoutManager.getFromConfigOrDefaultConfig("trigger_scroll_delay");
   }
 
+  // Moves batching (0: one move per animation frame)
+  getMoveBatchInterval() {
+    return this._layoutManager.getFromConfigOrDefaultConfig("move_batch_interval");
+  }
+
   // When scroll toggle on
   getTriggerLongScrollDelay() {
     return this._layoutManager.getFromConfigOrDefaultConfig("trigger_long_scroll_delay");
@@ -832,6 +837,7 @@ export class TrackpadCard extends HTMLElement {
     if (this._layoutManager.configuredLayoutChanged()) {
       this.doUpdateLayout();
     }
+    this._eventManager.setInputBatchInterval(this.getMoveBatchInterval());
   }
 
   doUpdateHass() {
@@ -1015,7 +1021,8 @@ export class TrackpadCard extends HTMLElement {
       trigger_scroll_delay: 250,
       trigger_long_scroll_delay: 350,
       trigger_long_scroll_decrease_interval: 25,
-      trigger_long_scroll_min_interval: 75
+      trigger_long_scroll_min_interval: 75,
+      move_batch_interval: 0
     };
   }
 
@@ -1211,7 +1218,8 @@ export class TrackpadCard extends HTMLElement {
   }
 
   sendMouseMove(dx, dy) {
-    this.sendMouse("move", { "x": dx, "y": dy, }, true);
+    // Moves are batched: one service call per animation frame (or configured interval)
+    this._eventManager.queueComponentDeltaWithServerId("move", dx, dy, true);
   }
 
   sendMouseScroll(dx, dy) {
@@ -32,6 +32,13 @@ export const enTranslation = {
           "details": "See Home Assistant logs"
         }
       }
+    },
+    "info": {
+      "hid": {
+        "recovered": {
+          "message": "Raspberry PI connection restored"
+        }
+      }
     }
   }
 };
\ No newline at end of file
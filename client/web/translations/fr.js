@@ -32,6 +32,13 @@ export const frTranslation = {
           "details": "Consultez les journaux Home Assistant"
         }
       }
+    },
+    "info": {
+      "hid": {
+        "recovered": {
+          "message": "Connexion Raspberry PI rétablie"
+        }
+      }
     }
   }
 };
\ No newline at end of file
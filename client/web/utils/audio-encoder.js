@@ -0,0 +1,75 @@
+// Define AudioEncoder helper class:
+// encodes 16 kHz mono 16-bit PCM frames into audio service payloads (decoded by the HID server before being written to microphone)
+export class AudioEncoder {
+
+  // Codecs supported by integration "auxstart" service
+  static _CODEC_PCM = "pcm";   // 16-bit PCM as is (2 bytes per sample)
+  static _CODEC_ULAW = "ulaw"; // G.711 mu-law (1 byte per sample)
+  static _CODECS = new Set([AudioEncoder._CODEC_PCM, AudioEncoder._CODEC_ULAW]);
+
+  static _MULAW_BIAS = 0x84;
+  static _MULAW_CLIP = 32635;
+
+  static _BASE64_CHUNK_SIZE = 0x8000; // bytes converted per String.fromCharCode call (stays below call stack limits)
+
+  // PCM sample (offset by 32768) -> mu-law byte (built on first use, shared by every encoder)
+  static _mulawTable = null;
+
+  _codec;
+
+  constructor(codec) {
+    this._codec = this.constructor._CODECS.has(codec) ? codec : this.constructor._CODEC_PCM;
+  }
+
+  getCodec() {
+    return this._codec;
+  }
+
+  static isCodecSupported(codec) {
+    return this._CODECS.has(codec);
+  }
+
+  static linearToMulaw(sample) {
+    const sign = (sample < 0) ? 0x80 : 0x00;
+    let magnitude = Math.min(this._MULAW_CLIP, Math.abs(sample)) + this._MULAW_BIAS;
+    let exponent = 7;
+    for (let mask = 0x4000; (magnitude & mask) === 0 && exponent > 0; mask >>= 1) {
+      exponent--;
+    }
+    const mantissa = (magnitude >> (exponent + 3)) & 0x0F;
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF;
+  }
+
+  static getMulawTable() {
+    if (!this._mulawTable) {
+      const table = new Uint8Array(65536);
+      for (let i = 0; i < table.length; i++) {
+        table[i] = this.linearToMulaw(i - 32768);
+      }
+      this._mulawTable = table;
+    }
+    return this._mulawTable;
+  }
+
+  // Int16Array PCM frame -> encoded bytes (Uint8Array)
+  encode(pcm) {
+    if (this._codec === this.constructor._CODEC_ULAW) {
+      const table = this.constructor.getMulawTable();
+      const encoded = new Uint8Array(pcm.length);
+      for (let i = 0; i < pcm.length; i++) {
+        encoded[i] = table[pcm[i] + 32768];
+      }
+      return encoded;
+    }
+    return new Uint8Array(pcm.buffer, pcm.byteOffset, pcm.byteLength);
+  }
+
+  // Encoded bytes as base64 (about 1.3 characters per byte into service call JSON, against up to 4 for an int array)
+  static toBase64(bytes) {
+    let binary = "";
+    for (let i = 0; i < bytes.length; i += this._BASE64_CHUNK_SIZE) {
+      binary += String.fromCharCode.apply(null, bytes.subarray(i, i + this._BASE64_CHUNK_SIZE));
+    }
+    return btoa(binary);
+  }
+}
@@ -2,6 +2,8 @@ import { Globals } from './globals.js';
 import { Logger } from './logger.js';
 import { Localization } from './localization.js';
 import { HassEventManager } from './hass-event-manager.js';
+import { InputBatcher } from './input-batcher.js';
+import { StateMachine } from './state-machine.js';
 
 // Define EventManager helper class
 export class EventManager {
@@ -9,6 +11,7 @@ export class EventManager {
   // private init required constants
   static _HID_SERVER_ID = 'si';
   static _BUTTON_STATUS_MAP;
+  static _BUTTON_MACHINE;                     // _BUTTON_STATUS_MAP compiled transition tables (same definition layout as StateMachine)
 
   static _BUTTON_INIT = '1';                  // "init"
   static _BUTTON_STATES = '2';                // "states"
@@ -96,6 +99,7 @@ export class EventManager {
         }
       }
     };
+    this._BUTTON_MACHINE = StateMachine.compile(this._BUTTON_STATUS_MAP);
     this._POPIN_STATUS_MAP = {
       [this._POPIN_INIT]: { [this._POPIN_STATE]: this._POPIN_STATE_HIDDEN },
       [this._POPIN_STATES]: {
@@ -119,10 +123,12 @@ export class EventManager {
   _globalContainerName = '__window';
   _integrationContainerName = '__integration';
   _integrationEventName = 'ha_zero_hid';
+  _delegationContainerName = '__delegation';
 
   _origin;
   _localization;
   _hassEventManager;
+  _inputBatcher;
   _eventsMap = new Map();
   _reversedEventsMap = new Map();
   _preferedEventsNames = new Map(); // Cache for prefered discovered listeners (lookup speedup)
@@ -130,6 +136,7 @@ export class EventManager {
   _globalListeners = new Map(); // Callback with global scopes (document, window) for buttons management
   _integrationListeners = new Map(); // Callback with global scope for ha-zero-hid integration management
   _buttons = new Set(); // Managed buttons
+  _delegationRoots = new Set(); // Roots (card shadow root) listening once for all their managed buttons events
   _popins = new Set(); // Managed popins
   _arePreferencesLoading = false; // Session user preferences loading in progress lock
   _arePreferencesLoaded = false; // Session user preferences loaded once lock
@@ -140,6 +147,7 @@ export class EventManager {
     this._origin = origin;
     this._localization = new Localization(this);
     this._hassEventManager = new HassEventManager(this);
+    this._inputBatcher = new InputBatcher(this);
 
     // Mapping for "managed" event names with their "real" event names counterparts 
     // that might be supported by device - or not (by preference order)
@@ -303,6 +311,14 @@ export class EventManager {
 
     this.initButtonState(target, callbacks);
 
+    // Buttons inside card are handled by delegated listeners at card root: button is only indexed
+    const root = this.getButtonsDelegationRoot(options);
+    if (root) {
+      this.addButtonsDelegatedListeners(root);
+      this.getButtonData(target).delegated = true;
+      return [this.registerListener(this.createDelegatedListener(target), containerName)];
+    }
+
     const listeners = [];
     listeners.push(this.addPointerEnterListenerToContainer(containerName, target, this.onButtonPointerEnter.bind(this), options));
     listeners.push(this.addPointerLeaveListenerToContainer(containerName, target, this.onButtonPointerLeave.bind(this), options));
@@ -312,6 +328,89 @@ export class EventManager {
     return listeners;
   }
 
+  // Card root (shadow root), when available and no specific listener options requested
+  getButtonsDelegationRoot(options) {
+    if (options) return null;
+    return this._origin?.shadowRoot ?? null;
+  }
+
+  // Delegated listeners are added once per root, and removed with their root (card lifetime)
+  addButtonsDelegatedListeners(root) {
+    if (this._delegationRoots.has(root)) return;
+    this._delegationRoots.add(root);
+
+    // Enter/leave events do not bubble: over/out events (which do) are filtered by related target instead
+    this.addDelegatedEventListener(root, this.onDelegatedButtonPointerOver.bind(this, root), "EVT_POINTER_OVER");
+    this.addDelegatedEventListener(root, this.onDelegatedButtonPointerOut.bind(this, root), "EVT_POINTER_OUT");
+    this.addDelegatedEventListener(root, this.onDelegatedButtonPointerCancel.bind(this, root), "EVT_POINTER_CANCEL");
+    this.addDelegatedEventListener(root, this.onDelegatedButtonPointerDown.bind(this, root), "EVT_POINTER_DOWN");
+    this.addDelegatedEventListener(root, this.onDelegatedButtonPointerUp.bind(this, root), "EVT_POINTER_UP");
+  }
+
+  // Shadow root has no "on<event>" handlers to detect supported events from: detection is done on its host
+  addDelegatedEventListener(root, callback, managedEventName) {
+    const eventName = this.getSupportedEventListener(root.host ?? root, managedEventName);
+    if (eventName) {
+      return this.addGivenEventListener(this._delegationContainerName, root, callback, null, eventName);
+    }
+    return null;
+  }
+
+  // Placeholder listener: keeps button into its container (for clearListeners), without DOM listener of its own
+  createDelegatedListener(target) {
+    const listener = this.createListener(target, null, null, null, null);
+    listener["delegated"] = true;
+    return listener;
+  }
+
+  isDelegatedListener(listener) {
+    return listener["delegated"] === true;
+  }
+
+  isDelegatedButton(node) {
+    return this._buttons.has(node) && this.getButtonData(node)?.delegated === true;
+  }
+
+  // Managed button containing node (walking up through nested shadow roots), up to root
+  getDelegatedButton(node, root) {
+    while (node && node !== root) {
+      if (this.isDelegatedButton(node)) return node;
+      node = node.parentNode ?? node.host ?? null;
+    }
+    return null;
+  }
+
+  onDelegatedButtonPointerOver(root, evt) {
+    const btn = this.getDelegatedButton(evt.target, root);
+    if (!btn || btn === this.getDelegatedButton(evt.relatedTarget, root)) return;
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("onDelegatedButtonPointerOver(root, evt)", btn, evt));
+    this.activateButtonNextState(btn, this.constructor._BUTTON_TRIGGER_POINTER_ENTER, evt);
+  }
+  onDelegatedButtonPointerOut(root, evt) {
+    const btn = this.getDelegatedButton(evt.target, root);
+    if (!btn || btn === this.getDelegatedButton(evt.relatedTarget, root)) return;
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("onDelegatedButtonPointerOut(root, evt)", btn, evt));
+    this.activateButtonNextState(btn, this.constructor._BUTTON_TRIGGER_POINTER_LEAVE, evt);
+  }
+  onDelegatedButtonPointerCancel(root, evt) {
+    const btn = this.getDelegatedButton(evt.target, root);
+    if (!btn) return;
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("onDelegatedButtonPointerCancel(root, evt)", btn, evt));
+    this.activateButtonNextState(btn, this.constructor._BUTTON_TRIGGER_POINTER_LEAVE, evt);
+  }
+  onDelegatedButtonPointerDown(root, evt) {
+    const btn = this.getDelegatedButton(evt.target, root);
+    if (!btn) return;
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("onDelegatedButtonPointerDown(root, evt)", btn, evt));
+    this.activateButtonNextState(btn, this.constructor._BUTTON_TRIGGER_POINTER_DOWN, evt);
+  }
+  onDelegatedButtonPointerUp(root, evt) {
+    const btn = this.getDelegatedButton(evt.target, root);
+    if (!btn) return;
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("onDelegatedButtonPointerUp(root, evt)", btn, evt));
+    this.activateButtonNextState(btn, this.constructor._BUTTON_TRIGGER_POINTER_UP, evt);
+  }
+
   addPopinListeners(containerName, target, callbacks, options = null) {
     if (!target) throw new Error('Invalid target', target);
 
@@ -364,6 +463,7 @@ export class EventManager {
 
   disconnectedCallback() {
     if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug("disconnectedCallback()"));
+    this._inputBatcher.flushAll();
     this.removeGlobalListeners();
     this._hassEventManager.disconnectedCallback();
     this.removeIntegrationListeners();
@@ -406,6 +506,7 @@ export class EventManager {
     const evtCode = data["evt_code"];
     const evtExtra = data["evt_extra"];
     const evtServerId = data["evt_si"];
+    const evtCount = data["evt_count"] ?? 1; // Errors are aggregated by integration (count of identical errors)
 
     // Abort when event:
     // - not a broadcasting event
@@ -423,17 +524,23 @@ export class EventManager {
     };
 
     // Log event message
-    const fullMessage = "onIntegrationEvent(evt): event received (evtType, evtCode, evtExtra, evtServerId):";
+    const fullMessage = "onIntegrationEvent(evt): event received (evtType, evtCode, evtExtra, evtServerId, evtCount):";
     if (evtLevel.trace) {
-      if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(fullMessage, evtType, evtCode, evtExtra, evtServerId));
+      if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(fullMessage, evtType, evtCode, evtExtra, evtServerId, evtCount));
     } else if (evtLevel.debug) {
-      if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug(fullMessage, evtType, evtCode, evtExtra, evtServerId, evtServerId));
+      if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug(fullMessage, evtType, evtCode, evtExtra, evtServerId, evtCount));
     } else if (evtLevel.info) {
-      if (this.getLogger().isInfoEnabled()) console.info(...this.getLogger().info(fullMessage, evtType, evtCode, evtExtra, evtServerId));
+      if (this.getLogger().isInfoEnabled()) console.info(...this.getLogger().info(fullMessage, evtType, evtCode, evtExtra, evtServerId, evtCount));
     } else if (evtLevel.warn) {
-      if (this.getLogger().isWarnEnabled()) console.warn(...this.getLogger().warn(fullMessage, evtType, evtCode, evtExtra, evtServerId));
+      if (this.getLogger().isWarnEnabled()) console.warn(...this.getLogger().warn(fullMessage, evtType, evtCode, evtExtra, evtServerId, evtCount));
     } else if (evtLevel.error) {
-      if (this.getLogger().isErrorEnabled()) console.error(...this.getLogger().error(fullMessage, evtType, evtCode, evtExtra, evtServerId));
+      if (this.getLogger().isErrorEnabled()) console.error(...this.getLogger().error(fullMessage, evtType, evtCode, evtExtra, evtServerId, evtCount));
+    }
+
+    // Check for recovery (info event carrying the recovered error code) and notify it
+    if (evtLevel.info && evtCode >= 1 && evtCode <= 4) {
+      this.triggerHaosToast(this.getHaElement(), this._localization.localize("info.hid.recovered.message"));
+      return;
     }
 
     // Check for error and associate a notification message when needed
@@ -458,6 +565,7 @@ export class EventManager {
 
       // Dispatch UI message
       if (message) {
+        if (evtCount > 1) message = `${message} (x${evtCount})`;
         this.triggerHaosToast(this.getHaElement(), message);
       }
     }
@@ -534,21 +642,17 @@ export class EventManager {
 
   initButtonState(btn, callbacks) {
     this.setButtonData(btn, {});
-    this.setButtonState(btn, this.constructor._BUTTON_STATUS_MAP[this.constructor._BUTTON_INIT][this.constructor._BUTTON_STATE]);
+    this.setButtonState(btn, this.constructor._BUTTON_MACHINE["init"]);
     this.setButtonCallbacks(btn, callbacks);
     this._buttons.add(btn);
   }
 
   getButtonCurrentState(btn) {
-    return this.constructor._BUTTON_STATUS_MAP[this.constructor._BUTTON_STATES][this.getButtonState(btn)];
-  }
-
-  getButtonCurrentActions(btn) {
-    return this.getButtonCurrentState(btn)?.[this.constructor._BUTTON_ACTIONS];
+    return this.constructor._BUTTON_MACHINE["states"].get(this.getButtonState(btn));
   }
 
   getButtonNextState(btn, trigger) {
-    return this.getButtonCurrentState(btn)?.[this.constructor._BUTTON_NEXTS].find(next => next[this.constructor._BUTTON_TRIGGER] === trigger);
+    return this.getButtonCurrentState(btn)?.["nexts"].get(trigger);
   }
 
   activateButtonNextStateFromEvent(trigger, evt) {
@@ -561,20 +665,13 @@ export class EventManager {
       if (nextState) {
 
         // Change button to next state
-        this.setButtonState(btn, nextState[this.constructor._BUTTON_STATE]);
+        this.setButtonState(btn, nextState["state"]);
 
         // Update button classes
-        for (const action of (this.getButtonCurrentActions(btn) ?? [])) {
-          const actionName = action[this.constructor._BUTTON_ACTION];
-          const actionClassList = action[this.constructor._ACTION_CLASSLIST];
-          if (actionClassList) {
-            if (actionName === this.constructor._BUTTON_ACTION_ADD) btn.classList.add(...actionClassList);
-            if (actionName === this.constructor._BUTTON_ACTION_REMOVE) btn.classList.remove(...actionClassList);
-          }
-        }
+        if (nextState["target"]) StateMachine.applyClassActions(btn, nextState["target"]);
 
         // Execute associated callback (when present)
-        const callback = this.getButtonCallbacks(btn)?.[nextState[this.constructor._BUTTON_CALLBACK]];
+        const callback = this.getButtonCallbacks(btn)?.[nextState["callback"]];
         if (callback) callback(btn, evt);
       }
       return !!nextState;
@@ -882,9 +979,29 @@ export class EventManager {
   // Returns: 
   //  - void (this is a fire-and-forget HAOS integration call)
   callComponentService(name, args, notifyOnError = false) {
+    // Pending batched inputs are sent first (inputs ordering)
+    this._inputBatcher.flushAll();
     return this.callService(Globals.COMPONENT_NAME, name, args, notifyOnError);
   }
 
+  // Queue relative input for a service from HAOS custom component 'Globals.COMPONENT_NAME' (ex: "move").
+  // Current HID server id is injected when the combined call is sent.
+  // 
+  // Parameters:
+  //  - name: the service name to fire, with "x" and "y" relative arguments
+  //  - dx, dy: deltas accumulated with other queued deltas until next call (once per animation frame or per configured interval)
+  // 
+  // Returns: 
+  //  - void (this is a fire-and-forget HAOS integration call)
+  queueComponentDeltaWithServerId(name, dx, dy, notifyOnError = false) {
+    this._inputBatcher.queueDelta(name, dx, dy, notifyOnError);
+  }
+
+  // Interval between two batched calls (in milliseconds, 0: once per animation frame)
+  setInputBatchInterval(interval) {
+    this._inputBatcher.setInterval(interval);
+  }
+
   // Call a service from HAOS custom component 'Globals.COMPONENT_NAME' using WebSockets.
   // 
   // Parameters:
@@ -1270,7 +1387,9 @@ export class EventManager {
       const managedCallback = listener["managedCallback"];
       const options = listener["options"];
       
-      if (this.isBoundToHassBusEvent(eventName)) {
+      if (this.isDelegatedListener(listener)) {
+        if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace("Removing delegated button from index", target));
+      } else if (this.isBoundToHassBusEvent(eventName)) {
         if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug(`Removing Hass bus event listener ${target}`));
         this._hassEventManager.removeHassEventListener(target, managedCallback);
       } else if (this.isTargetListenable(target)) {
@@ -1345,6 +1464,15 @@ export class EventManager {
     return listener;
   }
 
+  // Clears registered listeners of a single target from specified container
+  clearTargetListeners(containerName, target) {
+    const container = this._containers.get(containerName);
+    if (!container) return;
+    for (const listener of Array.from(container)) {
+      if (listener["target"] === target) this.removeListener(listener);
+    }
+  }
+
   // Clears all registered listeners
   clearAllListeners() {
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`clearAllListeners(): clearing ${this._containers.length} containers`));
@@ -1374,6 +1502,7 @@ export class EventManager {
 
     // Remove the container from listeners containers
     this._containers.delete(containerName);
+    if (containerName === this._delegationContainerName) this._delegationRoots.clear();
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace("clearListeners(containerName): listeners cleared from container with name", containerName));
   }
 
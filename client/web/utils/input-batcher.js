@@ -0,0 +1,119 @@
+import { Globals } from './globals.js';
+
+// Define InputBatcher helper class:
+// accumulates relative inputs (ie. mouse moves) per service and sends one combined service call per animation frame (or per configured interval),
+// with at most one call in flight per service so that calls rate follows measured round-trip latency
+export class InputBatcher {
+
+  // Integration services range for relative inputs (MIN_RANGE, MAX_RANGE): beyond, remainder is sent by next call
+  static _MIN_DELTA = -127;
+  static _MAX_DELTA = 127;
+
+  static _RTT_SMOOTHING = 0.2;       // weight of last measured round-trip time into smoothed one
+  static _MAX_IN_FLIGHT_WAIT = 250;  // milliseconds: a call in flight longer than this no longer holds next one
+
+  _origin;
+  _interval = 0; // milliseconds (0: once per animation frame)
+  _batches = new Map(); // service name -> pending batch
+  _rtt = null; // smoothed round-trip time (milliseconds)
+
+  constructor(origin) {
+    this._origin = origin;
+  }
+
+  getLogger() {
+    return this._origin?.getLogger();
+  }
+
+  setInterval(interval) {
+    this._interval = (Number.isFinite(interval) && interval > 0) ? interval : 0;
+  }
+
+  getRoundTripTime() {
+    return this._rtt;
+  }
+
+  queueDelta(name, dx, dy, notifyOnError = false) {
+    let batch = this._batches.get(name);
+    if (!batch) {
+      batch = { "x": 0, "y": 0, "notify": false, "sent-at": null, "timeout": null, "frame": null };
+      this._batches.set(name, batch);
+    }
+    batch["x"] += dx;
+    batch["y"] += dy;
+    batch["notify"] = batch["notify"] || notifyOnError;
+    this.scheduleFlush(name, batch);
+  }
+
+  scheduleFlush(name, batch) {
+    if (batch["timeout"] !== null || batch["frame"] !== null) return;
+
+    // Previous call still in flight: next call waits for its response (or for max wait)
+    if (batch["sent-at"] !== null) {
+      const inFlightWait = this.constructor._MAX_IN_FLIGHT_WAIT - (performance.now() - batch["sent-at"]);
+      if (inFlightWait > 0) {
+        batch["timeout"] = setTimeout(() => this.flush(name), inFlightWait);
+        return;
+      }
+    }
+
+    if (this._interval > 0) {
+      batch["timeout"] = setTimeout(() => this.flush(name), this._interval);
+    } else {
+      batch["frame"] = requestAnimationFrame(() => this.flush(name));
+    }
+  }
+
+  cancelFlush(batch) {
+    if (batch["timeout"] !== null) clearTimeout(batch["timeout"]);
+    if (batch["frame"] !== null) cancelAnimationFrame(batch["frame"]);
+    batch["timeout"] = null;
+    batch["frame"] = null;
+  }
+
+  flush(name) {
+    const batch = this._batches.get(name);
+    if (!batch) return;
+    this.cancelFlush(batch);
+    if (batch["x"] === 0 && batch["y"] === 0) return;
+
+    // Send accumulated deltas within service range, keep remainder for next call
+    const x = Math.max(this.constructor._MIN_DELTA, Math.min(this.constructor._MAX_DELTA, batch["x"]));
+    const y = Math.max(this.constructor._MIN_DELTA, Math.min(this.constructor._MAX_DELTA, batch["y"]));
+    const notifyOnError = batch["notify"];
+    batch["x"] -= x;
+    batch["y"] -= y;
+    batch["notify"] = false;
+
+    const sentAt = performance.now();
+    batch["sent-at"] = sentAt;
+    const call = this._origin.callService(Globals.COMPONENT_NAME, name, this._origin.injectServerId({ "x": x, "y": y }), notifyOnError);
+    Promise.resolve(call).finally(() => this.onFlushed(name, batch, sentAt));
+
+    // Remainder (when any) waits for this call response
+    if (batch["x"] !== 0 || batch["y"] !== 0) this.scheduleFlush(name, batch);
+  }
+
+  onFlushed(name, batch, sentAt) {
+    const rtt = performance.now() - sentAt;
+    this._rtt = (this._rtt === null) ? rtt : (this._rtt + this.constructor._RTT_SMOOTHING * (rtt - this._rtt));
+    if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace(`onFlushed(name, batch, sentAt): ${name} round-trip ${rtt.toFixed(1)}ms (smoothed: ${this._rtt.toFixed(1)}ms)`));
+
+    // Last call answered: pending deltas no longer held
+    if (batch["sent-at"] !== sentAt) return;
+    batch["sent-at"] = null;
+    if (batch["x"] !== 0 || batch["y"] !== 0) {
+      this.cancelFlush(batch);
+      this.scheduleFlush(name, batch);
+    }
+  }
+
+  // Send every pending batch now (ie. before any other input, to preserve inputs ordering)
+  flushAll() {
+    for (const [name, batch] of this._batches.entries()) {
+      do {
+        this.flush(name);
+      } while (batch["x"] !== 0 || batch["y"] !== 0);
+    }
+  }
+}
@@ -0,0 +1,101 @@
+// Define KeyedRenderer helper class:
+// renders layout rows and cells into a container by diffing against previously rendered cells (keyed by cell code),
+// so that a layout switch reuses existing cells elements (and their listeners), only updating what changed
+export class KeyedRenderer {
+
+  _origin;
+  _hooks;
+  _rows = []; // Rendered rows elements (in layout order)
+  _cells = new Map(); // Cell key -> rendered cells elements (in layout order: same key might appear more than once)
+
+  // Usage:
+  // const renderer = new KeyedRenderer(this, {
+  //   "createRow": (rowConfig) => row,
+  //   "createCell": (rowConfig, cellConfig) => cell,     // new cell (listened)
+  //   "updateCell": (cell, rowConfig, cellConfig) => {}, // reused cell, from another layout (or same layout)
+  //   "removeCell": (cell) => {},                        // unused cell: remove listeners and element
+  // });
+  constructor(origin, hooks) {
+    this._origin = origin;
+    this._hooks = hooks;
+  }
+
+  getLogger() {
+    return this._origin?.getLogger();
+  }
+
+  getCellKey(cellConfig) {
+    return cellConfig["code"];
+  }
+
+  // Forget rendered elements (ie. container content cleared by caller)
+  reset() {
+    this._rows = [];
+    this._cells = new Map();
+  }
+
+  // Render layout into container, returns rendered rows and cells (in layout order), and diff stats
+  render(container, layout) {
+    const stats = { "created": 0, "reused": 0, "removed": 0, "moved": 0 };
+    const previousCells = this._cells;
+    const rows = [];
+    const cells = [];
+    const renderedCells = new Map();
+
+    const rowsConfigs = layout?.rows ?? [];
+    for (let rowIndex = 0; rowIndex < rowsConfigs.length; rowIndex++) {
+      const rowConfig = rowsConfigs[rowIndex];
+
+      // Reuse row at same position (rows have no content of their own)
+      const row = this._rows[rowIndex] ?? this._hooks["createRow"](rowConfig);
+      if (container.children[rowIndex] !== row) container.insertBefore(row, container.children[rowIndex] ?? null);
+      rows.push(row);
+
+      const cellsConfigs = rowConfig.cells ?? [];
+      for (let cellIndex = 0; cellIndex < cellsConfigs.length; cellIndex++) {
+        const cellConfig = cellsConfigs[cellIndex];
+        const key = this.getCellKey(cellConfig);
+
+        // Reuse first previous cell with same key (when any), otherwise create a new one
+        let cell = previousCells.get(key)?.shift();
+        if (cell) {
+          this._hooks["updateCell"](cell, rowConfig, cellConfig);
+          stats["reused"]++;
+        } else {
+          cell = this._hooks["createCell"](rowConfig, cellConfig);
+          stats["created"]++;
+        }
+
+        // Move cell only when not already in place
+        if (row.children[cellIndex] !== cell) {
+          row.insertBefore(cell, row.children[cellIndex] ?? null);
+          stats["moved"]++;
+        }
+        cells.push(cell);
+
+        let keyCells = renderedCells.get(key);
+        if (!keyCells) {
+          keyCells = [];
+          renderedCells.set(key, keyCells);
+        }
+        keyCells.push(cell);
+      }
+    }
+
+    // Remove cells not reused (every row now only contains its rendered cells), then extra rows
+    for (const keyCells of previousCells.values()) {
+      for (const cell of keyCells) {
+        this._hooks["removeCell"](cell);
+        stats["removed"]++;
+      }
+    }
+    for (let rowIndex = rows.length; rowIndex < this._rows.length; rowIndex++) {
+      this._rows[rowIndex].remove();
+    }
+
+    this._rows = rows;
+    this._cells = renderedCells;
+    if (this.getLogger()?.isDebugEnabled()) console.debug(...this.getLogger().debug("render(container, layout): cells created, reused, removed, moved:", stats["created"], stats["reused"], stats["removed"], stats["moved"]));
+    return { "rows": rows, "cells": cells, "stats": stats };
+  }
+}
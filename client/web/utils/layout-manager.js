@@ -1,21 +1,22 @@
 import { Logger } from './logger.js';
+import { LazyRegistry } from './lazy-registry.js';
 
 export class LayoutManager {
 
   _origin;
   _layouts;
-  _layoutsByNames;
   _layoutsNames;
   _attachedLayoutName;
+  _loadingLayoutName;
   _isTouchDevice;
 
   // Usage:
   // const layoutManager = new LayoutManager(this, layouts);
+  // (layouts: LazyRegistry of layouts loaded on demand, or layouts already loaded)
   constructor(origin, layouts) {
     this._origin = origin;
-    this._layouts = layouts || {};
-    this._layoutsByNames = this.constructor.getLayoutsByNames(this._layouts);
-    this._layoutsNames = Array.from(this._layoutsByNames.keys());
+    this._layouts = (layouts instanceof LazyRegistry) ? layouts : this.constructor.getLayoutsRegistry(layouts);
+    this._layoutsNames = this._layouts.getNames();
     this._isTouchDevice = 'ontouchstart' in window || navigator.maxTouchPoints > 0;
   }
 
@@ -77,6 +78,14 @@ export class LayoutManager {
     return this.getFromConfigOrDefaultConfig('haptic');
   }
   
+  // Server-side auto-repeat of held keys: false (none), true (server delay/interval) or { delay, interval } (milliseconds)
+  getKeyRepeat() {
+    const keyRepeat = this.getFromConfigOrDefaultConfig('key_repeat');
+    if (!keyRepeat) return null;
+    if (typeof keyRepeat !== "object") return { "delay": 0, "interval": 0 };
+    return { "delay": keyRepeat["delay"] || 0, "interval": keyRepeat["interval"] || 0 };
+  }
+
   getAutoScroll() {
     return this.getFromConfigOrDefaultConfig('auto_scroll');
   }
@@ -148,12 +157,45 @@ export class LayoutManager {
     return this.getFromConfigOrDefaultConfig('layout');
   }
 
+  // Configured layout (undefined until loaded, see whenLayoutLoaded)
   getLayout() {
-    return this._layoutsByNames.get(this.getLayoutName());
+    return this._layouts.get(this.getLayoutName());
   }
 
   hasLayout(layoutName) {
-    return this._layoutsByNames.has(layoutName);
+    return this._layouts.has(layoutName);
+  }
+
+  isLayoutLoaded(layoutName) {
+    return this._layouts.isLoaded(layoutName);
+  }
+
+  // Execute callback(deferred) once configured layout is loaded:
+  // - immediately when already loaded (deferred = false)
+  // - after loading otherwise (deferred = true), unless configured layout changed meanwhile
+  whenLayoutLoaded(callback) {
+    const layoutName = this.getLayoutName();
+    if (this.isLayoutLoaded(layoutName)) {
+      this._loadingLayoutName = null;
+      callback(false);
+      return;
+    }
+
+    // Same layout already loading: its callback will be executed
+    if (this._loadingLayoutName === layoutName) return;
+    this._loadingLayoutName = layoutName;
+
+    if (this.getLogger().isDebugEnabled()) console.debug(...this.getLogger().debug(`Loading layout ${layoutName}...`));
+    this._layouts.load(layoutName)
+      .then(() => {
+        if (this._loadingLayoutName !== layoutName) return;
+        this._loadingLayoutName = null;
+        if (this.getLayoutName() === layoutName) callback(true);
+      })
+      .catch((err) => {
+        if (this._loadingLayoutName === layoutName) this._loadingLayoutName = null;
+        if (this.getLogger().isErrorEnabled()) console.error(...this.getLogger().error(`Cannot load layout ${layoutName}:`, err));
+      });
   }
 
   getAttachedLayoutName() {
@@ -186,6 +228,15 @@ export class LayoutManager {
     return elt?._keyData;
   }
 
+  // Forget given data keys (ie. before setting data of another layout on a reused element, keeping other data)
+  resetElementData(elt, keys) {
+    const data = elt?._keyData;
+    if (!data) return;
+    for (const key of keys) {
+      delete data[key];
+    }
+  }
+
   setElementData(elt, defaultConfig, overrideConfig, accept) {
     if (!elt._keyData) elt._keyData = {};
 
@@ -289,11 +340,11 @@ export class LayoutManager {
     return this.isNumber(value) || this.isStringNumber(value) || this.isRelativeUnit(value) || this.isAbsoluteUnit(value);
   }
 
-  static getLayoutsByNames(layouts) {
-    const layoutsByNames = new Map();
+  static getLayoutsRegistry(layouts) {
+    const layoutsRegistry = new LazyRegistry();
     for (const layout of Object.values(layouts || {})) {
-      layoutsByNames.set(layout.Name, layout);
+      layoutsRegistry.set(layout.Name, layout);
     }
-    return layoutsByNames;
+    return layoutsRegistry;
   }
 }
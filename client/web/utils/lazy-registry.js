@@ -0,0 +1,60 @@
+// Registry of named values loaded on demand (ie. through dynamic import), shared by every user of the registry
+export class LazyRegistry {
+
+  _loaders;
+  _loaded = new Map();
+  _loading = new Map();
+
+  // Usage:
+  // const registry = new LazyRegistry({ "name": () => import('./module.js').then((module) => module.value) });
+  constructor(loaders) {
+    this._loaders = new Map(Object.entries(loaders || {}));
+  }
+
+  getNames() {
+    return Array.from(this._loaders.keys());
+  }
+
+  has(name) {
+    return this._loaders.has(name);
+  }
+
+  isLoaded(name) {
+    return this._loaded.has(name);
+  }
+
+  // Loaded value (undefined when not loaded yet)
+  get(name) {
+    return this._loaded.get(name);
+  }
+
+  // Register an already loaded value
+  set(name, value) {
+    this._loaders.set(name, () => Promise.resolve(value));
+    this._loaded.set(name, value);
+  }
+
+  // Load value once (concurrent loads share the same promise, failed loads can be retried)
+  load(name) {
+    if (this._loaded.has(name)) return Promise.resolve(this._loaded.get(name));
+
+    let loading = this._loading.get(name);
+    if (!loading) {
+      const loader = this._loaders.get(name);
+      if (!loader) return Promise.resolve(undefined);
+
+      loading = loader()
+        .then((value) => {
+          this._loaded.set(name, value);
+          return value;
+        })
+        .finally(() => this._loading.delete(name));
+      this._loading.set(name, loading);
+    }
+    return loading;
+  }
+
+  loadAll(names) {
+    return Promise.all(Array.from(names, (name) => this.load(name)));
+  }
+}
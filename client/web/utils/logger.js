@@ -13,6 +13,10 @@ import { parse, stringify, toJSON, fromJSON } from '../libs/flatted_3.3.3_min.js
 export class Logger {
 
   _pushbackLimit = 150; // Default pushback limit
+  _pushbackBatchSize = 50; // Max records pushed back within a single log batch
+  _pushbackBatchDelay = 250; // Max delay (in ms) before pushing back pending records
+  _pushbackRecords = [];
+  _pushbackTimer = null;
   _levels = { error: 0, warn: 1, info: 2, debug: 3, trace: 4 };
   _guid;
   _origin;
@@ -106,14 +110,9 @@ export class Logger {
       // Serialize and limit serialized args before pushing to HA backend
       const serializedArgs = (args && args.length && args.length > 0) ? args.map(arg => this.truncateArg(this.constructor.safeSerialize(arg), appliedLimit)) : [];
       
-      // Call to HA backend service for custom log pushback
+      // Queue record for batched custom log pushback to HA backend
       if (serializedArgs.length > 0) {
-        hass.callService(
-          Globals.COMPONENT_NAME, "log", { "level": header, "origin": this._originName, "logger_id": this._guid, "highlight": useHighlight, "logs": serializedArgs }
-        ).catch(err => {
-          // Pushback fail fallback: notify pushback fail into web console without resorting to this logger
-          console.warn("Unable to do log pushback (log might be too long or HA unresponsive):", err);
-        });
+        this.queuePushback(hass, { "level": header, "highlight": useHighlight, "logs": serializedArgs });
       }
     }
 
@@ -124,6 +123,34 @@ export class Logger {
     return [`%c[${header}][${this._originName}][${this._guid}]${useHighlight}`, useStyle];
   }
 
+  queuePushback(hass, record) {
+    this._pushbackRecords.push(record);
+    if (this._pushbackRecords.length >= this._pushbackBatchSize) {
+      this.flushPushback(hass);
+    } else if (!this._pushbackTimer) {
+      this._pushbackTimer = setTimeout(() => this.flushPushback(this.getHass()), this._pushbackBatchDelay);
+    }
+  }
+
+  flushPushback(hass) {
+    if (this._pushbackTimer) {
+      clearTimeout(this._pushbackTimer);
+      this._pushbackTimer = null;
+    }
+
+    const records = this._pushbackRecords;
+    this._pushbackRecords = [];
+    if (!hass || records.length === 0) return;
+
+    // Call to HA backend command for custom log pushback (many records at once)
+    hass.connection.sendMessagePromise(
+      { "type": `${Globals.COMPONENT_NAME}/log_batch`, "origin": this._originName, "logger_id": this._guid, "records": records }
+    ).catch(err => {
+      // Pushback fail fallback: notify pushback fail into web console without resorting to this logger
+      console.warn("Unable to do log pushback (logs might be too long or HA unresponsive):", err);
+    });
+  }
+
   getHighlightRegExp() {
     const highlight = this.getHighlight();
     let highlightRegExp = null;
@@ -1,28 +1,59 @@
+// Map sorted by key (comparator order), with O(1) lookup and neighbor keys, and O(log n) insertion point search.
+// Keys are kept into a sorted array (binary search, then native splice) and linked through map entries (prev/next).
 export class SortedLinkedMap {
-  constructor(comparator = (a, b) => a < b ? -1 : a > b ? 1 : 0) {
+  constructor(comparator = (a, b) => a < b ? -1 : a > b ? 1 : 0, entries = null) {
     this.map = new Map();
     this.comparator = comparator;
     this.sortedKeys = [];
+    if (entries) this.load(entries);
   }
 
-  set(key, value) {
-    if (this.map.has(key)) {
-      this.map.get(key).value = value;
-      return;
+  get size() {
+    return this.map.size;
+  }
+
+  has(key) {
+    return this.map.has(key);
+  }
+
+  // Index of key when present, otherwise index where key would be inserted
+  indexOf(key) {
+    const keys = this.sortedKeys;
+    let low = 0;
+    let high = keys.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (this.comparator(keys[middle], key) < 0) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
     }
+    return low;
+  }
 
-    // Find insertion point (linear for simplicity)
-    let index = 0;
-    while (index < this.sortedKeys.length && this.comparator(this.sortedKeys[index], key) < 0) {
-      index++;
+  set(key, value) {
+    const existing = this.map.get(key);
+    if (existing) {
+      existing.value = value;
+      return this;
     }
 
+    // Find insertion point (appending in order is the common case: no search)
+    const keys = this.sortedKeys;
+    const length = keys.length;
+    const index = (length === 0 || this.comparator(keys[length - 1], key) < 0) ? length : this.indexOf(key);
+
     // Insert key into sorted array
-    this.sortedKeys.splice(index, 0, key);
+    if (index === length) {
+      keys.push(key);
+    } else {
+      keys.splice(index, 0, key);
+    }
 
     // Determine prev/next keys
-    const prevKey = this.sortedKeys[index - 1] ?? null;
-    const nextKey = this.sortedKeys[index + 1] ?? null;
+    const prevKey = keys[index - 1] ?? null;
+    const nextKey = keys[index + 1] ?? null;
 
     // Create wrapper
     const wrapper = { value, prev: prevKey, next: nextKey };
@@ -31,6 +62,29 @@ export class SortedLinkedMap {
     // Update neighbors
     if (prevKey !== null) this.map.get(prevKey).next = key;
     if (nextKey !== null) this.map.get(nextKey).prev = key;
+    return this;
+  }
+
+  // Bulk load entries (iterable of [key, value]): sorted once then linked, instead of one insertion per entry
+  load(entries) {
+    for (const [key, value] of entries) {
+      const existing = this.map.get(key);
+      if (existing) {
+        existing.value = value;
+      } else {
+        this.map.set(key, { value, prev: null, next: null });
+        this.sortedKeys.push(key);
+      }
+    }
+
+    const keys = this.sortedKeys;
+    keys.sort(this.comparator);
+    for (let index = 0; index < keys.length; index++) {
+      const wrapper = this.map.get(keys[index]);
+      wrapper.prev = keys[index - 1] ?? null;
+      wrapper.next = keys[index + 1] ?? null;
+    }
+    return this;
   }
 
   get(key) {
@@ -45,20 +99,83 @@ export class SortedLinkedMap {
     return this.map.get(key)?.prev ?? null;
   }
 
+  firstKey() {
+    return this.sortedKeys[0] ?? null;
+  }
+
+  lastKey() {
+    return this.sortedKeys[this.sortedKeys.length - 1] ?? null;
+  }
+
   delete(key) {
-    if (!this.map.has(key)) return;
+    const wrapper = this.map.get(key);
+    if (!wrapper) return false;
 
-    const { prev, next } = this.map.get(key);
+    const { prev, next } = wrapper;
     if (prev !== null) this.map.get(prev).next = next;
     if (next !== null) this.map.get(next).prev = prev;
 
     this.map.delete(key);
-    this.sortedKeys = this.sortedKeys.filter(k => k !== key);
+    const keys = this.sortedKeys;
+    const index = this.indexOf(key);
+    if (keys[index] === key) {
+      keys.splice(index, 1);
+    } else {
+      // Comparator ties (distinct keys comparing equal)
+      keys.splice(keys.indexOf(key), 1);
+    }
+    return true;
+  }
+
+  clear() {
+    this.map.clear();
+    this.sortedKeys = [];
+  }
+
+  // Iterators follow links from given key (first key by default) in ascending order (descending when reversed):
+  // entries (current one included) can be deleted while iterating
+  *entriesFrom(key = this.firstKey(), reversed = false) {
+    while (key !== null) {
+      const wrapper = this.map.get(key);
+      if (!wrapper) return;
+      const following = reversed ? wrapper.prev : wrapper.next;
+      yield [key, wrapper.value];
+      const current = this.map.get(key);
+      if (current) {
+        key = reversed ? current.prev : current.next;
+      } else if (following === null || this.map.has(following)) {
+        key = following;
+      } else {
+        // Current and following keys both deleted: resume from current key position
+        const index = this.indexOf(key);
+        key = (reversed ? this.sortedKeys[index - 1] : this.sortedKeys[index]) ?? null;
+      }
+    }
   }
 
   *entries() {
-    for (const key of this.sortedKeys) {
-      yield [key, this.get(key)];
+    yield* this.entriesFrom(this.firstKey());
+  }
+
+  *reversedEntries() {
+    yield* this.entriesFrom(this.lastKey(), true);
+  }
+
+  *keys() {
+    for (const [key] of this.entries()) {
+      yield key;
+    }
+  }
+
+  *values() {
+    for (const [, value] of this.entries()) {
+      yield value;
+    }
+  }
+
+  forEach(callback, thisArg) {
+    for (const [key, value] of this.entries()) {
+      callback.call(thisArg, value, key, this);
     }
   }
 
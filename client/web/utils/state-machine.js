@@ -1,4 +1,7 @@
-// Define StateMachine helper class
+import { TimerWheel } from './timer-wheel.js';
+
+// Define StateMachine helper class:
+// machine definitions are compiled once into transition tables (see compile()), element timeouts run on the shared timer wheel
 export class StateMachine {
 
   static INIT = '1';              // "init"
@@ -18,9 +21,13 @@ export class StateMachine {
   static ACTION_TYPE_CLASSLIST = '2';  // "class_list"
   static ACTION_TYPE_SETTIMEOUT = '3'; // "setTimeout"
 
+  static _compiledMachines = new WeakMap(); // Machine definition -> compiled machine
+
   _machine;
+  _compiledMachine;
   _dataKey;
   _eventKeys;
+  _timerWheel = TimerWheel.getShared();
   _elements = new Set();               // Managed elements
 
   static checkMachine(machine) {
@@ -34,6 +41,60 @@ export class StateMachine {
       throw new Error(`Invalid machine: expected non-null/empty/undefined machine[this.constructor.STATES] (machine[${this.STATES}]), got:`, machine);
   }
 
+  // Compile machine definition (once per definition) into transition tables:
+  // state -> { trigger -> next state }, with state actions split by type (applied in declaration order)
+  //   {
+  //     "init": state,
+  //     "states": Map(state -> {
+  //       "state": state,
+  //       "class-actions": [[add, classList], ...],
+  //       "timeout-actions": [[add, timeoutsIds], ...],
+  //       "nexts": Map(trigger -> { "state": state, "callback": callback, "target": compiled state }),
+  //     }),
+  //   }
+  static compile(machine) {
+    let compiledMachine = this._compiledMachines.get(machine);
+    if (compiledMachine) return compiledMachine;
+
+    this.checkMachine(machine);
+    const states = new Map();
+    for (const [state, stateConfig] of Object.entries(machine[this.STATES])) {
+      const compiledState = { "state": state, "class-actions": [], "timeout-actions": [], "nexts": new Map() };
+      for (const action of (stateConfig[this.ACTIONS] ?? [])) {
+        const add = action[this.ACTION] === this.ACTION_ADD;
+        if (!add && action[this.ACTION] !== this.ACTION_REMOVE) continue; // Unknown action
+        const actionClassList = action[this.ACTION_TYPE_CLASSLIST];
+        if (actionClassList) compiledState["class-actions"].push([add, actionClassList]);
+        const actionSetTimeout = action[this.ACTION_TYPE_SETTIMEOUT];
+        if (actionSetTimeout) compiledState["timeout-actions"].push([add, actionSetTimeout]);
+      }
+      for (const next of (stateConfig[this.NEXTS] ?? [])) {
+        // First declared transition wins for a given trigger
+        const trigger = next[this.TRIGGER];
+        if (!compiledState["nexts"].has(trigger)) compiledState["nexts"].set(trigger, { "state": next[this.STATE], "callback": next[this.CALLBACK], "target": null });
+      }
+      states.set(state, compiledState);
+    }
+
+    // Link transitions to their target compiled states (no lookup when activated)
+    for (const compiledState of states.values()) {
+      for (const next of compiledState["nexts"].values()) {
+        next["target"] = states.get(next["state"]) ?? null;
+      }
+    }
+
+    compiledMachine = { "init": machine[this.INIT][this.STATE], "states": states };
+    this._compiledMachines.set(machine, compiledMachine);
+    return compiledMachine;
+  }
+
+  // Apply compiled state class actions to element
+  static applyClassActions(elt, compiledState) {
+    for (const [add, classList] of compiledState["class-actions"]) {
+      if (add) elt.classList.add(...classList); else elt.classList.remove(...classList);
+    }
+  }
+
   static normalizeToSet(value) {
     if (value == null) return new Set();
     if (value instanceof Set) return new Set(value);
@@ -52,8 +113,8 @@ export class StateMachine {
   }
 
   constructor(machine, dataKey, eventKeys) {
-    this.constructor.checkMachine(machine);
     this._machine = machine;
+    this._compiledMachine = this.constructor.compile(machine);
     this._dataKey = dataKey;
     this._eventKeys = this.constructor.ensureDefaultEventKeys(eventKeys);
   }
@@ -199,26 +260,26 @@ export class StateMachine {
 
   initElementState(elt, callbacks, timeouts) {
     this.setElementData(elt, {});
-    this.setElementState(elt, this._machine[this.constructor.INIT][this.constructor.STATE]);
+    this.setElementState(elt, this._compiledMachine["init"]);
     this.setElementCallbacks(elt, callbacks);
     this.setElementTimeouts(elt, timeouts);
     this._elements.add(elt);
   }
 
   removeElement(elt) {
+    // Pending timeouts of removed element never expire
+    for (const elementTimeout of Object.values(this.getElementTimeouts(elt) ?? {})) {
+      this._timerWheel.stop(elementTimeout["timer"]);
+    }
     this._elements.delete(elt);
   }
 
   getElementCurrentState(elt) {
-    return this._machine[this.constructor.STATES][this.getElementState(elt)];
-  }
-
-  getElementCurrentActions(elt) {
-    return this.getElementCurrentState(elt)?.[this.constructor.ACTIONS];
+    return this._compiledMachine["states"].get(this.getElementState(elt));
   }
 
   getElementNextState(elt, trigger) {
-    return this.getElementCurrentState(elt)?.[this.constructor.NEXTS].find(next => next[this.constructor.TRIGGER] === trigger);
+    return this.getElementCurrentState(elt)?.["nexts"].get(trigger);
   }
 
   activateElementNextStateFromEvent(trigger, evt) {
@@ -231,31 +292,23 @@ export class StateMachine {
       if (nextState) {
 
         // Change element to next state
-        this.setElementState(elt, nextState[this.constructor.STATE]);
-
-        // Update element
-        const actions = this.getElementCurrentActions(elt);
-        for (const action of (actions ?? [])) {
-          const actionName = action[this.constructor.ACTION];
-
-          // Update element classes
-          const actionClassList = action[this.constructor.ACTION_TYPE_CLASSLIST];
-          if (actionClassList) {
-            if (actionName === this.constructor.ACTION_ADD) elt.classList.add(...actionClassList);
-            if (actionName === this.constructor.ACTION_REMOVE) elt.classList.remove(...actionClassList);
-          }
-
-          // Update element timeouts
-          const actionSetTimeout = action[this.constructor.ACTION_TYPE_SETTIMEOUT];
-          if (actionSetTimeout) {
-            const stateEvt = this.createStateEvent(evt);
-            if (actionName === this.constructor.ACTION_ADD) this.addElementTimeouts(stateEvt, elt, ...actionSetTimeout);
-            if (actionName === this.constructor.ACTION_REMOVE) this.removeElementTimeouts(stateEvt, elt, ...actionSetTimeout);
+        this.setElementState(elt, nextState["state"]);
+
+        // Update element classes and timeouts
+        const compiledState = nextState["target"];
+        if (compiledState) {
+          this.constructor.applyClassActions(elt, compiledState);
+          for (const [add, actionTimeouts] of compiledState["timeout-actions"]) {
+            if (add) {
+              this.addElementTimeouts(this.createStateEvent(evt), elt, actionTimeouts);
+            } else {
+              this.removeElementTimeouts(elt, actionTimeouts);
+            }
           }
         }
 
         // Execute associated callback (when present)
-        const callback = this.getElementCallbacks(elt)?.[nextState[this.constructor.CALLBACK]];
+        const callback = this.getElementCallbacks(elt)?.[nextState["callback"]];
         if (callback) callback(elt, evt);
       }
       return !!nextState;
@@ -269,9 +322,9 @@ export class StateMachine {
     }
   }
 
-  removeElementTimeouts(evt, elt, actionTimeouts) {
+  removeElementTimeouts(elt, actionTimeouts) {
     for (const actionTimeout of (actionTimeouts ?? [])) {
-      this.removeElementTimeout(evt, elt, actionTimeout);
+      this.removeElementTimeout(elt, actionTimeout);
     }
   }
 
@@ -285,44 +338,29 @@ export class StateMachine {
       throw new Error(`Cannot add timeout with id ${actionTimeout}: no timeout config avaible for id ${actionTimeout} on target element`, evt, elt, elementTimeouts, elementTimeout);
 
     // Prevent timeout duplicates when old exist and did not expired
-    const timeoutEntry = elementTimeout["entry"];
-    if (timeoutEntry && !timeoutEntry["was-ran"])
-      throw new Error(`Cannot add timeout with id ${actionTimeout}: non-expired timeout entry with same id ${actionTimeout} detected on target element`, evt, elt, elementTimeouts, elementTimeout, timeoutEntry);
-
-    // Create new concrete timeout entry
-    elementTimeout["entry"] = {
-      "was-ran": false,                                  // true when action was executed
-      "timeout": this.createTimeout(evt, elementTimeout)   // when it expires, triggers the associated inner callback to run the action
-    };
-  }
+    if (this._timerWheel.isActive(elementTimeout["timer"]))
+      throw new Error(`Cannot add timeout with id ${actionTimeout}: non-expired timeout with same id ${actionTimeout} detected on target element`, evt, elt, elementTimeouts, elementTimeout);
 
-  createTimeout(evt, elementTimeout) {
-    return setTimeout(() => {
-      const timeoutEntry = elementTimeout["entry"];
-
-      // When no entry: element state changed before timeout (released, moved, ...)
-      if (timeoutEntry && !timeoutEntry["was-ran"]) {
-        timeoutEntry["was-ran"] = true;
-        const callback = elementTimeout.callback;
-        if (callback) callback(evt);
-      }
-    }, elementTimeout.delay); // timeout duration
+    // Start element timer (created once, reused by every following timeouts): when it expires, runs timeout callback
+    if (!elementTimeout["timer"]) elementTimeout["timer"] = this._timerWheel.createTimer(this.onElementTimeout.bind(this, elementTimeout));
+    elementTimeout["event"] = evt;
+    this._timerWheel.start(elementTimeout["timer"], elementTimeout.delay);
   }
 
-  removeElementTimeout(evt, elt, actionTimeout) {
-    const elementTimeouts = this.getElementTimeouts(elt);
-    if (!elementTimeouts) return;
+  onElementTimeout(elementTimeout) {
+    // Stopped timer never expires: element state did not change before timeout
+    const evt = elementTimeout["event"];
+    elementTimeout["event"] = null;
+    const callback = elementTimeout.callback;
+    if (callback) callback(evt);
+  }
 
-    const elementTimeout = elementTimeouts[actionTimeout];
+  removeElementTimeout(elt, actionTimeout) {
+    const elementTimeout = this.getElementTimeouts(elt)?.[actionTimeout];
     if (!elementTimeout) return;
 
-    const timeoutEntry = elementTimeout["entry"];
-    if (!timeoutEntry) return;
-
-    const timeout = timeoutEntry["timeout"];
-    if (timeout) clearTimeout(timeout);
-
-    elementTimeout["entry"] = null;
+    this._timerWheel.stop(elementTimeout["timer"]);
+    elementTimeout["event"] = null;
   }
 
   //addElementTimeouts(evt, elt, actionTimeouts) {
@@ -0,0 +1,126 @@
+// Define TimerWheel helper class:
+// hashed timing wheel shared by every card, running all pending timers (ie. long-press, repeat) from a single native timeout.
+// Timers are reusable objects (created once per element/key, then started and stopped at will): starting and stopping one
+// is a Set insertion/deletion, without native timeout churn nor allocation.
+export class TimerWheel {
+
+  static _TICK = 10;    // milliseconds: timers expire on first tick after their delay (never early, at most one tick late)
+  static _SLOTS = 256;  // wheel revolution (2560 milliseconds): longer delays wait for one or more revolutions
+  static _shared;
+
+  _slots = Array.from({ length: TimerWheel._SLOTS }, () => new Set());
+  _origin = performance.now();
+  _tick = 0;            // next tick to process
+  _size = 0;            // active timers count
+  _timeout = null;      // native timeout (single one)
+  _timeoutTick = null;  // tick native timeout wakes up at
+
+  // Wheel shared by every caller (one native timeout for the whole page)
+  static getShared() {
+    if (!this._shared) this._shared = new TimerWheel();
+    return this._shared;
+  }
+
+  getSize() {
+    return this._size;
+  }
+
+  getCurrentTick() {
+    return Math.floor((performance.now() - this._origin) / this.constructor._TICK);
+  }
+
+  // Reusable timer: callback runs each time timer expires
+  createTimer(callback) {
+    return { "callback": callback, "deadline": 0, "slot": null, "active": false };
+  }
+
+  isActive(timer) {
+    return !!timer?.["active"];
+  }
+
+  // (Re)start timer: expires once delay (milliseconds) elapsed, unless stopped before
+  start(timer, delay) {
+    if (timer["active"]) this.stop(timer);
+
+    const deadline = Math.max(this._tick, Math.ceil((performance.now() - this._origin + Math.max(0, delay || 0)) / this.constructor._TICK));
+    const slot = deadline % this.constructor._SLOTS;
+    timer["deadline"] = deadline;
+    timer["slot"] = slot;
+    timer["active"] = true;
+    this._slots[slot].add(timer);
+    this._size++;
+
+    // Native timeout only moves when this timer expires first
+    if (this._timeoutTick === null || deadline < this._timeoutTick) this.arm(deadline);
+    return timer;
+  }
+
+  stop(timer) {
+    if (!timer?.["active"]) return;
+    this._slots[timer["slot"]].delete(timer);
+    timer["active"] = false;
+    this._size--;
+    // Native timeout is kept: it re-arms itself for next timer (if any) when it wakes up
+  }
+
+  // One-shot helpers (setTimeout/clearTimeout replacements)
+  schedule(delay, callback) {
+    return this.start(this.createTimer(callback), delay);
+  }
+
+  cancel(timer) {
+    this.stop(timer);
+  }
+
+  arm(tick) {
+    clearTimeout(this._timeout);
+    this._timeoutTick = tick;
+    const delay = Math.max(0, this._origin + tick * this.constructor._TICK - performance.now());
+    this._timeout = setTimeout(this.onTimeout.bind(this), delay);
+  }
+
+  onTimeout() {
+    this._timeout = null;
+    this._timeoutTick = null;
+
+    // Collect expired timers of every elapsed tick (whole wheel at most: late wake up, ie. throttled background tab)
+    const currentTick = this.getCurrentTick();
+    const lastTick = Math.min(currentTick, this._tick + this.constructor._SLOTS - 1);
+    const expired = [];
+    for (let tick = this._tick; tick <= lastTick; tick++) {
+      for (const timer of this._slots[tick % this.constructor._SLOTS]) {
+        if (timer["deadline"] <= currentTick) {
+          this._slots[timer["slot"]].delete(timer);
+          timer["active"] = false;
+          this._size--;
+          expired.push(timer);
+        }
+      }
+    }
+    this._tick = currentTick + 1;
+
+    // Run callbacks (in deadline order): they might start timers again
+    expired.sort((a, b) => a["deadline"] - b["deadline"]);
+    for (const timer of expired) {
+      try {
+        timer["callback"]();
+      } catch (err) {
+        console.error('TimerWheel: timer callback failed:', err);
+      }
+    }
+
+    const nextTick = this.getNextDeadline();
+    if (nextTick !== null && (this._timeoutTick === null || nextTick < this._timeoutTick)) this.arm(nextTick);
+  }
+
+  // Earliest deadline within next revolution (otherwise wakes up one revolution later, to look again)
+  getNextDeadline() {
+    if (this._size === 0) return null;
+    for (let tick = this._tick; tick < this._tick + this.constructor._SLOTS; tick++) {
+      for (const timer of this._slots[tick % this.constructor._SLOTS]) {
+        if (timer["deadline"] === tick) return tick;
+      }
+    }
+    return this._tick + this.constructor._SLOTS;
+  }
+}
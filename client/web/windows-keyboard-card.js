@@ -3,9 +3,10 @@ import { Logger } from './utils/logger.js';
 import { EventManager } from './utils/event-manager.js';
 import { ResourceManager } from './utils/resource-manager.js';
 import { LayoutManager } from './utils/layout-manager.js';
+import { KeyedRenderer } from './utils/keyed-renderer.js';
 import { KeyCodes } from './utils/keycodes.js';
 import { ConsumerCodes } from './utils/consumercodes.js';
-import * as layoutsWindows from './layouts/windows/index.js';
+import { layoutsWindows } from './layouts/windows/index.js';
 
 console.info("Loading windows-keyboard-card");
 
@@ -96,6 +97,7 @@ export class WindowsKeyboardCard extends HTMLElement {
   _eventManager;
   _layoutManager;
   _resourceManager;
+  _renderer;
   _pressedModifiers = new Set();
   _pressedKeys = new Set();
   _pressedConsumers = new Set();
@@ -108,6 +110,12 @@ export class WindowsKeyboardCard extends HTMLElement {
     this._eventManager = new EventManager(this);
     this._layoutManager = new LayoutManager(this, layoutsWindows);
     this._resourceManager = new ResourceManager(this, import.meta.url);
+    this._renderer = new KeyedRenderer(this, {
+      "createRow": this.doRenderRow.bind(this),
+      "createCell": this.doRenderCell.bind(this),
+      "updateCell": this.doPatchCell.bind(this),
+      "removeCell": this.doRemoveCell.bind(this),
+    });
 
     this._currentState = this.constructor._STATUS_MAP["init"]["state"];
     
@@ -176,7 +184,7 @@ export class WindowsKeyboardCard extends HTMLElement {
     const statusLabel = this.getCurrentLabel();
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace("doUpdateCells(statusLabel):", statusLabel));
 
-    for (const cell of this._elements.cells) {
+    for (const cell of (this._elements.cells ?? [])) {
 
       const cellConfig = this._layoutManager.getElementData(cell);
       if (!cellConfig) continue;
@@ -200,7 +208,8 @@ export class WindowsKeyboardCard extends HTMLElement {
   // Synchronize cell label with given mode and state
   // using configured given label selection mode
   doUpdateCellLabel(cell, cellConfig, statusLabel) {
-    cell._label.textContent = this.getLabel(cellConfig, statusLabel);
+    const label = this.getLabel(cellConfig, statusLabel);
+    if (cell._label.textContent !== label) cell._label.textContent = label;
   }
 
   // jobs
@@ -401,26 +410,15 @@ export class WindowsKeyboardCard extends HTMLElement {
 
   doUpdateLayout() {
     if (this.getLogger().isTraceEnabled()) console.debug(...this.getLogger().trace("doUpdateLayout() + this._currentMode, this._currentState", this._currentMode, this._currentState));
-    this.doResetLayout();
-    this.doCreateLayout();
-    this.syncKeyboard();
+    this._layoutManager.whenLayoutLoaded(() => {
+      this.doResetLayout();
+      this.doCreateLayout();
+      this.syncKeyboard();
+    });
   }
 
   doResetLayout() {
-    // Clear previous listeners
-    this._eventManager.clearListeners("layoutContainer");
-
-    // Clear existing layout content from DOM
-    this._elements.container.innerHTML = '';
-
-    // Reset cells contents elements (if any)
-    this._elements.cellContents = [];
-
-    // Reset cells elements (if any)
-    this._elements.cells = [];
-
-    // Reset rows elements (if any)
-    this._elements.rows = [];
+    // Cells are kept: next layout rendering reuses them (see doCreateLayout)
 
     // Reset attached layout
     this._layoutManager.resetAttachedLayout();
@@ -430,30 +428,23 @@ export class WindowsKeyboardCard extends HTMLElement {
     // Mark configured layout as attached
     this._layoutManager.configuredLayoutAttached();
 
-    // Create rows
-    for (const rowConfig of this._layoutManager.getLayout().rows) {
-      const row = this.doRow(rowConfig);
-      this.doStyleRow();
-      this.doAttachRow(row);
-      this.doQueryRowElements();
-      this.doListenRow();
-    }
+    // Render rows and cells: cells of previous layout are reused by code (only changed attributes, data and labels are updated)
+    const rendered = this._renderer.render(this._elements.container, this._layoutManager.getLayout());
+    this._elements.rows = rendered["rows"];
+    this._elements.cells = rendered["cells"];
+  }
+
+  doRenderRow(rowConfig) {
+    const row = this.doRow(rowConfig);
+    this.doStyleRow();
+    this.doQueryRowElements();
+    this.doListenRow();
+    return row;
   }
 
   doRow(rowConfig) {
     const row = document.createElement("div");
-    this._elements.rows.push(row);
     row.className = "keyboard-row";
-
-    // Create cells
-    for (const cellConfig of rowConfig.cells) {
-      const cell = this.doCell(rowConfig, cellConfig);
-      this.doStyleCell();
-      this.doAttachCell(row, cell);
-      this.doQueryCellElements();
-      this.doListenCell(cell);
-    }
-
     return row;
   }
 
@@ -461,10 +452,6 @@ export class WindowsKeyboardCard extends HTMLElement {
     // Nothing to do here: already included into card style
   }
 
-  doAttachRow(row) {
-    this._elements.container.appendChild(row);
-  }
-
   doQueryRowElements() {
     // Nothing to do here: element already referenced and sub-elements already are included by them
   }
@@ -480,12 +467,8 @@ export class WindowsKeyboardCard extends HTMLElement {
 
     // Create cell
     const cell = document.createElement("button");
-    this._elements.cells.push(cell);
-    cell.id = cellConfig["code"];
     cell.classList.add("key");
-    if (cellConfig.special) cell.classList.add("special");
-    if (cellConfig.width) cell.classList.add(cellConfig["width"]);
-    if (cellConfig.code.startsWith("SPACER_")) cell.classList.add("spacer"); // Disable actions on spacers
+    this.doCellAttributes(cell, cellConfig);
     this.setCellData(cell, cellConfig, overrideCellConfig);
 
     // Create cell content
@@ -501,12 +484,42 @@ export class WindowsKeyboardCard extends HTMLElement {
     return cell;
   }
 
-  doStyleCell() {
-    // Nothing to do here: already included into card style
+  doRenderCell(rowConfig, cellConfig) {
+    const cell = this.doCell(rowConfig, cellConfig);
+    this.doStyleCell();
+    this.doQueryCellElements();
+    this.doListenCell(cell);
+    return cell;
+  }
+
+  // Cell reused from previous layout: listeners and content elements are kept, only layout dependent attributes, data and label are updated
+  doPatchCell(cell, rowConfig, cellConfig) {
+    const overrideCellConfig = {};
+    this.doCellAttributes(cell, cellConfig);
+    this._layoutManager.resetElementData(cell, this._allowedCellData);
+    this.setCellData(cell, cellConfig, overrideCellConfig);
+    this.doUpdateCell(cell, cellConfig, this.getCurrentLabel());
   }
 
-  doAttachCell(row, cell) {
-    row.appendChild(cell);
+  doRemoveCell(cell) {
+    this._eventManager.clearTargetListeners("layoutContainer", cell);
+    cell.remove();
+  }
+
+  // Cell attributes depending on cell config
+  doCellAttributes(cell, cellConfig) {
+    cell.id = cellConfig["code"];
+    cell.classList.toggle("special", !!cellConfig.special);
+    if (cell._width !== cellConfig.width) {
+      if (cell._width) cell.classList.remove(cell._width);
+      if (cellConfig.width) cell.classList.add(cellConfig.width);
+      cell._width = cellConfig.width;
+    }
+    cell.classList.toggle("spacer", cellConfig.code.startsWith("SPACER_")); // Disable actions on spacers
+  }
+
+  doStyleCell() {
+    // Nothing to do here: already included into card style
   }
 
   doQueryCellElements() {
@@ -545,6 +558,7 @@ export class WindowsKeyboardCard extends HTMLElement {
     return {
       layout: "US",
       haptic: true,
+      key_repeat: false,
       log_level: "warn",
       log_pushback: false,
       buttons_overrides: {},
@@ -869,17 +883,25 @@ export class WindowsKeyboardCard extends HTMLElement {
 
   // Send all current pressed modifiers and keys to HID keyboard
   sendKeyboardUpdate() {
-    this._eventManager.callComponentServiceWithServerId("keypress", {
+    const data = {
       sendModifiers: Array.from(this._pressedModifiers),
       sendKeys: Array.from(this._pressedKeys),
-    });
+    };
+    // Held keys repeated by server until next update (release)
+    const keyRepeat = this._layoutManager.getKeyRepeat();
+    if (keyRepeat && data.sendKeys.length > 0) data.repeat = keyRepeat;
+    this._eventManager.callComponentServiceWithServerId("keypress", data);
   }
 
   // Send all current pressed modifiers and keys to HID keyboard
   sendConsumerUpdate() {
-    this._eventManager.callComponentServiceWithServerId("conpress", {
+    const data = {
       sendCons: Array.from(this._pressedConsumers),
-    });
+    };
+    // Held consumer keys repeated by server until next update (release)
+    const keyRepeat = this._layoutManager.getKeyRepeat();
+    if (keyRepeat && data.sendCons.length > 0) data.repeat = keyRepeat;
+    this._eventManager.callComponentServiceWithServerId("conpress", data);
   }
 
   // Synchronize with remote keyboard current state through HA websockets API
@@ -0,0 +1,167 @@
+import asyncio
+import collections
+import logging
+import math
+import struct
+
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Air-mouse batch format: [0x04][speed x10][dead zone x10][count] then count samples
+AIR_MOUSE_HEADER_FORMAT = "<BBBB"
+AIR_MOUSE_HEADER_SIZE = struct.calcsize(AIR_MOUSE_HEADER_FORMAT)
+
+# Sample: gyroscope rotation rates alpha, beta, gamma (in tenths of deg/s) and interval since previous sample (in ms)
+AIR_MOUSE_SAMPLE_FORMAT = "<hhhB"
+AIR_MOUSE_SAMPLE_SIZE = struct.calcsize(AIR_MOUSE_SAMPLE_FORMAT)
+
+# Moves are computed per reference interval (60Hz devices), so that speed does not depend on device sample rate
+AIR_MOUSE_REFERENCE_INTERVAL = 1000 / 60  # ms
+AIR_MOUSE_DEFAULT_INTERVAL = AIR_MOUSE_REFERENCE_INTERVAL
+
+# Exponential smoothing of rotation rates (1: no smoothing)
+AIR_MOUSE_SMOOTHING = 0.5
+
+# Acceleration curve: gain grows linearly beyond threshold speed (in moves per reference interval), up to max gain
+AIR_MOUSE_ACCELERATION_THRESHOLD = 2.0
+AIR_MOUSE_ACCELERATION_FACTOR = 0.08
+AIR_MOUSE_ACCELERATION_MAX_GAIN = 3.0
+
+# Pending moves beyond this duration are merged (network burst): latency never accumulates
+AIR_MOUSE_MAX_BACKLOG = 100  # ms
+
+# HID relative move range
+AIR_MOUSE_MOVE_MIN = -127
+AIR_MOUSE_MOVE_MAX = 127
+
+AirMouseMove = tuple[int, int, float]  # dx, dy, interval (ms)
+
+def parse_air_mouse_batch(message: bytes) -> tuple[float, float, list[tuple[float, float, float, float]]] | None:
+    """Parse air-mouse batch message, returns (speed, dead zone, samples as (alpha, beta, gamma, interval)) or None when malformed."""
+    if len(message) < AIR_MOUSE_HEADER_SIZE:
+        return None
+    _, speed, dead_zone, count = struct.unpack_from(AIR_MOUSE_HEADER_FORMAT, message)
+    if len(message) < AIR_MOUSE_HEADER_SIZE + count * AIR_MOUSE_SAMPLE_SIZE:
+        return None
+
+    samples = [
+        (alpha / 10, beta / 10, gamma / 10, interval or AIR_MOUSE_DEFAULT_INTERVAL)
+        for alpha, beta, gamma, interval in struct.iter_unpack(AIR_MOUSE_SAMPLE_FORMAT, message[AIR_MOUSE_HEADER_SIZE:AIR_MOUSE_HEADER_SIZE + count * AIR_MOUSE_SAMPLE_SIZE])
+    ]
+    return speed / 10, dead_zone / 10, samples
+
+# Scales the cursor speed from human (1 slowest, 10 fastest) to rotation rate divider (10 slowest, 2 fastest)
+def to_cursor_divider(speed: float) -> float:
+    speed = max(1.0, min(10.0, speed))
+    return 10 + (speed - 1) * (2 - 10) / (10 - 1)
+
+class AirMouseFusion:
+    """Turns raw rotation rate samples into HID moves: smoothing, dead zone, acceleration curve and sub-unit remainders."""
+
+    def __init__(self) -> None:
+        self.vx = 0.0
+        self.vy = 0.0
+        self.remainder_x = 0.0
+        self.remainder_y = 0.0
+
+    def reset(self) -> None:
+        self.vx = self.vy = 0.0
+        self.remainder_x = self.remainder_y = 0.0
+
+    def process(self, speed: float, dead_zone: float, samples: list[tuple[float, float, float, float]]) -> list[AirMouseMove]:
+        divider = to_cursor_divider(speed)
+        moves: list[AirMouseMove] = []
+        for alpha, beta, gamma, interval in samples:
+            # Same axes as air-mouse card: yaw (gamma) moves horizontally, alpha moves vertically
+            self.vx += AIR_MOUSE_SMOOTHING * (-gamma / divider - self.vx)
+            self.vy += AIR_MOUSE_SMOOTHING * (-alpha / divider - self.vy)
+
+            # Filter micro movements (hand tremor)
+            if abs(self.vx) <= dead_zone and abs(self.vy) <= dead_zone:
+                self.remainder_x = self.remainder_y = 0.0
+                moves.append((0, 0, interval))
+                continue
+
+            # Faster rotations move further
+            magnitude = math.hypot(self.vx, self.vy)
+            gain = min(AIR_MOUSE_ACCELERATION_MAX_GAIN, 1.0 + AIR_MOUSE_ACCELERATION_FACTOR * max(0.0, magnitude - AIR_MOUSE_ACCELERATION_THRESHOLD))
+
+            # Sub-unit moves are carried over to next sample
+            scale = gain * interval / AIR_MOUSE_REFERENCE_INTERVAL
+            x = self.vx * scale + self.remainder_x
+            y = self.vy * scale + self.remainder_y
+            dx = max(AIR_MOUSE_MOVE_MIN, min(AIR_MOUSE_MOVE_MAX, int(x)))
+            dy = max(AIR_MOUSE_MOVE_MIN, min(AIR_MOUSE_MOVE_MAX, int(y)))
+            self.remainder_x = x - dx
+            self.remainder_y = y - dy
+            moves.append((dx, dy, interval))
+        return moves
+
+class AirMouse:
+    """Per-connection air-mouse: fuses received batches and replays resulting moves at samples pace."""
+
+    def __init__(self, move: Callable[[int, int], None], on_error: Callable[[Exception], Awaitable[None]]) -> None:
+        self.move = move
+        self.on_error = on_error
+        self.fusion = AirMouseFusion()
+        self._moves: collections.deque[AirMouseMove] = collections.deque()
+        self._backlog = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def push(self, speed: float, dead_zone: float, samples: list[tuple[float, float, float, float]]) -> None:
+        for move in self.fusion.process(speed, dead_zone, samples):
+            self._moves.append(move)
+            self._backlog += move[2]
+
+        # Too late to replay at samples pace: merge pending moves
+        if self._backlog > AIR_MOUSE_MAX_BACKLOG:
+            dx = sum(move[0] for move in self._moves)
+            dy = sum(move[1] for move in self._moves)
+            if logger.getEffectiveLevel() == logging.DEBUG:
+                logger.debug(f"Air-mouse backlog of {self._backlog:.0f}ms merged ({len(self._moves)} moves)")
+            self._moves.clear()
+            self._moves.append((dx, dy, 0.0))
+            self._backlog = 0.0
+
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            if not self._moves:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            dx, dy, interval = self._moves.popleft()
+            self._backlog = max(0.0, self._backlog - interval)
+            try:
+                while dx or dy:
+                    step_x = max(AIR_MOUSE_MOVE_MIN, min(AIR_MOUSE_MOVE_MAX, dx))
+                    step_y = max(AIR_MOUSE_MOVE_MIN, min(AIR_MOUSE_MOVE_MAX, dy))
+                    self.move(step_x, step_y)
+                    dx -= step_x
+                    dy -= step_y
+            except Exception as ex:
+                # Device failure: drop pending moves, let connection report it
+                self._moves.clear()
+                self._backlog = 0.0
+                self.fusion.reset()
+                await self.on_error(ex)
+                continue
+
+            if interval:
+                await asyncio.sleep(interval / 1000)
+
+    async def stop(self) -> None:
+        self._moves.clear()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
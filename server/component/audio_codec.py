@@ -0,0 +1,44 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Audio stream codecs (selected by audio:start, applies to every following audio buffer of the connection).
+# Decoded audio is always 16 kHz mono signed 16-bit little-endian PCM.
+AUDIO_CODEC_PCM = 0x00    # 16-bit PCM as is
+AUDIO_CODEC_MULAW = 0x01  # G.711 mu-law: 8 bits per sample
+
+AUDIO_CODECS_NAMES = {
+    AUDIO_CODEC_PCM: "pcm",
+    AUDIO_CODEC_MULAW: "ulaw",
+}
+
+MULAW_BIAS = 0x84
+
+def mulaw_to_linear(value: int) -> int:
+    value = ~value & 0xFF
+    exponent = (value >> 4) & 0x07
+    mantissa = value & 0x0F
+    sample = (((mantissa << 3) + MULAW_BIAS) << exponent) - MULAW_BIAS
+    return -sample if value & 0x80 else sample
+
+# Mu-law byte to PCM low and high bytes: decoding is done by two bytes.translate (no per sample python loop)
+MULAW_DECODE_LOW = bytes(mulaw_to_linear(value) & 0xFF for value in range(256))
+MULAW_DECODE_HIGH = bytes((mulaw_to_linear(value) >> 8) & 0xFF for value in range(256))
+
+def is_audio_codec_supported(codec: int) -> bool:
+    return codec in AUDIO_CODECS_NAMES
+
+def get_audio_codec_name(codec: int) -> str:
+    return AUDIO_CODECS_NAMES.get(codec, f"0x{codec:02X}")
+
+def decode_mulaw(buffer: bytes) -> bytes:
+    pcm = bytearray(2 * len(buffer))
+    pcm[0::2] = buffer.translate(MULAW_DECODE_LOW)
+    pcm[1::2] = buffer.translate(MULAW_DECODE_HIGH)
+    return bytes(pcm)
+
+def decode_audio(codec: int, buffer: bytes) -> bytes:
+    """Decode received audio buffer into 16 kHz mono 16-bit PCM."""
+    if codec == AUDIO_CODEC_MULAW:
+        return decode_mulaw(buffer)
+    return buffer
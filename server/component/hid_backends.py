@@ -0,0 +1,489 @@
+import logging
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# zero_hid is only required by the "zero_hid" backend: keep a compatible
+# WriteError around so the server can run on machines without a USB gadget.
+try:
+    from zero_hid.hid.write import WriteError
+except ImportError:
+    class WriteError(Exception):
+        pass
+
+# HID keyboard usages needing server-side state tracking
+KEY_CAPSLOCK = 0x39
+KEY_SCROLLLOCK = 0x47
+KEY_NUMLOCK = 0x53
+
+# Virtual screen used by the simulated mouse cursor
+SIMULATED_SCREEN_WIDTH = 1920
+SIMULATED_SCREEN_HEIGHT = 1080
+
+
+# =========================================================
+# Backend interface
+# =========================================================
+
+# A backend exposes the four HID functions used by the websockets server.
+# Each function mirrors the zero_hid API:
+# - mouse: move(x, y), scroll_x(x), scroll_y(y), left_click(release), middle_click(release), right_click(release), release()
+# - keyboard: type(chars), press(mods, keys, release)
+# - consumer: press(cons, release)
+# - microphone: start_audio(), write_audio(buffer), stop_audio()
+class HidBackend(ABC):
+    name = "base"
+
+    def __init__(self, layout: str = "FR") -> None:
+        self.layout = layout
+        self._devices: dict[str, Any] = {}
+
+    # Devices are opened on first use: server startup does not wait for the gadget,
+    # and a device that is never used (ex: microphone) is never opened
+    @property
+    def mouse(self):
+        return self.get_device("mouse")
+
+    @property
+    def keyboard(self):
+        return self.get_device("keyboard")
+
+    @property
+    def consumer(self):
+        return self.get_device("consumer")
+
+    @property
+    def microphone(self):
+        return self.get_device("microphone")
+
+    def get_device(self, kind: str):
+        device = self._devices.get(kind)
+        if device is None:
+            device = self.create_device(kind)
+            self._devices[kind] = device
+            logger.info(f"Opened {self.name} HID {kind}")
+        return device
+
+    @abstractmethod
+    def create_device(self, kind: str):
+        ...
+
+    def set_layout(self, layout: str) -> None:
+        if layout == self.layout:
+            return
+        self.layout = layout
+        # Keyboard will be re-opened with the new layout on next use
+        self._devices.pop("keyboard", None)
+        logger.info(f"Keyboard layout set to {layout}")
+
+    def close(self) -> None:
+        self._devices.clear()
+
+
+# =========================================================
+# Real USB gadget backend (zero_hid)
+# =========================================================
+
+class ZeroHidBackend(HidBackend):
+    name = "zero_hid"
+
+    def __init__(self, layout: str = "FR") -> None:
+        super().__init__(layout)
+        self._device = None
+
+    def create_device(self, kind: str):
+        import zero_hid
+
+        if kind == "microphone":
+            return zero_hid.Microphone()
+
+        if self._device is None:
+            self._device = zero_hid.Device()
+        if kind == "mouse":
+            return zero_hid.Mouse(self._device)
+        if kind == "keyboard":
+            return zero_hid.Keyboard(self._device, self.layout)
+        if kind == "consumer":
+            return zero_hid.Consumer(self._device)
+        raise ValueError(f"Unknown HID device kind: {kind}")
+
+    def close(self) -> None:
+        device = self._device
+        self._device = None
+        super().close()
+        if device is not None and hasattr(device, "close"):
+            try:
+                device.close()
+            except Exception as ex:
+                logger.warning(f"Swallowed error while closing HID device: {ex}")
+
+
+# =========================================================
+# In-memory simulated backend (no USB gadget required)
+# =========================================================
+
+class SimulatedMouse:
+    def __init__(self, width: int = SIMULATED_SCREEN_WIDTH, height: int = SIMULATED_SCREEN_HEIGHT) -> None:
+        self.width = width
+        self.height = height
+        self.x = width // 2
+        self.y = height // 2
+        self.buttons: set[str] = set()
+        self.scroll_x_total = 0
+        self.scroll_y_total = 0
+        self.reports = 0
+
+    def move(self, x: int, y: int) -> None:
+        self.x = max(0, min(self.width - 1, self.x + x))
+        self.y = max(0, min(self.height - 1, self.y + y))
+        self.reports += 1
+
+    def scroll_x(self, x: int) -> None:
+        self.scroll_x_total += x
+        self.reports += 1
+
+    def scroll_y(self, y: int) -> None:
+        self.scroll_y_total += y
+        self.reports += 1
+
+    def _click(self, button: str, release: bool) -> None:
+        self.buttons.add(button)
+        self.reports += 1
+        if release:
+            self.release()
+
+    def left_click(self, release: bool = True) -> None:
+        self._click("left", release)
+
+    def middle_click(self, release: bool = True) -> None:
+        self._click("middle", release)
+
+    def right_click(self, release: bool = True) -> None:
+        self._click("right", release)
+
+    def release(self) -> None:
+        self.buttons.clear()
+        self.reports += 1
+
+
+class SimulatedKeyboard:
+    def __init__(self) -> None:
+        self.modifiers: list[int] = []
+        self.keys: list[int] = []
+        self.typed_chars = 0
+        self.reports = 0
+
+    def type(self, chars: str) -> None:
+        self.typed_chars += len(chars)
+        # Each char is a press report followed by a release report
+        self.reports += 2 * len(chars)
+
+    def press(self, mods: list[int], keys: list[int], release: bool = True) -> None:
+        self.modifiers = list(mods)
+        self.keys = list(keys)
+        self.reports += 1
+        if release:
+            self.modifiers = []
+            self.keys = []
+            self.reports += 1
+
+
+class SimulatedConsumer:
+    def __init__(self) -> None:
+        self.cons: list[int] = []
+        self.reports = 0
+
+    def press(self, cons: list[int], release: bool = True) -> None:
+        self.cons = list(cons)
+        self.reports += 1
+        if release:
+            self.cons = []
+            self.reports += 1
+
+
+class SimulatedMicrophone:
+    def __init__(self) -> None:
+        self.started = False
+        self.bytes_written = 0
+
+    def start_audio(self) -> None:
+        self.started = True
+
+    def write_audio(self, buffer: bytes) -> None:
+        self.bytes_written += len(buffer)
+
+    def stop_audio(self) -> None:
+        self.started = False
+
+
+class SimulatedBackend(HidBackend):
+    name = "simulated"
+
+    def create_device(self, kind: str):
+        if kind == "mouse":
+            return SimulatedMouse()
+        if kind == "keyboard":
+            return SimulatedKeyboard()
+        if kind == "consumer":
+            return SimulatedConsumer()
+        if kind == "microphone":
+            return SimulatedMicrophone()
+        raise ValueError(f"Unknown HID device kind: {kind}")
+
+    def stats(self) -> dict:
+        return {
+            "cursor": (self.mouse.x, self.mouse.y),
+            "buttons": sorted(self.mouse.buttons),
+            "mouse_reports": self.mouse.reports,
+            "keyboard_reports": self.keyboard.reports,
+            "consumer_reports": self.consumer.reports,
+            "audio_bytes": self.microphone.bytes_written,
+        }
+
+
+# =========================================================
+# Linux uinput backend (python-evdev, optional)
+# =========================================================
+
+# HID keyboard usage (index) to Linux input event code (value), from 0x00 to 0x73
+# (same table as the kernel HID input driver).
+HID_TO_EVDEV_KEYS = (
+      0,   0,   0,   0,  30,  48,  46,  32,  18,  33,  34,  35,  23,  36,  37,  38,
+     50,  49,  24,  25,  16,  19,  31,  20,  22,  47,  17,  45,  21,  44,   2,   3,
+      4,   5,   6,   7,   8,   9,  10,  11,  28,   1,  14,  15,  57,  12,  13,  26,
+     27,  43,  43,  39,  40,  41,  51,  52,  53,  58,  59,  60,  61,  62,  63,  64,
+     65,  66,  67,  68,  87,  88,  99,  70, 119, 110, 102, 104, 111, 107, 109, 106,
+    105, 108, 103,  69,  98,  55,  74,  78,  96,  79,  80,  81,  75,  76,  77,  71,
+     72,  73,  82,  83,  86, 127, 116, 117, 183, 184, 185, 186, 187, 188, 189, 190,
+    191, 192, 193, 194,
+)
+
+# HID keyboard modifiers bits to Linux input event codes (LCTRL, LSHIFT, LALT, LMETA, RCTRL, RSHIFT, RALT, RMETA)
+HID_MODIFIER_TO_EVDEV_KEYS = (29, 42, 56, 125, 97, 54, 100, 126)
+
+# HID consumer usages to Linux input event codes (most common remote controls usages)
+HID_CONSUMER_TO_EVDEV_KEYS = {
+    0x0030: 116,  # Power
+    0x0040: 139,  # Menu
+    0x00B0: 207,  # Play
+    0x00B1: 119,  # Pause
+    0x00B3: 208,  # Fast forward
+    0x00B4: 168,  # Rewind
+    0x00B5: 163,  # Scan next track
+    0x00B6: 165,  # Scan previous track
+    0x00B7: 166,  # Stop
+    0x00CD: 164,  # Play/Pause
+    0x00E2: 113,  # Mute
+    0x00E9: 115,  # Volume up
+    0x00EA: 114,  # Volume down
+    0x0221: 217,  # AC Search
+    0x0223: 172,  # AC Home
+    0x0224: 158,  # AC Back
+}
+
+# US-qwerty chars typed through uinput: char -> (HID usage, shifted)
+US_CHARS_TO_HID = {" ": (0x2C, False), "\n": (0x28, False), "\t": (0x2B, False)}
+for index, char in enumerate("abcdefghijklmnopqrstuvwxyz"):
+    US_CHARS_TO_HID[char] = (0x04 + index, False)
+    US_CHARS_TO_HID[char.upper()] = (0x04 + index, True)
+for index, (char, shifted_char) in enumerate(zip("1234567890", "!@#$%^&*()")):
+    US_CHARS_TO_HID[char] = (0x1E + index, False)
+    US_CHARS_TO_HID[shifted_char] = (0x1E + index, True)
+for usage, char, shifted_char in (
+    (0x2D, "-", "_"), (0x2E, "=", "+"), (0x2F, "[", "{"), (0x30, "]", "}"), (0x31, "\\", "|"),
+    (0x33, ";", ":"), (0x34, "'", "\""), (0x35, "`", "~"), (0x36, ",", "<"), (0x37, ".", ">"), (0x38, "/", "?"),
+):
+    US_CHARS_TO_HID[char] = (usage, False)
+    US_CHARS_TO_HID[shifted_char] = (usage, True)
+
+HID_MOD_LEFT_SHIFT = 0x02
+EVDEV_BTN_LEFT = 0x110
+EVDEV_BTN_RIGHT = 0x111
+EVDEV_BTN_MIDDLE = 0x112
+
+
+class UinputDevice:
+    def __init__(self, uinput, ecodes) -> None:
+        self._uinput = uinput
+        self._ecodes = ecodes
+
+    def key(self, code: int, value: int) -> None:
+        self._uinput.write(self._ecodes.EV_KEY, code, value)
+
+    def rel(self, code: int, value: int) -> None:
+        self._uinput.write(self._ecodes.EV_REL, code, value)
+
+    def sync(self) -> None:
+        self._uinput.syn()
+
+
+class UinputMouse:
+    def __init__(self, device: UinputDevice, ecodes) -> None:
+        self._device = device
+        self._ecodes = ecodes
+        self._buttons: set[int] = set()
+
+    def move(self, x: int, y: int) -> None:
+        if x:
+            self._device.rel(self._ecodes.REL_X, x)
+        if y:
+            self._device.rel(self._ecodes.REL_Y, y)
+        self._device.sync()
+
+    def scroll_x(self, x: int) -> None:
+        self._device.rel(self._ecodes.REL_HWHEEL, x)
+        self._device.sync()
+
+    def scroll_y(self, y: int) -> None:
+        self._device.rel(self._ecodes.REL_WHEEL, y)
+        self._device.sync()
+
+    def _click(self, button: int, release: bool) -> None:
+        self._device.key(button, 1)
+        self._buttons.add(button)
+        self._device.sync()
+        if release:
+            self.release()
+
+    def left_click(self, release: bool = True) -> None:
+        self._click(EVDEV_BTN_LEFT, release)
+
+    def middle_click(self, release: bool = True) -> None:
+        self._click(EVDEV_BTN_MIDDLE, release)
+
+    def right_click(self, release: bool = True) -> None:
+        self._click(EVDEV_BTN_RIGHT, release)
+
+    def release(self) -> None:
+        for button in self._buttons:
+            self._device.key(button, 0)
+        self._buttons.clear()
+        self._device.sync()
+
+
+class UinputKeyboard:
+    def __init__(self, device: UinputDevice) -> None:
+        self._device = device
+        self._pressed: set[int] = set()
+
+    def type(self, chars: str) -> None:
+        for char in chars:
+            hid_key = US_CHARS_TO_HID.get(char)
+            if hid_key is None:
+                logger.warning("Unsupported char for uinput typing: %r", char)
+                continue
+            usage, shifted = hid_key
+            self.press([HID_MOD_LEFT_SHIFT] if shifted else [], [usage], release=True)
+
+    def press(self, mods: list[int], keys: list[int], release: bool = True) -> None:
+        codes: set[int] = set()
+        modifiers = 0
+        for mod in mods:
+            modifiers |= mod
+        for bit, code in enumerate(HID_MODIFIER_TO_EVDEV_KEYS):
+            if modifiers & (1 << bit):
+                codes.add(code)
+        for key in keys:
+            if 0 <= key < len(HID_TO_EVDEV_KEYS) and HID_TO_EVDEV_KEYS[key]:
+                codes.add(HID_TO_EVDEV_KEYS[key])
+
+        # HID reports are absolute: release keys absent from the new report, then press new ones
+        for code in self._pressed - codes:
+            self._device.key(code, 0)
+        for code in codes - self._pressed:
+            self._device.key(code, 1)
+        self._pressed = codes
+        self._device.sync()
+        if release:
+            self.press([], [], release=False)
+
+
+class UinputConsumer:
+    def __init__(self, device: UinputDevice) -> None:
+        self._device = device
+        self._pressed: set[int] = set()
+
+    def press(self, cons: list[int], release: bool = True) -> None:
+        codes = {HID_CONSUMER_TO_EVDEV_KEYS[con] for con in cons if con in HID_CONSUMER_TO_EVDEV_KEYS}
+        for code in self._pressed - codes:
+            self._device.key(code, 0)
+        for code in codes - self._pressed:
+            self._device.key(code, 1)
+        self._pressed = codes
+        self._device.sync()
+        if release:
+            self.press([], release=False)
+
+
+class UinputBackend(HidBackend):
+    name = "uinput"
+
+    def __init__(self, layout: str = "FR") -> None:
+        super().__init__(layout)
+        self._uinput = None
+        self._ecodes = None
+        self._device: UinputDevice | None = None
+
+    def open_uinput(self) -> None:
+        try:
+            from evdev import UInput, ecodes
+        except ImportError as ex:
+            raise RuntimeError("uinput backend requires python-evdev (pip install evdev)") from ex
+
+        key_codes = set(code for code in HID_TO_EVDEV_KEYS if code)
+        key_codes.update(HID_MODIFIER_TO_EVDEV_KEYS)
+        key_codes.update(HID_CONSUMER_TO_EVDEV_KEYS.values())
+        key_codes.update((EVDEV_BTN_LEFT, EVDEV_BTN_RIGHT, EVDEV_BTN_MIDDLE))
+        capabilities = {
+            ecodes.EV_KEY: sorted(key_codes),
+            ecodes.EV_REL: [ecodes.REL_X, ecodes.REL_Y, ecodes.REL_WHEEL, ecodes.REL_HWHEEL],
+        }
+        self._uinput = UInput(capabilities, name="ha-zero-hid")
+        self._ecodes = ecodes
+        self._device = UinputDevice(self._uinput, ecodes)
+
+    def create_device(self, kind: str):
+        # No audio sink through uinput: audio is accounted and discarded
+        if kind == "microphone":
+            return SimulatedMicrophone()
+
+        if self._uinput is None:
+            self.open_uinput()
+        if kind == "mouse":
+            return UinputMouse(self._device, self._ecodes)
+        if kind == "keyboard":
+            # Typing always uses US-qwerty: uinput keycodes are translated by the host keymap
+            return UinputKeyboard(self._device)
+        if kind == "consumer":
+            return UinputConsumer(self._device)
+        raise ValueError(f"Unknown HID device kind: {kind}")
+
+    def close(self) -> None:
+        uinput = self._uinput
+        self._uinput = None
+        self._device = None
+        super().close()
+        if uinput is not None:
+            uinput.close()
+
+
+# =========================================================
+# Backend selection
+# =========================================================
+
+HID_BACKENDS: dict[str, Callable[..., HidBackend]] = {
+    ZeroHidBackend.name: ZeroHidBackend,
+    SimulatedBackend.name: SimulatedBackend,
+    UinputBackend.name: UinputBackend,
+}
+
+def create_backend(name: str, layout: str = "FR") -> HidBackend:
+    name = (name or ZeroHidBackend.name).strip().lower()
+    if name not in HID_BACKENDS:
+        raise ValueError(f"Unknown HID backend '{name}': expected one of {sorted(HID_BACKENDS)}")
+
+    backend = HID_BACKENDS[name](layout)
+    logger.info(f"Using HID backend: {backend.name}")
+    return backend
@@ -0,0 +1,68 @@
+import logging
+
+from collections.abc import Callable
+from typing import Any
+
+from timer_wheel import Timer, TimerWheel
+
+logger = logging.getLogger(__name__)
+
+# HID devices whose reports can be left pressed: keys, consumer keys, mouse buttons
+HOLD_DEVICES = ("keyboard", "consumer", "mouse")
+
+# Default max hold (see "websocket_server_max_hold"), 0 disables it
+HOLD_DEFAULT_MAX = 60  # s
+
+class HoldWatchdog:
+    """Tracks held HID devices with the connection that pressed them: released on connection loss, or once held longer than max hold."""
+
+    def __init__(self, release: Callable[[Any, str], None], max_hold: float = HOLD_DEFAULT_MAX) -> None:
+        self.release = release
+        self.max_hold = max_hold
+        self._wheel = TimerWheel()
+        self._timers = {device: Timer(lambda device=device: self._expire(device)) for device in HOLD_DEVICES}
+        self._owners: dict[str, Any] = {}  # held device -> connection
+
+    def set_max_hold(self, max_hold: float) -> None:
+        self.max_hold = max_hold
+        for device in self._owners:
+            self._start(device)
+
+    def hold(self, websocket, device: str) -> None:
+        """Device report with pressed keys/buttons: (re)starts max hold."""
+        self._owners[device] = websocket
+        self._start(device)
+
+    def unhold(self, device: str) -> None:
+        """Device report without pressed keys/buttons (from any connection: HID devices are shared)."""
+        self._owners.pop(device, None)
+        self._wheel.stop(self._timers[device])
+
+    def touch(self, websocket, device: str) -> None:
+        """Activity on held device (ie. mouse moves while dragging): restarts max hold."""
+        if self._owners.get(device) is websocket:
+            self._start(device)
+
+    def release_connection(self, websocket) -> None:
+        """Connection lost: release every device it left held."""
+        for device in [device for device, owner in self._owners.items() if owner is websocket]:
+            logger.warning(f"Connection lost while {device} held: releasing it")
+            self._release(device)
+
+    def _start(self, device: str) -> None:
+        if self.max_hold > 0:
+            self._wheel.start(self._timers[device], self.max_hold)
+        else:
+            self._wheel.stop(self._timers[device])
+
+    def _expire(self, device: str) -> None:
+        logger.warning(f"{device.capitalize()} held for more than {self.max_hold}s (release lost?): releasing it")
+        self._release(device)
+
+    def _release(self, device: str) -> None:
+        owner = self._owners.get(device)
+        self.unhold(device)
+        try:
+            self.release(owner, device)
+        except Exception as ex:
+            logger.exception(f"HID release of held {device} failed: {ex}")
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import struct
+
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Repeat header (after command byte): [delay][interval] in ms, 0 to use server defaults
+KEY_REPEAT_HEADER_FORMAT = "<HH"
+KEY_REPEAT_HEADER_SIZE = struct.calcsize(KEY_REPEAT_HEADER_FORMAT)
+
+# Server defaults (see "websocket_server_key_repeat_delay" and "websocket_server_key_repeat_interval")
+KEY_REPEAT_DEFAULT_DELAY = 500  # ms
+KEY_REPEAT_DEFAULT_INTERVAL = 33  # ms (~30 repeats/s)
+
+# Bounds: clients can not flood the target device with repeats
+KEY_REPEAT_MIN_DELAY = 50  # ms
+KEY_REPEAT_MAX_DELAY = 5000  # ms
+KEY_REPEAT_MIN_INTERVAL = 20  # ms
+KEY_REPEAT_MAX_INTERVAL = 1000  # ms
+
+def parse_key_repeat_header(message: bytes, default_delay: int, default_interval: int) -> tuple[int, int, bytes] | None:
+    """Parse repeat header following command byte, returns (delay, interval, remaining payload) or None when malformed."""
+    if len(message) < 1 + KEY_REPEAT_HEADER_SIZE:
+        return None
+    delay, interval = struct.unpack_from(KEY_REPEAT_HEADER_FORMAT, message, 1)
+    delay = max(KEY_REPEAT_MIN_DELAY, min(KEY_REPEAT_MAX_DELAY, delay or default_delay))
+    interval = max(KEY_REPEAT_MIN_INTERVAL, min(KEY_REPEAT_MAX_INTERVAL, interval or default_interval))
+    return delay, interval, message[1 + KEY_REPEAT_HEADER_SIZE:]
+
+class KeyRepeat:
+    """Per-connection auto-repeat of one device (keyboard or consumer): re-sends held report (release then press) at a fixed rate until stopped."""
+
+    def __init__(self, name: str, on_error: Callable[[Exception], Awaitable[None]]) -> None:
+        self.name = name
+        self.on_error = on_error
+        self._task: asyncio.Task | None = None
+
+    def start(self, press: Callable[[], None], release: Callable[[], None], delay: int, interval: int) -> None:
+        # Held report was just pressed by caller: only repeats are sent from here
+        self.cancel()
+        self._task = asyncio.create_task(self._run(press, release, delay, interval))
+
+    async def _run(self, press: Callable[[], None], release: Callable[[], None], delay: int, interval: int) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = loop.time() + delay / 1000
+        repeats = 0
+        while True:
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            try:
+                release()
+                press()
+            except Exception as ex:
+                # Device failure: stop repeating, let connection report it
+                await self.on_error(ex)
+                return
+            repeats += 1
+
+            # Fixed rate (no drift), late repeats are skipped instead of sent in bursts
+            next_at = max(next_at + interval / 1000, loop.time())
+            if logger.getEffectiveLevel() == logging.DEBUG and repeats % 100 == 0:
+                logger.debug(f"Key repeat ({self.name}): {repeats} repeats sent")
+
+    def cancel(self) -> None:
+        """Stop repeating, held report is left as is (replaced by the next report, or released by hold watchdog)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
@@ -0,0 +1,131 @@
+import ipaddress
+import logging
+
+from hold_watchdog import HOLD_DEFAULT_MAX
+from key_repeat import KEY_REPEAT_DEFAULT_DELAY, KEY_REPEAT_DEFAULT_INTERVAL, KEY_REPEAT_MIN_DELAY, KEY_REPEAT_MAX_DELAY, KEY_REPEAT_MIN_INTERVAL, KEY_REPEAT_MAX_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Default server config file (written by install.sh)
+CONFIG_FILE = "/home/ha_zero_hid/ha_zero_hid.config"
+
+# Max distinct client IPs whose handshake decision is remembered
+AUTHORIZED_IPS_CACHE_SIZE = 256
+
+LOG_LEVELS = ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+
+# Loggers whose level follows "websocket_server_log_level" (see logging.conf)
+MANAGED_LOGGERS = ("", "zero_hid.hid.write", "zero_hid.microphone")
+
+class ServerConfig:
+    def __init__(self, values: dict[str, str]) -> None:
+        self.log_level: str = values.get("websocket_server_log_level", "WARNING").upper()
+        if self.log_level not in LOG_LEVELS:
+            raise ValueError(f"Invalid websocket_server_log_level '{self.log_level}': expected one of {LOG_LEVELS}")
+
+        port = values.get("websocket_server_port", "8765")
+        try:
+            self.port: int = int(port)
+        except ValueError:
+            raise ValueError(f"Invalid websocket_server_port '{port}': expected an integer")
+        if not 1 <= self.port <= 65535:
+            raise ValueError(f"Invalid websocket_server_port '{port}': expected 1 <= port <= 65535")
+
+        self.secret: str = values.get("websocket_server_secret", "")
+        if not self.secret:
+            raise ValueError("Invalid websocket_server_secret: expected a non-empty secret")
+
+        # Clients whitelist: single IPs (exact match) and CIDR networks (ex: 192.168.1.0/24)
+        authorized_ips: set[str] = set()
+        authorized_networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network] = []
+        for entry in values.get("websocket_authorized_clients_ips", "").split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            try:
+                network = ipaddress.ip_network(entry, strict=False)
+            except ValueError:
+                raise ValueError(f"Invalid websocket_authorized_clients_ips entry '{entry}': expected an IP or a CIDR network")
+            if network.num_addresses == 1:
+                authorized_ips.add(str(network.network_address))
+            else:
+                authorized_networks.append(network)
+        self.authorized_ips: frozenset[str] = frozenset(authorized_ips)
+        self.authorized_networks: tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...] = tuple(authorized_networks)
+
+        # Handshake decisions by client IP (config is replaced on reload, so is this cache)
+        self._authorized_ips_cache: dict[str, bool] = {}
+
+        self.hid_backend: str = values.get("websocket_server_hid_backend", "zero_hid")
+        self.keyboard_layout: str = values.get("websocket_server_keyboard_layout", "FR")
+
+        # Server-side key auto-repeat (used when clients do not provide their own delay/interval)
+        self.key_repeat_delay: int = parse_int_range(values, "websocket_server_key_repeat_delay", KEY_REPEAT_DEFAULT_DELAY, KEY_REPEAT_MIN_DELAY, KEY_REPEAT_MAX_DELAY)
+        self.key_repeat_interval: int = parse_int_range(values, "websocket_server_key_repeat_interval", KEY_REPEAT_DEFAULT_INTERVAL, KEY_REPEAT_MIN_INTERVAL, KEY_REPEAT_MAX_INTERVAL)
+
+        # Held keys/buttons are released after this duration without a new report (in s, 0: only on connection loss).
+        # Server-side repeats are not reports: max hold also caps how long a key is auto-repeated (lost release frame)
+        self.max_hold: int = parse_int_range(values, "websocket_server_max_hold", HOLD_DEFAULT_MAX, 0, 3600)
+
+    def is_authorized_ip(self, client_ip: str) -> bool:
+        # Fast path: exact IP match
+        if client_ip in self.authorized_ips:
+            return True
+
+        authorized = self._authorized_ips_cache.get(client_ip)
+        if authorized is None:
+            authorized = self._match_authorized_ip(client_ip)
+            if len(self._authorized_ips_cache) >= AUTHORIZED_IPS_CACHE_SIZE:
+                self._authorized_ips_cache.clear()
+            self._authorized_ips_cache[client_ip] = authorized
+        return authorized
+
+    def _match_authorized_ip(self, client_ip: str) -> bool:
+        try:
+            address = ipaddress.ip_address(client_ip)
+        except ValueError:
+            return False
+        # IPv4 clients reaching a dual-stack socket show up as "::ffff:a.b.c.d"
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if str(address) in self.authorized_ips:
+            return True
+        return any(address in network for network in self.authorized_networks)
+
+def parse_int_range(values: dict[str, str], key: str, default: int, min_value: int, max_value: int) -> int:
+    value = values.get(key, str(default))
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid {key} '{value}': expected an integer")
+    if not min_value <= parsed <= max_value:
+        raise ValueError(f"Invalid {key} '{value}': expected {min_value} <= {key} <= {max_value}")
+    return parsed
+
+def parse_config(content: str) -> dict[str, str]:
+    # Same format as install.sh: one "key: value" per line, values optionally single-quoted
+    values: dict[str, str] = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == "'":
+            value = value[1:-1]
+        values[key.strip()] = value
+    return values
+
+def load_config(path: str = CONFIG_FILE) -> ServerConfig:
+    with open(path, "r", encoding="utf-8") as f:
+        config = ServerConfig(parse_config(f.read()))
+    logger.info(f"Config loaded from {path}")
+    return config
+
+def apply_log_level(log_level: str) -> None:
+    level = logging.getLevelName(log_level)
+    for logger_name in MANAGED_LOGGERS:
+        managed_logger = logging.getLogger(logger_name)
+        managed_logger.setLevel(level)
+        for handler in managed_logger.handlers:
+            handler.setLevel(level)
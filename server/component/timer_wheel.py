@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import math
+
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Timers expire on first tick after their delay (never early, at most one tick late)
+TIMER_WHEEL_TICK = 0.1  # s
+
+# Wheel revolution (25.6s): longer delays wait for one or more revolutions
+TIMER_WHEEL_SLOTS = 256
+
+class Timer:
+    """Reusable timer: created once, then started and stopped at will (callback runs each time it expires)."""
+
+    __slots__ = ("callback", "deadline", "slot", "active")
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self.callback = callback
+        self.deadline = 0
+        self.slot = 0
+        self.active = False
+
+class TimerWheel:
+    """Hashed timing wheel: every pending timer runs from a single event loop callback, starting and stopping one is a set insertion/deletion."""
+
+    def __init__(self, tick: float = TIMER_WHEEL_TICK, slots: int = TIMER_WHEEL_SLOTS) -> None:
+        self.tick = tick
+        self._slots: list[set[Timer]] = [set() for _ in range(slots)]
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._origin = 0.0
+        self._tick = 0  # next tick to process
+        self._size = 0  # active timers count
+        self._handle: asyncio.TimerHandle | None = None  # event loop callback (single one)
+        self._handle_tick: int | None = None  # tick event loop callback wakes up at
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _current_tick(self) -> int:
+        # Rounding margin: woken up at tick time, never reported one tick early
+        return math.floor((self._loop.time() - self._origin) / self.tick + 1e-9)
+
+    def start(self, timer: Timer, delay: float) -> None:
+        """(Re)start timer: expires once delay (in s) elapsed, unless stopped before."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._origin = self._loop.time()
+        if timer.active:
+            self.stop(timer)
+
+        deadline = max(self._tick, math.ceil((self._loop.time() - self._origin + max(0.0, delay)) / self.tick - 1e-9))
+        timer.deadline = deadline
+        timer.slot = deadline % len(self._slots)
+        timer.active = True
+        self._slots[timer.slot].add(timer)
+        self._size += 1
+
+        # Event loop callback only moves when this timer expires first
+        if self._handle_tick is None or deadline < self._handle_tick:
+            self._arm(deadline)
+
+    def stop(self, timer: Timer) -> None:
+        if not timer.active:
+            return
+        self._slots[timer.slot].discard(timer)
+        timer.active = False
+        self._size -= 1
+        # Event loop callback is kept: it re-arms itself for next timer (if any) when it wakes up
+
+    def close(self) -> None:
+        if self._handle:
+            self._handle.cancel()
+        self._handle = None
+        self._handle_tick = None
+
+    def _arm(self, tick: int) -> None:
+        if self._handle:
+            self._handle.cancel()
+        self._handle_tick = tick
+        self._handle = self._loop.call_at(self._origin + tick * self.tick, self._on_tick)
+
+    def _on_tick(self) -> None:
+        self._handle = None
+        self._handle_tick = None
+
+        # Collect expired timers of every elapsed tick (whole wheel at most: late wake up)
+        current_tick = self._current_tick()
+        last_tick = min(current_tick, self._tick + len(self._slots) - 1)
+        expired: list[Timer] = []
+        for tick in range(self._tick, last_tick + 1):
+            slot = self._slots[tick % len(self._slots)]
+            for timer in [timer for timer in slot if timer.deadline <= current_tick]:
+                slot.discard(timer)
+                timer.active = False
+                self._size -= 1
+                expired.append(timer)
+        self._tick = current_tick + 1
+
+        # Run callbacks (in deadline order): they might start timers again
+        expired.sort(key=lambda timer: timer.deadline)
+        for timer in expired:
+            try:
+                timer.callback()
+            except Exception as ex:
+                logger.exception(f"Timer callback failed: {ex}")
+
+        next_tick = self._next_deadline()
+        if next_tick is not None and (self._handle_tick is None or next_tick < self._handle_tick):
+            self._arm(next_tick)
+
+    def _next_deadline(self) -> int | None:
+        # Earliest deadline within next revolution (otherwise wakes up one revolution later, to look again)
+        if self._size == 0:
+            return None
+        for tick in range(self._tick, self._tick + len(self._slots)):
+            for timer in self._slots[tick % len(self._slots)]:
+                if timer.deadline == tick:
+                    return tick
+        return self._tick + len(self._slots)
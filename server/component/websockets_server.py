@@ -1,6 +1,8 @@
 import asyncio
 import errno
+import hmac
 import signal
+import sys
 import websockets
 import http
 import json
@@ -10,30 +12,30 @@ import ssl
 import struct
 
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import Set
 from websockets.server import Request
-from zero_hid import Device, Mouse, Microphone, Keyboard, KeyCodes, Consumer, ConsumerCodes
-from zero_hid.hid.write import WriteError
+from air_mouse import AirMouse, parse_air_mouse_batch
+from audio_codec import AUDIO_CODEC_PCM, decode_audio, get_audio_codec_name, is_audio_codec_supported
+from hold_watchdog import HoldWatchdog
+from key_repeat import KeyRepeat, parse_key_repeat_header
+from hid_backends import HidBackend, SimulatedBackend, create_backend, WriteError, KEY_NUMLOCK, KEY_CAPSLOCK, KEY_SCROLLLOCK
+from server_config import CONFIG_FILE, ServerConfig, load_config, apply_log_level
 
 logging.config.fileConfig('logging.conf')
 logger = logging.getLogger(__name__)
 
-# Clients IPs whitelist
-AUTHORIZED_IPS: Set[str] = set(ip.strip() for ip in "<websocket_authorized_clients_ips>".split(","))
-
-
 # Server config
 SERVER_HOST = "0.0.0.0"
-SERVER_PORT = <websocket_server_port>
-SERVER_SECRET = "<websocket_server_secret>"
+SERVER_CONFIG_FILE = sys.argv[1] if len(sys.argv) > 1 else CONFIG_FILE
+
+# Loaded in main(), then replaced on SIGHUP (see reload_config)
+config: ServerConfig | None = None
 
-# SSL Context
-ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-ssl_context.load_cert_chain(certfile="server.crt", keyfile="server.key")
+# HID backend (devices are opened on first use)
+hid_backend: HidBackend | None = None
+
+# Held keys/buttons by connection (released on connection loss or after max hold)
+hold_watchdog: HoldWatchdog | None = None
 
-hid = Device()
-mouse = Mouse(hid)
-keyboard = Keyboard(hid, "FR")
 keyboard_state = {
     "modifiers": [],
     "keys": [],
@@ -41,13 +43,21 @@ keyboard_state = {
     "capslock": False,
     "scrolllock": False,
 }
-key_codes_map = KeyCodes.as_dict()
-consumer = Consumer(hid)
-consumer_codes_map = ConsumerCodes.as_dict()
-microphone = Microphone()
 
 recorded_chunks = []
 
+# Air-mouse (sensor fusion and moves replay) by connection
+air_mice: dict = {}
+
+# Audio stream codec by connection (selected by audio:start)
+audio_codecs: dict = {}
+
+# Server-side key auto-repeat by connection, then by device ("keyboard", "consumer")
+key_repeats: dict = {}
+
+# Lock keys toggle host state: never auto-repeated
+LOCK_KEYS = (KEY_NUMLOCK, KEY_CAPSLOCK, KEY_SCROLLLOCK)
+
 def create_wav_file():
     sample_rate = 16000
     num_channels = 1
@@ -95,6 +105,11 @@ def create_wav_file():
     wav_data = bytes(header) + audio_data
     return wav_data
 
+def write_audio(websocket, buffer: bytes) -> None:
+    pcm = decode_audio(audio_codecs.get(websocket, AUDIO_CODEC_PCM), buffer)
+    #recorded_chunks.append(pcm)
+    hid_backend.microphone.write_audio(pcm)
+
 async def process_request(connection, request: Request):
     # Get client IP from transport
     remote = connection.remote_address  # a tuple (host, port)
@@ -106,20 +121,21 @@ async def process_request(connection, request: Request):
         return http.HTTPStatus.FORBIDDEN, [], b"Forbidden: unknown IP"
 
     # IP check
-    if client_ip not in AUTHORIZED_IPS:
+    if not config.is_authorized_ip(client_ip):
         logger.warning(f"Rejected IP: {client_ip}")
         return http.HTTPStatus.FORBIDDEN, [], b"Forbidden: IP not allowed"
 
     # Read headers
-    secret = request.headers["X-Secret"]
+    secret = request.headers.get("X-Secret")
 
     if not secret:
         logger.warning("Missing X-Secret header")
         return http.HTTPStatus.UNAUTHORIZED, [], b"Unauthorized: missing secret"
 
     # Secret check
-    if secret != SERVER_SECRET:
-        logger.warning(f"Rejected secret: {secret}")
+    # Constant-time comparison (do not leak secret length/prefix through timing)
+    if not hmac.compare_digest(secret.encode("utf-8"), config.secret.encode("utf-8")):
+        logger.warning(f"Rejected secret from IP: {client_ip}")
         return http.HTTPStatus.UNAUTHORIZED, [], b"Unauthorized: secret does not match"
 
     logger.info(f"Authorized: IP={client_ip}")
@@ -131,22 +147,134 @@ async def handle_client(websocket) -> None:
         async for message in websocket:
             try:
                 await handle_message(websocket, message)
-            except WriteError as hidEx:
-                logger.exception(f"HID write failed: {hidEx}")
-                try:
-                    error_data: dict = {}
-                    cause = hidEx.__cause__
-                    if isinstance(cause, ValueError) and "closed file" in str(cause):
-                        error_data["err"] = errno.ENODEV
-                    elif isinstance(cause, FuturesTimeoutError):
-                        error_data["err"] = errno.EWOULDBLOCK
-                    elif isinstance(cause, OSError):
-                        error_data["err"] = cause.errno
-                    await send_error(websocket, error_data)
-                except Exception as sendEx:
-                    logger.exception(f"Could not send HID write error back to client: {sendEx}")
+            except (WriteError, OSError) as hidEx:
+                await send_hid_error(websocket, hidEx)
     except websockets.ConnectionClosed:
         logger.info("Client disconnected")
+    finally:
+        audio_codecs.pop(websocket, None)
+        cancel_key_repeats(websocket)
+        hold_watchdog.release_connection(websocket)
+        air_mouse = air_mice.pop(websocket, None)
+        if air_mouse:
+            await air_mouse.stop()
+
+        # Simulated backend (dev box): reports sent so far, for throughput tests and profiling
+        if logger.getEffectiveLevel() == logging.DEBUG and isinstance(hid_backend, SimulatedBackend):
+            logger.debug("Simulated HID stats: %s", hid_backend.stats())
+
+def get_hid_error_data(hidEx: Exception) -> dict:
+    error_data: dict = {}
+    if isinstance(hidEx, WriteError):
+        cause = hidEx.__cause__
+        if isinstance(cause, ValueError) and "closed file" in str(cause):
+            error_data["err"] = errno.ENODEV
+        elif isinstance(cause, FuturesTimeoutError):
+            error_data["err"] = errno.EWOULDBLOCK
+        elif isinstance(cause, OSError):
+            error_data["err"] = cause.errno
+    elif isinstance(hidEx, OSError):
+        error_data["err"] = hidEx.errno
+    return error_data
+
+async def send_hid_error(websocket, hidEx: Exception) -> None:
+    if isinstance(hidEx, WriteError):
+        logger.exception(f"HID write failed: {hidEx}")
+    elif isinstance(hidEx, OSError):
+        # HID devices are opened on first use: gadget might be missing
+        logger.exception(f"HID device open failed: {hidEx}")
+    else:
+        logger.exception(f"HID failed: {hidEx}")
+    try:
+        await send_error(websocket, get_hid_error_data(hidEx))
+    except Exception as sendEx:
+        logger.exception(f"Could not send HID error back to client: {sendEx}")
+
+def get_air_mouse(websocket) -> AirMouse:
+    air_mouse = air_mice.get(websocket)
+    if air_mouse is None:
+        async def on_error(ex: Exception) -> None:
+            await send_hid_error(websocket, ex)
+        air_mouse = AirMouse(lambda x, y: hid_backend.mouse.move(x, y), on_error)
+        air_mice[websocket] = air_mouse
+    return air_mouse
+
+def get_key_repeat(websocket, device: str) -> KeyRepeat:
+    repeats = key_repeats.setdefault(websocket, {})
+    key_repeat = repeats.get(device)
+    if key_repeat is None:
+        async def on_error(ex: Exception) -> None:
+            await send_hid_error(websocket, ex)
+        key_repeat = KeyRepeat(device, on_error)
+        repeats[device] = key_repeat
+    return key_repeat
+
+def cancel_key_repeat(device: str) -> None:
+    # Next report replaces repeated one (no release needed): HID devices are shared, so is their repeat (whatever connection started it)
+    for repeats in key_repeats.values():
+        key_repeat = repeats.get(device)
+        if key_repeat:
+            key_repeat.cancel()
+
+def cancel_key_repeats(websocket) -> None:
+    for key_repeat in key_repeats.pop(websocket, {}).values():
+        key_repeat.cancel()
+
+def track_hold(websocket, device: str, held: bool) -> None:
+    if held:
+        hold_watchdog.hold(websocket, device)
+    else:
+        hold_watchdog.unhold(device)
+
+def release_held(websocket, device: str) -> None:
+    # Called by hold watchdog (connection lost or max hold exceeded): otherwise target device sees a stuck key
+    if device == "keyboard":
+        cancel_key_repeat(device)
+        hid_backend.keyboard.press([], [], release=False)
+        keyboard_state["modifiers"] = []
+        keyboard_state["keys"] = []
+    elif device == "consumer":
+        cancel_key_repeat(device)
+        hid_backend.consumer.press([], release=False)
+    elif device == "mouse":
+        hid_backend.mouse.release()
+
+def parse_keypress(payload: bytes) -> tuple[list[int], list[int]] | None:
+    # Format: [mod_count][mods...][key_count][keys...]
+    if len(payload) < 2:
+        return None
+    mod_count = payload[0]
+    key_count_index = 1 + mod_count
+    if len(payload) <= key_count_index:
+        return None
+    mods = list(payload[1:key_count_index])
+    key_count = payload[key_count_index]
+    keys = list(payload[key_count_index + 1:key_count_index + 1 + key_count])
+    return mods, keys
+
+def press_keyboard(mods: list[int], keys: list[int]) -> None:
+    # Directly use raw codes
+    hid_backend.keyboard.press(mods, keys, release=False)
+
+    # Update keyboard state
+    keyboard_state["modifiers"] = mods
+    keyboard_state["keys"] = keys
+    for k in keys:
+        if k == KEY_NUMLOCK:
+            keyboard_state["numlock"] = not keyboard_state["numlock"]
+        elif k == KEY_CAPSLOCK:
+            keyboard_state["capslock"] = not keyboard_state["capslock"]
+        elif k == KEY_SCROLLLOCK:
+            keyboard_state["scrolllock"] = not keyboard_state["scrolllock"]
+
+def parse_conpress(payload: bytes) -> list[int] | None:
+    # Format: [count][con1_lo][con1_hi]...
+    if len(payload) < 1:
+        return None
+    count = payload[0]
+    if len(payload) < 1 + count * 2:
+        return None
+    return list(struct.unpack(f"<{count}H", payload[1:1 + count * 2]))
 
 async def handle_message(websocket, message, id: int | None = None) -> None:
     if isinstance(message, str):
@@ -163,71 +291,123 @@ async def handle_message(websocket, message, id: int | None = None) -> None:
         if logger.getEffectiveLevel() == logging.DEBUG:
             logger.debug("Scroll: x=%d, y=%d", x, y)
         if x:
-            mouse.scroll_x(x)
+            hid_backend.mouse.scroll_x(x)
         if y:
-            mouse.scroll_y(y)
+            hid_backend.mouse.scroll_y(y)
+        hold_watchdog.touch(websocket, "mouse")
 
     elif cmd == 0x02 and len(message) == 3:  # move
         _, x, y = struct.unpack("<Bbb", message)
         if logger.getEffectiveLevel() == logging.DEBUG:
             logger.debug("Move: x=%d, y=%d", x, y)
-        mouse.move(x, y)
+        hid_backend.mouse.move(x, y)
+        hold_watchdog.touch(websocket, "mouse")
+
+    elif cmd == 0x04:  # air-mouse samples batch
+        batch = parse_air_mouse_batch(message)
+        if batch is None:
+            logger.warning("Malformed air-mouse command length: %d", len(message))
+            return # Skip bad message
+
+        speed, dead_zone, samples = batch
+        if logger.getEffectiveLevel() == logging.DEBUG:
+            logger.debug("Air-mouse: speed=%s, dead_zone=%s, samples=%d", speed, dead_zone, len(samples))
+        get_air_mouse(websocket).push(speed, dead_zone, samples)
+        hold_watchdog.touch(websocket, "mouse")
 
     elif cmd in (0x10, 0x11, 0x12):  # clicks
         if cmd == 0x10:
             logger.debug("Click left")
-            mouse.left_click(release=False)
+            hid_backend.mouse.left_click(release=False)
         elif cmd == 0x11:
             logger.debug("Click middle")
-            mouse.middle_click(release=False)
+            hid_backend.mouse.middle_click(release=False)
         elif cmd == 0x12:
             logger.debug("Click right")
-            mouse.right_click(release=False)
+            hid_backend.mouse.right_click(release=False)
+        track_hold(websocket, "mouse", True)
 
     elif cmd == 0x13:
         logger.debug("Click release")
-        mouse.release()
+        hid_backend.mouse.release()
+        track_hold(websocket, "mouse", False)
 
     elif cmd == 0x20 and len(message) >= 2:  # chartap
         length = message[1]
         chars = message[2:2 + length].decode('utf-8', errors='ignore')
         if logger.getEffectiveLevel() == logging.DEBUG:
             logger.debug("Chartap: %s", chars)
-        keyboard.type(chars)
+        cancel_key_repeat("keyboard")
+        hid_backend.keyboard.type(chars)
+        track_hold(websocket, "keyboard", False)  # chars are typed then released
 
     elif cmd == 0x30 and len(message) >= 3:  # keypress
-        mod_count = message[1]
-        mods = list(message[2:2 + mod_count])
-        key_count_index = 2 + mod_count
-        key_count = message[key_count_index]
-        keys = list(message[key_count_index + 1:key_count_index + 1 + key_count])
+        keypress = parse_keypress(message[1:])
+        if keypress is None:
+            logger.warning("Malformed keypress command length: %d", len(message))
+            return # Skip bad message
+
+        mods, keys = keypress
         if logger.getEffectiveLevel() == logging.DEBUG:
             logger.debug("Keypress: modifiers=%s keys=%s", mods, keys)
+        cancel_key_repeat("keyboard")
+        press_keyboard(mods, keys)
+        track_hold(websocket, "keyboard", bool(mods or keys))
+
+    elif cmd == 0x31:  # keypress with server-side repeat
+        header = parse_key_repeat_header(message, config.key_repeat_delay, config.key_repeat_interval)
+        keypress = None if header is None else parse_keypress(header[2])
+        if keypress is None:
+            logger.warning("Malformed keypress repeat command length: %d", len(message))
+            return # Skip bad message
 
-        # Directly use raw codes
-        keyboard.press(mods, keys, release=False)
-
-        # Update keyboard state
-        keyboard_state["modifiers"] = mods
-        keyboard_state["keys"] = keys
-        for k in keys:
-            if k == KeyCodes["KEY_NUMLOCK"]:
-                keyboard_state["numlock"] = not keyboard_state["numlock"]
-            elif k == KeyCodes["KEY_CAPSLOCK"]:
-                keyboard_state["capslock"] = not keyboard_state["capslock"]
-            elif k == KeyCodes["KEY_SCROLLLOCK"]:
-                keyboard_state["scrolllock"] = not keyboard_state["scrolllock"]
+        delay, interval, _ = header
+        mods, keys = keypress
+        if logger.getEffectiveLevel() == logging.DEBUG:
+            logger.debug("Keypress repeat: modifiers=%s keys=%s delay=%d interval=%d", mods, keys, delay, interval)
+        cancel_key_repeat("keyboard")
+        press_keyboard(mods, keys)
+        track_hold(websocket, "keyboard", bool(mods or keys))
+
+        # Repeated until next keyboard report (release or new keys), connection loss or max hold
+        # (repeats do not restart max hold: a lost release frame must not repeat forever)
+        if keys and not any(k in LOCK_KEYS for k in keys):
+            get_key_repeat(websocket, "keyboard").start(
+                lambda: hid_backend.keyboard.press(mods, keys, release=False),
+                lambda: hid_backend.keyboard.press([], [], release=False),
+                delay, interval)
 
     elif cmd == 0x40 and len(message) >= 2:  # conpress
-        count = message[1]
-        expected_length = 2 + count * 2  # 2 header bytes + 2 bytes per item
-        if len(message) < expected_length:
-            logger.warning("Malformed conpress command length: expected %d, got %d", expected_length, len(message))
+        cons = parse_conpress(message[1:])
+        if cons is None:
+            logger.warning("Malformed conpress command length: %d", len(message))
             return # Skip bad message
 
-        cons = list(struct.unpack(f"<{count}H", message[2:2 + count * 2]))
         logger.debug("Conpress: %s", cons)
-        consumer.press(cons, release=False)
+        cancel_key_repeat("consumer")
+        hid_backend.consumer.press(cons, release=False)
+        track_hold(websocket, "consumer", bool(cons))
+
+    elif cmd == 0x41:  # conpress with server-side repeat
+        header = parse_key_repeat_header(message, config.key_repeat_delay, config.key_repeat_interval)
+        cons = None if header is None else parse_conpress(header[2])
+        if cons is None:
+            logger.warning("Malformed conpress repeat command length: %d", len(message))
+            return # Skip bad message
+
+        delay, interval, _ = header
+        if logger.getEffectiveLevel() == logging.DEBUG:
+            logger.debug("Conpress repeat: %s delay=%d interval=%d", cons, delay, interval)
+        cancel_key_repeat("consumer")
+        hid_backend.consumer.press(cons, release=False)
+        track_hold(websocket, "consumer", bool(cons))
+
+        # Repeated until next consumer report (release or new codes), connection loss or max hold
+        if cons:
+            get_key_repeat(websocket, "consumer").start(
+                lambda: hid_backend.consumer.press(cons, release=False),
+                lambda: hid_backend.consumer.press([], release=False),
+                delay, interval)
 
     elif cmd == 0x50:  # sync:keyboard
         logger.debug("Sync keyboard requested")
@@ -241,35 +421,38 @@ async def handle_message(websocket, message, id: int | None = None) -> None:
         await send_response(websocket, response_data, id)
 
     elif cmd == 0x60:  # audio:start
-        logger.debug("Audio start requested")
-        microphone.start_audio()
+        codec = message[1] if len(message) >= 2 else AUDIO_CODEC_PCM # optional codec (PCM for legacy clients)
+        if not is_audio_codec_supported(codec):
+            logger.warning("Unsupported audio codec: 0x%02X", codec)
+            return # Skip bad message
+
+        logger.debug("Audio start requested (codec: %s)", get_audio_codec_name(codec))
+        audio_codecs[websocket] = codec
+        hid_backend.microphone.start_audio()
 
     elif cmd in (0x61, 0x62, 0x63):  # audio:transfert
         if cmd == 0x61 and len(message) >= 2:  # small buffer (from 0 to 255)
             length = message[1] # 1 byte
             buffer = message[2:2 + length]
-            #recorded_chunks.append(buffer)
-            microphone.write_audio(buffer)
+            write_audio(websocket, buffer)
             if logger.getEffectiveLevel() == logging.DEBUG:
                 logger.debug("Audio buffer (small): %s", length)
         elif cmd == 0x62 and len(message) >= 3:  # medium buffer (from 256 to 65535)
             length = struct.unpack_from("<H", message, 1)[0] # 2 bytes
             buffer = message[3:3 + length]
-            #recorded_chunks.append(buffer)
-            microphone.write_audio(buffer)
+            write_audio(websocket, buffer)
             if logger.getEffectiveLevel() == logging.DEBUG:
                 logger.debug("Audio buffer (medium): %s", length)
         elif cmd == 0x63 and len(message) >= 5:  # large buffer (from 65536 to 4294967295)
             length = struct.unpack_from("<I", message, 1)[0] # 4 bytes
             buffer = message[5:5 + length]
-            #recorded_chunks.append(buffer)
-            microphone.write_audio(buffer)
+            write_audio(websocket, buffer)
             if logger.getEffectiveLevel() == logging.DEBUG:
                 logger.debug("Audio buffer (large): %s", length)
 
     elif cmd == 0x70:  # audio:stop
         logger.debug("Audio stop requested")
-        # microphone.stop_audio()
+        # hid_backend.microphone.stop_audio()
         with open("/home/ha_zero_hid/output.wav", "wb") as f:
             f.write(create_wav_file())
 
@@ -321,7 +504,40 @@ async def send_back(websocket, type: str, data, id: int | None = None) -> None:
         logger.debug("Sending %s: %s", type, payload)
     await websocket.send(json.dumps(payload).encode('utf-8'))
 
+def create_ssl_context() -> ssl.SSLContext:
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ssl_context.load_cert_chain(certfile="server.crt", keyfile="server.key")
+    return ssl_context
+
+def reload_config() -> None:
+    global config
+    try:
+        new_config = load_config(SERVER_CONFIG_FILE)
+    except Exception as ex:
+        logger.error(f"Config reload failed, keeping current config: {ex}")
+        return
+
+    # Applied live: authorized IPs, secret (both checked on next handshake), log level, keyboard layout, key repeat defaults, max hold
+    apply_log_level(new_config.log_level)
+    hid_backend.set_layout(new_config.keyboard_layout)
+    hold_watchdog.set_max_hold(new_config.max_hold)
+
+    # Requires a restart: listening port, HID backend
+    if new_config.port != config.port:
+        logger.warning(f"Port change ({config.port} -> {new_config.port}) requires a server restart")
+    if new_config.hid_backend != config.hid_backend:
+        logger.warning(f"HID backend change ({config.hid_backend} -> {new_config.hid_backend}) requires a server restart")
+
+    config = new_config
+    logger.info("Config reloaded")
+
 async def main():
+    global config, hid_backend, hold_watchdog
+    config = load_config(SERVER_CONFIG_FILE)
+    apply_log_level(config.log_level)
+    hid_backend = create_backend(config.hid_backend, config.keyboard_layout)
+    hold_watchdog = HoldWatchdog(release_held, config.max_hold)
+
     stop_event = asyncio.Event()
 
     async def shutdown():
@@ -332,21 +548,25 @@ async def main():
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, lambda: asyncio.create_task(shutdown()))
 
+    # Reload config without dropping active connections
+    loop.add_signal_handler(signal.SIGHUP, reload_config)
+
     # Start the WebSocket server
     server = await websockets.serve(
         handle_client,
         SERVER_HOST,
-        SERVER_PORT,
-        ssl=ssl_context,
+        config.port,
+        ssl=create_ssl_context(),
         process_request=process_request,
     )
-    logger.info(f"WebSocket server started at wss://{SERVER_HOST}:{SERVER_PORT}")
+    logger.info(f"WebSocket server started at wss://{SERVER_HOST}:{config.port}")
 
     await stop_event.wait() # Wait forever until interrupted
     server.close() # Close server whenever interrupted
     await server.wait_closed()  # Wait forever until server closed
+    hid_backend.close()
 
-    logger.info(f"WebSocket server stopped at wss://{SERVER_HOST}:{SERVER_PORT}")
+    logger.info(f"WebSocket server stopped at wss://{SERVER_HOST}:{config.port}")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,4 +4,4 @@
 source /opt/ha_zero_hid/venv/bin/activate
 
 # Run the Python script forever
-exec python3 /opt/ha_zero_hid/websockets_server.py
+exec python3 /opt/ha_zero_hid/websockets_server.py /home/ha_zero_hid/ha_zero_hid.config
@@ -219,12 +219,21 @@ install() {
     websocket_server_port=""
     websocket_server_secret=""
     websocket_authorized_clients_ips=""
+    websocket_server_hid_backend=""
+    websocket_server_keyboard_layout=""
+
+    # Optional config server parameters (server defaults when absent, never prompted)
+    websocket_server_key_repeat_delay=""
+    websocket_server_key_repeat_interval=""
+    websocket_server_max_hold=""
 
     # Config flags
     conf_websocket_server_log_level=false
     conf_websocket_server_port=false
     conf_websocket_server_secret=false
     conf_websocket_authorized_clients_ips=false
+    conf_websocket_server_hid_backend=false
+    conf_websocket_server_keyboard_layout=false
 
     # Automatic setup : try loading config file
     if [ -f "${HA_ZERO_HID_CONFIG_FILE}" ]; then
@@ -272,6 +281,43 @@ install() {
             echo "Key 'websocket_authorized_clients_ips' not found or has no value in ${HA_ZERO_HID_CONFIG_FILE}"
         fi
 
+        # Automatic setup of "websocket_server_hid_backend"
+        websocket_server_hid_backend=$(grep "^websocket_server_hid_backend:" "${HA_ZERO_HID_CONFIG_FILE}" | cut -d':' -f2- ) # Retrieve from file
+        websocket_server_hid_backend=$(echo "$websocket_server_hid_backend" | xargs) # Trims whitespace
+        if [ -n "${websocket_server_hid_backend}" ]; then
+            conf_websocket_server_hid_backend=true
+            echo "Using pre-configured 'websocket_server_hid_backend' value ${websocket_server_hid_backend} from ${HA_ZERO_HID_CONFIG_FILE}"
+        else
+            echo "Key 'websocket_server_hid_backend' not found or has no value in ${HA_ZERO_HID_CONFIG_FILE}"
+        fi
+
+        # Automatic setup of "websocket_server_keyboard_layout"
+        websocket_server_keyboard_layout=$(grep "^websocket_server_keyboard_layout:" "${HA_ZERO_HID_CONFIG_FILE}" | cut -d':' -f2- ) # Retrieve from file
+        websocket_server_keyboard_layout=$(echo "$websocket_server_keyboard_layout" | xargs) # Trims whitespace
+        if [ -n "${websocket_server_keyboard_layout}" ]; then
+            conf_websocket_server_keyboard_layout=true
+            echo "Using pre-configured 'websocket_server_keyboard_layout' value ${websocket_server_keyboard_layout} from ${HA_ZERO_HID_CONFIG_FILE}"
+        else
+            echo "Key 'websocket_server_keyboard_layout' not found or has no value in ${HA_ZERO_HID_CONFIG_FILE}"
+        fi
+
+        # Optional keys: kept as is when present (server defaults otherwise)
+        websocket_server_key_repeat_delay=$(grep "^websocket_server_key_repeat_delay:" "${HA_ZERO_HID_CONFIG_FILE}" | cut -d':' -f2- ) # Retrieve from file
+        websocket_server_key_repeat_delay=$(echo "$websocket_server_key_repeat_delay" | xargs) # Trims whitespace
+        if [ -n "${websocket_server_key_repeat_delay}" ]; then
+            echo "Using pre-configured 'websocket_server_key_repeat_delay' value ${websocket_server_key_repeat_delay} from ${HA_ZERO_HID_CONFIG_FILE}"
+        fi
+        websocket_server_key_repeat_interval=$(grep "^websocket_server_key_repeat_interval:" "${HA_ZERO_HID_CONFIG_FILE}" | cut -d':' -f2- ) # Retrieve from file
+        websocket_server_key_repeat_interval=$(echo "$websocket_server_key_repeat_interval" | xargs) # Trims whitespace
+        if [ -n "${websocket_server_key_repeat_interval}" ]; then
+            echo "Using pre-configured 'websocket_server_key_repeat_interval' value ${websocket_server_key_repeat_interval} from ${HA_ZERO_HID_CONFIG_FILE}"
+        fi
+        websocket_server_max_hold=$(grep "^websocket_server_max_hold:" "${HA_ZERO_HID_CONFIG_FILE}" | cut -d':' -f2- ) # Retrieve from file
+        websocket_server_max_hold=$(echo "$websocket_server_max_hold" | xargs) # Trims whitespace
+        if [ -n "${websocket_server_max_hold}" ]; then
+            echo "Using pre-configured 'websocket_server_max_hold' value ${websocket_server_max_hold} from ${HA_ZERO_HID_CONFIG_FILE}"
+        fi
+
     else
         # Automatic setup : no config file or config file not accessible
         echo "Config file not found: ${HA_ZERO_HID_CONFIG_FILE}"
@@ -329,14 +375,50 @@ install() {
 
     # Manual setup of "websocket_authorized_clients_ips":
     if [ "${conf_websocket_authorized_clients_ips}" != "true" ]; then
-        regex='^([0-9]{1,3}\.){3}[0-9]{1,3}([[:space:]]*,[[:space:]]*([0-9]{1,3}\.){3}[0-9]{1,3})*$'
+        regex='^([0-9]{1,3}\.){3}[0-9]{1,3}(/[0-9]{1,2})?([[:space:]]*,[[:space:]]*([0-9]{1,3}\.){3}[0-9]{1,3}(/[0-9]{1,2})?)*$'
         while true; do
-            read -p "Enter your USB gadget authorized clients IPv4 addresses (ex: 192.168.1.15,..,127.0.0.1): " websocket_authorized_clients_ips </dev/tty
+            read -p "Enter your USB gadget authorized clients IPv4 addresses or networks (ex: 192.168.1.15,..,192.168.2.0/24,127.0.0.1): " websocket_authorized_clients_ips </dev/tty
             websocket_authorized_clients_ips=$(echo "$websocket_authorized_clients_ips" | xargs) # Trims whitespace
             if [[ ${websocket_authorized_clients_ips} =~ ${regex} ]]; then
                 break
             else
-                echo "Please answer a well-formed list of authorized clients IPv4 addresses (ex: 192.168.1.15,..,127.0.0.1 expected)"
+                echo "Please answer a well-formed list of authorized clients IPv4 addresses or networks (ex: 192.168.1.15,..,192.168.2.0/24,127.0.0.1 expected)"
+            fi
+        done
+    fi
+
+    # Manual setup of "websocket_server_hid_backend":
+    if [ "${conf_websocket_server_hid_backend}" != "true" ]; then
+        regex='^(zero_hid|simulated|uinput)$'
+        while true; do
+            read -p "Enter this USB gadget server HID backend (default: zero_hid, available: zero_hid,simulated,uinput): " websocket_server_hid_backend </dev/tty
+            websocket_server_hid_backend=$(echo "$websocket_server_hid_backend" | xargs) # Trims whitespace
+            if [ -z "${websocket_server_hid_backend}" ]; then
+                websocket_server_hid_backend="zero_hid"
+                echo "Using default zero_hid HID backend"
+                break
+            elif [[ ${websocket_server_hid_backend} =~ ${regex} ]]; then
+                break
+            else
+                echo "Please answer one of the following HID backends: zero_hid,simulated,uinput"
+            fi
+        done
+    fi
+
+    # Manual setup of "websocket_server_keyboard_layout":
+    if [ "${conf_websocket_server_keyboard_layout}" != "true" ]; then
+        regex='^[A-Za-z_]+$'
+        while true; do
+            read -p "Enter this USB gadget server keyboard layout (default: FR, example: US): " websocket_server_keyboard_layout </dev/tty
+            websocket_server_keyboard_layout=$(echo "$websocket_server_keyboard_layout" | xargs) # Trims whitespace
+            if [ -z "${websocket_server_keyboard_layout}" ]; then
+                websocket_server_keyboard_layout="FR"
+                echo "Using default FR keyboard layout"
+                break
+            elif [[ ${websocket_server_keyboard_layout} =~ ${regex} ]]; then
+                break
+            else
+                echo "Please answer a well-formed keyboard layout (ex: FR, US expected)"
             fi
         done
     fi
@@ -348,8 +430,35 @@ websocket_server_log_level: ${websocket_server_log_level}
 websocket_server_port: ${websocket_server_port}
 websocket_server_secret: '${websocket_server_secret}'
 websocket_authorized_clients_ips: ${websocket_authorized_clients_ips}
+websocket_server_hid_backend: ${websocket_server_hid_backend}
+websocket_server_keyboard_layout: ${websocket_server_keyboard_layout}
 EOF
 
+    # Optional keys: written back only when pre-configured
+    if [ -n "${websocket_server_key_repeat_delay}" ]; then
+        echo "websocket_server_key_repeat_delay: ${websocket_server_key_repeat_delay}" >> "${HA_ZERO_HID_CONFIG_FILE}"
+    fi
+    if [ -n "${websocket_server_key_repeat_interval}" ]; then
+        echo "websocket_server_key_repeat_interval: ${websocket_server_key_repeat_interval}" >> "${HA_ZERO_HID_CONFIG_FILE}"
+    fi
+    if [ -n "${websocket_server_max_hold}" ]; then
+        echo "websocket_server_max_hold: ${websocket_server_max_hold}" >> "${HA_ZERO_HID_CONFIG_FILE}"
+    fi
+
+    # Config file holds the server secret: only readable by server user
+    echo "Give ${OS_SERVICE_USER} user ownership and read rights to ${HA_ZERO_HID_CONFIG_FILE} config file..."
+    chown "${OS_SERVICE_USER}":"${OS_SERVICE_USER}" "${HA_ZERO_HID_CONFIG_FILE}"
+    chmod 640 "${HA_ZERO_HID_CONFIG_FILE}"
+
+    # Install Python dependency "evdev" when uinput HID backend is used
+    if [ "${websocket_server_hid_backend}" == "uinput" ]; then
+        echo "Installing python evdev dependency (uinput HID backend)..."
+        pip install evdev
+
+        echo "Giving server user ${OS_SERVICE_USER} input rights (uinput HID backend)..."
+        (usermod -aG input "${OS_SERVICE_USER}" >/dev/null 2>&1 || true)
+    fi
+
     # ------------------
     # Templating raw component files
     # ------------------
@@ -359,16 +468,7 @@ EOF
 
     echo "Templating ${HA_ZERO_HID_SERVER_NAME} server log level to ${websocket_server_log_level} into ${HA_ZERO_HID_SERVER_LOG_CONFIG_FILE}..."
     sed -i "s|<websocket_server_log_level>|${websocket_server_log_level}|g" "${HA_ZERO_HID_SERVER_LOG_CONFIG_FILE}"
-    echo "Use this command to setup logger level after installation: sed -i \"s|${websocket_server_log_level}|<new_log_level>|g\" \"${HA_ZERO_HID_SERVER_LOG_CONFIG_FILE}\""
-
-    echo "Templating ${HA_ZERO_HID_SERVER_NAME} server LAN address to 0.0.0.0:${websocket_server_port} into ${HA_ZERO_HID_SERVER_INIT_FILE}..."
-    sed -i "s|<websocket_server_port>|${websocket_server_port}|g" "${HA_ZERO_HID_SERVER_INIT_FILE}"
-
-    echo "Templating ${HA_ZERO_HID_SERVER_NAME} server secret to ${websocket_server_secret} into ${HA_ZERO_HID_SERVER_INIT_FILE}..."
-    sed -i "s|<websocket_server_secret>|${websocket_server_secret}|g" "${HA_ZERO_HID_SERVER_INIT_FILE}"
-
-    echo "Templating ${HA_ZERO_HID_SERVER_NAME} server authorized clients IPs to ${websocket_authorized_clients_ips} into ${HA_ZERO_HID_SERVER_INIT_FILE}..."
-    sed -i "s|<websocket_authorized_clients_ips>|${websocket_authorized_clients_ips}|g" "${HA_ZERO_HID_SERVER_INIT_FILE}"
+    echo "Use this command to apply ${HA_ZERO_HID_CONFIG_FILE} changes (log level, secret, authorized clients IPs, keyboard layout) without restarting: systemctl kill -s HUP ${HA_ZERO_HID_SERVICE_FILE_NAME}"
 
     # Setup OS service user rights on server files
     echo "Give ${OS_SERVICE_USER} user's group ownership and rights to ${HA_ZERO_HID_SERVER_DIR} server directory..."